@@ -11,19 +11,110 @@ import sys
 import os
 import threading
 import statistics
-from typing import List, Tuple, Callable, Dict
+from typing import List, Tuple, Callable, Dict, MutableSequence, Any, Optional
 from concurrent.futures import ThreadPoolExecutor
+from array import array as typed_array
+import copy
+import functools
+import gc
+import heapq
+import bisect
 import random
 import math
+import operator
+import itertools
+
+import dataset_io
+import small_sort
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Global mutex for thread-safe JSON results writing
 results_lock = threading.Lock()
 
+# settle_heap acts on the whole process, so concurrent algorithms take turns run by run
+timing_lock = threading.Lock()
+
+# Containers the benchmark data can be stored in
+CONTAINERS = ['list', 'array', 'numpy']
+
+# How run_sort_multiple prepares the input of each run
+HARNESS_MODES = ['restore', 'prebuilt']
+
+# Elements per NumPy chunk in the output verifier (bounds its temporaries)
+VERIFY_CHUNK_SIZE = 1 << 20
+
+MASK64 = (1 << 64) - 1
+
+# Result file formats: one JSON array at the end, or JSON Lines streamed as runs complete
+OUTPUT_FORMATS = ['json', 'jsonl']
+
+# Per-machine tuning overrides (written by tuning.py)
+TUNING_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tuning.json")
+
+# Algorithms that only compare elements, and so can sort records by key
+COMPARISON_ALGORITHMS = ['bubble_sort', 'selection_sort', 'selection_sort_fast', 'insertion_sort',
+                         'insertion_sort_fast', 'binary_insertion_sort', 'shell_sort', 'shell_sort_tokuda',
+                         'shell_sort_sedgewick', 'quick_sort', 'merge_sort', 'blocked_merge_sort', 'heap_sort',
+                         'tim_sort']
+
+# Comparison algorithms that keep equal keys in input order
+STABLE_ALGORITHMS = ['bubble_sort', 'insertion_sort', 'insertion_sort_fast', 'binary_insertion_sort',
+                     'merge_sort', 'blocked_merge_sort', 'tim_sort']
+
+# Run length below which tim_sort extends runs with insertion sort
+INSERTION_SORT_THRESHOLD = 32
+
+# Subarray length up to which quick_sort and merge_sort finish with a sorting
+# network instead of recursing (at most small_sort.MAX_NETWORK_SIZE)
+SMALL_SORT_CUTOFF = 16
+
+# Elements per tile that blocked_merge_sort sorts in place before merging
+MERGE_TILE_SIZE = 128
+
+# Runs blocked_merge_sort merges at once in each pass over memory
+MERGE_FAN_IN = 8
+
+# Gap sequences shell_sort can use (see shell_gaps)
+SHELL_GAP_SEQUENCES = ['ciura', 'tokuda', 'sedgewick']
+
+# Ciura's empirically found gaps; larger gaps are extended by a factor of 2.25
+CIURA_GAPS = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+
+# Range length below which nth_element finishes with insertion sort
+SELECT_INSERTION_THRESHOLD = 16
+
+# k used by the selection algorithms when --k is not given
+DEFAULT_K = 10
+
+# Cost model used by auto_sort to pick an algorithm from the input profile
+AUTO_SORT_MODEL = {
+    'sample_size': 4096,            # Adjacent pairs inspected by the profiler
+    'min_sorted_streak': 8,         # Sampled streak length that is not explained by noise
+    'presorted_ratio': 0.65,        # Ascending-pair fraction above which tim_sort wins
+    'counting_range_factor': 4.0,   # counting_sort if value range <= factor * n
+    'radix_digit_cost': 3.0,        # Relative cost of one radix pass per element
+    'quick_compare_cost': 1.0,      # Relative cost of one quick_sort level per element
+    'max_quick_run': 256,           # Longest sorted stretch quick_sort's last-element pivot tolerates
+    'duplicate_ratio': 0.5          # Sampled duplicate share above which quick_sort degrades
+}
+
+# Decisions taken by auto_sort in the current thread (see process_algorithm)
+auto_sort_log = threading.local()
+
 
 # --- Sorting algorithms ---
 
-def bubble_sort(array: List[int]) -> None:
+def bubble_sort(array: MutableSequence[int]) -> None:
     """Bubble sort implementation"""
     size = len(array)
     
@@ -43,7 +134,7 @@ def bubble_sort(array: List[int]) -> None:
             break
 
 
-def selection_sort(array: List[int]) -> None:
+def selection_sort(array: MutableSequence[int]) -> None:
     """Selection sort implementation"""
     size = len(array)
     
@@ -60,7 +151,28 @@ def selection_sort(array: List[int]) -> None:
         array[index], array[min_index] = array[min_index], array[index]
 
 
-def insertion_sort(array: List[int]) -> None:
+def selection_sort_fast(array: MutableSequence[int]) -> None:
+    """Selection sort with the minimum scan done by the min builtin over a slice"""
+    size = len(array)
+    
+    if size < 2:
+        return
+    
+    # NumPy slices are views and argmin scans them in C; lists and arrays copy the
+    # tail once and find the first occurrence of the minimum with index()
+    use_argmin = hasattr(array, 'argmin')
+    
+    for index in range(size - 1):
+        if use_argmin:
+            min_index = index + int(array[index:].argmin())
+        else:
+            min_index = array.index(min(array[index:]), index)
+        
+        if min_index != index:
+            array[index], array[min_index] = array[min_index], array[index]
+
+
+def insertion_sort(array: MutableSequence[int]) -> None:
     """Insertion sort implementation"""
     size = len(array)
     
@@ -78,12 +190,102 @@ def insertion_sort(array: List[int]) -> None:
         array[j + 1] = key
 
 
-def quick_sort(array: List[int]) -> None:
+def insertion_sort_fast(array: MutableSequence[int]) -> None:
+    """Insertion sort with bisect for the slot and a single block move for the shift"""
+    size = len(array)
+    
+    if size < 2:
+        return
+    
+    # list and array('i'/'q') shift with one memmove in pop/insert; NumPy has
+    # neither, so the shift is an (overlap-safe) slice assignment
+    block_move = hasattr(array, 'insert')
+    
+    for index in range(1, size):
+        key = array[index]
+        
+        # Already in place: the common case on presorted input costs one comparison
+        if not key < array[index - 1]:
+            continue
+        
+        position = bisect.bisect_right(array, key, 0, index - 1)
+        
+        if block_move:
+            array.insert(position, array.pop(index))
+        else:
+            array[position + 1:index + 1] = array[position:index]
+            array[position] = key
+
+
+def binary_insertion_sort(array: MutableSequence[int]) -> None:
+    """Binary insertion sort: bisect finds each slot, one slice assignment shifts the tail"""
+    size = len(array)
+    
+    if size < 2:
+        return
+    
+    for index in range(1, size):
+        key = array[index]
+        # bisect_right keeps equal keys in input order
+        position = bisect.bisect_right(array, key, 0, index)
+        
+        if position < index:
+            array[position + 1:index + 1] = array[position:index]
+            array[position] = key
+
+
+def shell_gaps(size: int, sequence: str = 'ciura') -> List[int]:
+    """Gaps below size of a shell sort gap sequence, largest first"""
+    gaps = []
+    
+    if sequence == 'ciura':
+        gaps = list(CIURA_GAPS)
+        while gaps[-1] < size:
+            gaps.append(int(gaps[-1] * 2.25))
+    elif sequence == 'tokuda':
+        # ceil((9^k - 4^k) / (5 * 4^(k-1)))
+        k = 1
+        while not gaps or gaps[-1] < size:
+            gaps.append(-(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1))))
+            k += 1
+    elif sequence == 'sedgewick':
+        # 1, then 4^k + 3 * 2^(k-1) + 1
+        gaps = [1]
+        k = 1
+        while gaps[-1] < size:
+            gaps.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+            k += 1
+    else:
+        raise ValueError(f"Unknown gap sequence: {sequence}")
+    
+    return [gap for gap in reversed(gaps) if gap < size] or [1]
+
+
+def shell_sort(array: MutableSequence[int], sequence: str = 'ciura') -> None:
+    """Shell sort implementation (gapped insertion sort, Ciura gaps by default)"""
+    size = len(array)
+    
+    if size < 2:
+        return
+    
+    for gap in shell_gaps(size, sequence):
+        for index in range(gap, size):
+            key = array[index]
+            j = index
+            
+            while j >= gap and array[j - gap] > key:
+                array[j] = array[j - gap]
+                j -= gap
+            
+            array[j] = key
+
+
+def quick_sort(array: MutableSequence[int]) -> None:
     """Quick sort implementation"""
     if len(array) < 2:
         return
     
-    def partition(arr: List[int], low: int, high: int) -> int:
+    def partition(arr: MutableSequence[int], low: int, high: int) -> int:
         pivot = arr[high]
         i = low - 1
         
@@ -95,8 +297,11 @@ def quick_sort(array: List[int]) -> None:
         arr[i + 1], arr[high] = arr[high], arr[i + 1]
         return i + 1
     
-    def quick_sort_recursive(arr: List[int], low: int, high: int) -> None:
-        if low < high:
+    def quick_sort_recursive(arr: MutableSequence[int], low: int, high: int) -> None:
+        if high - low < SMALL_SORT_CUTOFF:
+            if low < high:
+                small_sort.sort_range(arr, low, high + 1)
+        else:
             pi = partition(arr, low, high)
             quick_sort_recursive(arr, low, pi - 1)
             quick_sort_recursive(arr, pi + 1, high)
@@ -104,17 +309,17 @@ def quick_sort(array: List[int]) -> None:
     quick_sort_recursive(array, 0, len(array) - 1)
 
 
-def merge_sort(array: List[int]) -> None:
-    """Merge sort implementation"""
+def merge_sort(array: MutableSequence[int], stable: bool = False) -> None:
+    """Merge sort implementation; stable=True keeps equal elements in order at the leaves too"""
     if len(array) < 2:
         return
     
-    def merge(arr: List[int], left: int, mid: int, right: int) -> None:
+    def merge(arr: MutableSequence[int], left: int, mid: int, right: int) -> None:
         n1 = mid - left + 1
         n2 = right - mid
         
-        L = arr[left:mid + 1]
-        R = arr[mid + 1:right + 1]
+        L = detached_slice(arr, left, mid + 1)
+        R = detached_slice(arr, mid + 1, right + 1)
         
         i = j = 0
         k = left
@@ -138,8 +343,14 @@ def merge_sort(array: List[int]) -> None:
             j += 1
             k += 1
     
-    def merge_sort_recursive(arr: List[int], left: int, right: int) -> None:
-        if left < right:
+    # Networks may reorder equal elements, so stable sorts use insertion sort at the leaves
+    leaf_sort = small_sort.insertion_sort_range if stable else small_sort.sort_range
+    
+    def merge_sort_recursive(arr: MutableSequence[int], left: int, right: int) -> None:
+        if right - left < SMALL_SORT_CUTOFF:
+            if left < right:
+                leaf_sort(arr, left, right + 1)
+        else:
             mid = left + (right - left) // 2
             merge_sort_recursive(arr, left, mid)
             merge_sort_recursive(arr, mid + 1, right)
@@ -148,14 +359,51 @@ def merge_sort(array: List[int]) -> None:
     merge_sort_recursive(array, 0, len(array) - 1)
 
 
-def heap_sort(array: List[int]) -> None:
+def blocked_merge_sort(array: MutableSequence[int], tile_size: Optional[int] = None,
+                       fan_in: Optional[int] = None) -> None:
+    """Merge sort over cache-sized tiles: insertion-sort each tile, then multiway-merge runs"""
+    size = len(array)
+    tile_size = max(2, tile_size or MERGE_TILE_SIZE)
+    fan_in = max(2, fan_in or MERGE_FAN_IN)
+    
+    if size < 2:
+        return
+    
+    def store(start: int, values: List[int]) -> None:
+        # typed arrays only accept arrays in slice assignment
+        if isinstance(array, typed_array):
+            values = typed_array(array.typecode, values)
+        array[start:start + len(values)] = values
+    
+    # Tiles are sorted on detached copies so the shifts stay inside one small block
+    for start in range(0, size, tile_size):
+        tile = detached_slice(array, start, min(start + tile_size, size))
+        insertion_sort_fast(tile)
+        array[start:start + len(tile)] = tile
+    
+    # Each pass merges groups of fan_in runs, so there are log_fan_in(size / tile_size)
+    # passes over memory instead of log2(size / tile_size)
+    run = tile_size
+    while run < size:
+        group = run * fan_in
+        for start in range(0, size, group):
+            stop = min(start + group, size)
+            if start + run >= stop:
+                continue
+            runs = [detached_slice(array, low, min(low + run, stop)) for low in range(start, stop, run)]
+            # heapq.merge takes equal values from the earlier run first, so the sort is stable
+            store(start, list(heapq.merge(*runs)))
+        run = group
+
+
+def heap_sort(array: MutableSequence[int]) -> None:
     """Heap sort implementation"""
     size = len(array)
     
     if size < 2:
         return
     
-    def heapify(arr: List[int], n: int, i: int) -> None:
+    def heapify(arr: MutableSequence[int], n: int, i: int) -> None:
         largest = i
         left = 2 * i + 1
         right = 2 * i + 2
@@ -180,7 +428,7 @@ def heap_sort(array: List[int]) -> None:
         heapify(array, i, 0)
 
 
-def counting_sort(array: List[int]) -> None:
+def counting_sort(array: MutableSequence[int]) -> None:
     """Counting sort implementation"""
     if len(array) < 2:
         return
@@ -201,7 +449,7 @@ def counting_sort(array: List[int]) -> None:
             count[i] -= 1
 
 
-def radix_sort(array: List[int]) -> None:
+def radix_sort(array: MutableSequence[int]) -> None:
     """Radix sort implementation"""
     if len(array) < 2:
         return
@@ -229,7 +477,7 @@ def radix_sort(array: List[int]) -> None:
         exp *= 10
 
 
-def bucket_sort(array: List[int]) -> None:
+def bucket_sort(array: MutableSequence[int]) -> None:
     """Bucket sort implementation"""
     if len(array) < 2:
         return
@@ -242,21 +490,482 @@ def bucket_sort(array: List[int]) -> None:
         bucket_index = min(int((num / (max_value + 1)) * bucket_count), bucket_count - 1)
         buckets[bucket_index].append(num)
     
-    array.clear()
-    
+    # Write back in place so fixed-size containers (array, numpy) work too
+    index = 0
     for bucket in buckets:
-        if len(bucket) < 2:
-            array.extend(bucket)
-        else:
+        if len(bucket) > 1:
             bucket.sort()
-            array.extend(bucket)
+        for num in bucket:
+            array[index] = num
+            index += 1
+
+
+def tim_sort(array: MutableSequence[int]) -> None:
+    """Tim-style hybrid sort: natural runs, extended by insertion sort, merged pairwise"""
+    size = len(array)
+    
+    if size < 2:
+        return
+    
+    def insertion_sort_range(arr: MutableSequence[int], low: int, high: int) -> None:
+        for index in range(low + 1, high):
+            key = arr[index]
+            j = index - 1
+            
+            while j >= low and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            
+            arr[j + 1] = key
+    
+    def merge_runs(arr: MutableSequence[int], low: int, mid: int, high: int) -> None:
+        if arr[mid - 1] <= arr[mid]:
+            return
+        
+        left = detached_slice(arr, low, mid)
+        i, j, k = 0, mid, low
+        n1 = mid - low
+        
+        while i < n1 and j < high:
+            if left[i] <= arr[j]:
+                arr[k] = left[i]
+                i += 1
+            else:
+                arr[k] = arr[j]
+                j += 1
+            k += 1
+        
+        while i < n1:
+            arr[k] = left[i]
+            i += 1
+            k += 1
+    
+    # Split into natural runs, reversing strictly descending ones
+    runs = []
+    start = 0
+    
+    while start < size:
+        end = start + 1
+        
+        if end < size and array[end] < array[start]:
+            while end < size and array[end] < array[end - 1]:
+                end += 1
+            low, high = start, end - 1
+            while low < high:
+                array[low], array[high] = array[high], array[low]
+                low += 1
+                high -= 1
+        else:
+            while end < size and array[end] >= array[end - 1]:
+                end += 1
+        
+        run_end = min(max(end, start + INSERTION_SORT_THRESHOLD), size)
+        if run_end > end:
+            insertion_sort_range(array, start, run_end)
+        
+        runs.append((start, run_end))
+        start = run_end
+    
+    # Merge neighbouring runs until one is left
+    while len(runs) > 1:
+        merged = []
+        
+        for i in range(0, len(runs) - 1, 2):
+            low, mid = runs[i]
+            high = runs[i + 1][1]
+            merge_runs(array, low, mid, high)
+            merged.append((low, high))
+        
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        
+        runs = merged
+
+
+# --- Selection algorithms ---
+
+def top_k(array: MutableSequence[int], k: int = DEFAULT_K) -> None:
+    """Top-k: move the k smallest values, sorted, to the front (heap-based, O(n log k))"""
+    size = len(array)
+    k = min(k, size)
+    
+    if k < 1:
+        return
+    
+    # heapq keeps a bounded heap of the k best indices; ties keep input order
+    chosen = heapq.nsmallest(k, range(size), key=array.__getitem__)
+    values = [array[i] for i in chosen]
+    
+    # Elements of the front that were not chosen take over the chosen slots behind it
+    chosen_set = set(chosen)
+    holes = [i for i in chosen if i >= k]
+    displaced = [array[i] for i in range(k) if i not in chosen_set]
+    for i, value in zip(holes, displaced):
+        array[i] = value
+    
+    for i, value in enumerate(values):
+        array[i] = value
+
+
+def select_range(arr: MutableSequence[int], low: int, high: int, nth: int) -> None:
+    """Introselect on arr[low..high]: put the value of rank nth at arr[nth], smaller before, larger after"""
+    def insertion_sort_range(first: int, last: int) -> None:
+        for index in range(first + 1, last + 1):
+            key = arr[index]
+            j = index - 1
+            
+            while j >= first and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            
+            arr[j + 1] = key
+    
+    def median_of_three(a: int, b: int, c: int) -> int:
+        if arr[a] < arr[b]:
+            if arr[b] < arr[c]:
+                return b
+            return c if arr[a] < arr[c] else a
+        if arr[a] < arr[c]:
+            return a
+        return c if arr[b] < arr[c] else b
+    
+    def median_of_medians(first: int, last: int) -> int:
+        # Median of each group of five is moved to the front, then their median is selected
+        count = 0
+        for start in range(first, last + 1, 5):
+            end = min(start + 4, last)
+            insertion_sort_range(start, end)
+            median = (start + end) // 2
+            arr[first + count], arr[median] = arr[median], arr[first + count]
+            count += 1
+        
+        middle = first + (count - 1) // 2
+        select_range(arr, first, first + count - 1, middle)
+        return middle
+    
+    # Quickselect pivots until the depth budget runs out, then linear-time pivots
+    budget = 2 * (high - low + 1).bit_length()
+    
+    while high - low >= SELECT_INSERTION_THRESHOLD:
+        if budget > 0:
+            budget -= 1
+            pivot_index = median_of_three(low, (low + high) // 2, high)
+        else:
+            pivot_index = median_of_medians(low, high)
+        
+        # Three-way partition, so runs of equal values end the search at once
+        pivot = arr[pivot_index]
+        lt, i, gt = low, low, high
+        while i <= gt:
+            if arr[i] < pivot:
+                arr[lt], arr[i] = arr[i], arr[lt]
+                lt += 1
+                i += 1
+            elif arr[i] > pivot:
+                arr[i], arr[gt] = arr[gt], arr[i]
+                gt -= 1
+            else:
+                i += 1
+        
+        if nth < lt:
+            high = lt - 1
+        elif nth > gt:
+            low = gt + 1
+        else:
+            return
+    
+    insertion_sort_range(low, high)
+
+
+def nth_element(array: MutableSequence[int], k: int = DEFAULT_K) -> None:
+    """Nth element: put the k-th smallest value at index k - 1, smaller ones before it (introselect)"""
+    size = len(array)
+    k = min(k, size)
+    
+    if k < 1 or size < 2:
+        return
+    
+    select_range(array, 0, size - 1, k - 1)
+
+
+def partial_sort(array: MutableSequence[int], k: int = DEFAULT_K) -> None:
+    """Partial sort: select the k smallest values with nth_element, then sort only those"""
+    size = len(array)
+    k = min(k, size)
+    
+    if k < 1:
+        return
+    
+    nth_element(array, k)
+    
+    prefix = detached_slice(array, 0, k)
+    merge_sort(prefix)
+    for i in range(k):
+        array[i] = prefix[i]
+
+
+# --- Auto sort ---
+
+def profile_input(array: MutableSequence[int], sample_size: int = 0) -> Dict[str, float]:
+    """Profile an input: exact value range plus sampled sortedness, runs and duplicates"""
+    size = len(array)
+    min_value = int(min(array))
+    max_value = int(max(array))
+    
+    pairs = min(size - 1, sample_size or AUTO_SORT_MODEL['sample_size'])
+    step = (size - 1) / pairs if pairs > 0 else 1
+    positions = [int(i * step) for i in range(pairs)]
+    
+    # A sorted stretch shows up as consecutive samples that are ascending both
+    # locally (pair) and against the previous sample
+    ascending = 0
+    longest = current = 0
+    previous = None
+    for i in positions:
+        value = array[i]
+        if value <= array[i + 1]:
+            ascending += 1
+            current = current + 1 if previous is None or previous <= value else 1
+            longest = max(longest, current)
+        else:
+            current = 0
+        previous = value
+    
+    sample = [array[i] for i in positions]
+    sorted_pairs = ascending / pairs if pairs > 0 else 1.0
+    if step > 1 and longest < AUTO_SORT_MODEL['min_sorted_streak']:
+        longest = 0
+    
+    return {
+        'size': size,
+        'min': min_value,
+        'max': max_value,
+        'range': max_value - min_value + 1,
+        'sorted_pairs': sorted_pairs,
+        'estimated_runs': max(1, round((1 - sorted_pairs) * (size - 1)) + 1),
+        'longest_run': round(longest * step),
+        'duplicate_ratio': 1 - len(set(sample)) / len(sample) if sample else 0.0
+    }
+
+
+def choose_algorithm(profile: Dict[str, float], model: Dict[str, float] = None) -> str:
+    """Pick the algorithm the cost model expects to be fastest for a profile"""
+    model = model or AUTO_SORT_MODEL
+    size = profile['size']
+    
+    # Counting sort does not care about order, only about the value range
+    if size >= 2 and profile['range'] <= model['counting_range_factor'] * size:
+        return 'counting_sort'
+    
+    if size < 2 or profile['sorted_pairs'] >= model['presorted_ratio']:
+        return 'tim_sort'
+    
+    if profile['min'] >= 0:
+        digits = len(str(profile['max']))
+        if digits * model['radix_digit_cost'] <= math.log2(size) * model['quick_compare_cost']:
+            return 'radix_sort'
+    
+    if (profile['longest_run'] > model['max_quick_run'] or 
+            profile['duplicate_ratio'] >= model['duplicate_ratio']):
+        return 'tim_sort'
+    
+    return 'quick_sort'
+
+
+def auto_sort(array: MutableSequence[int]) -> None:
+    """Auto sort: profile the input and dispatch to the cheapest algorithm"""
+    if len(array) < 2:
+        return
+    
+    start_time = time.perf_counter()
+    profile = profile_input(array)
+    decision = choose_algorithm(profile)
+    profile_time = time.perf_counter() - start_time
+    
+    entries = getattr(auto_sort_log, 'entries', None)
+    if entries is not None:
+        entries.append({'decision': decision, 'profile_time': profile_time, 'profile': profile})
+    
+    ALGORITHMS[decision](array)
+
+
+def load_tuning(file_path: str = TUNING_FILE) -> Dict:
+    """Load per-machine tuning overrides, if any"""
+    try:
+        with open(file_path, 'r') as file:
+            return json.load(file)
+    except (IOError, ValueError):
+        return {}
+
+
+machine_tuning = load_tuning()
+AUTO_SORT_MODEL.update(machine_tuning.get('auto_sort', {}))
+INSERTION_SORT_THRESHOLD = machine_tuning.get('hybrid', {}).get('insertion_threshold',
+                                                                 INSERTION_SORT_THRESHOLD)
+MERGE_TILE_SIZE = machine_tuning.get('hybrid', {}).get('merge_tile_size', MERGE_TILE_SIZE)
+SMALL_SORT_CUTOFF = min(machine_tuning.get('hybrid', {}).get('small_sort_cutoff', SMALL_SORT_CUTOFF),
+                        small_sort.MAX_NETWORK_SIZE)
+
+
+# Available algorithms
+ALGORITHMS = {
+    'bubble_sort': bubble_sort,
+    'selection_sort': selection_sort,
+    'selection_sort_fast': selection_sort_fast,
+    'insertion_sort': insertion_sort,
+    'insertion_sort_fast': insertion_sort_fast,
+    'binary_insertion_sort': binary_insertion_sort,
+    'shell_sort': shell_sort,
+    'shell_sort_tokuda': functools.partial(shell_sort, sequence='tokuda'),
+    'shell_sort_sedgewick': functools.partial(shell_sort, sequence='sedgewick'),
+    'quick_sort': quick_sort,
+    'merge_sort': merge_sort,
+    'blocked_merge_sort': blocked_merge_sort,
+    'heap_sort': heap_sort,
+    'counting_sort': counting_sort,
+    'radix_sort': radix_sort,
+    'bucket_sort': bucket_sort,
+    'tim_sort': tim_sort,
+    'auto_sort': auto_sort
+}
+
+
+# Algorithms that only order the k smallest values (see --k)
+SELECTION_ALGORITHMS = {
+    'top_k': top_k,
+    'nth_element': nth_element,
+    'partial_sort': partial_sort
+}
+
+# Variants that sort() uses when equal keys must keep their order
+STABLE_VARIANTS = {
+    'merge_sort': functools.partial(merge_sort, stable=True)
+}
+
+
+# --- Record sorting ---
+
+class KeyedIndex:
+    """Position of a record, compared by the record's key only"""
+    __slots__ = ('key', 'index')
+    
+    def __init__(self, key: Any, index: int):
+        self.key = key
+        self.index = index
+    
+    def __lt__(self, other: 'KeyedIndex') -> bool:
+        return self.key < other.key
+    
+    def __le__(self, other: 'KeyedIndex') -> bool:
+        return self.key <= other.key
+    
+    def __gt__(self, other: 'KeyedIndex') -> bool:
+        return self.key > other.key
+    
+    def __ge__(self, other: 'KeyedIndex') -> bool:
+        return self.key >= other.key
+    
+    # heapq.merge breaks ties by source only for entries that compare equal
+    def __eq__(self, other: 'KeyedIndex') -> bool:
+        return self.key == other.key
+
+
+class ReversedKeyedIndex(KeyedIndex):
+    """KeyedIndex ordered by descending key, so reverse sorts stay stable"""
+    __slots__ = ()
+    
+    def __lt__(self, other: 'KeyedIndex') -> bool:
+        return self.key > other.key
+    
+    def __le__(self, other: 'KeyedIndex') -> bool:
+        return self.key >= other.key
+    
+    def __gt__(self, other: 'KeyedIndex') -> bool:
+        return self.key < other.key
+    
+    def __ge__(self, other: 'KeyedIndex') -> bool:
+        return self.key <= other.key
+
+
+def sort(records: MutableSequence[Any], key: Optional[Callable[[Any], Any]] = None,
+         reverse: bool = False, stable: bool = True, algorithm: str = 'merge_sort') -> None:
+    """Sort records in place by key with one of the comparison algorithms
+
+    The algorithm permutes lightweight (key, index) entries; each record is
+    moved once at the end. Use a key returning a tuple to sort by several
+    fields. With stable=True only STABLE_ALGORITHMS are accepted.
+    """
+    allowed = STABLE_ALGORITHMS if stable else COMPARISON_ALGORITHMS
+    if algorithm not in allowed:
+        kind = "stable comparison" if stable else "comparison"
+        raise ValueError(f"{algorithm} is not a {kind} algorithm; use one of: {', '.join(allowed)}")
+    
+    if len(records) < 2:
+        return
+    
+    entry = ReversedKeyedIndex if reverse else KeyedIndex
+    if key is None:
+        entries = [entry(record, index) for index, record in enumerate(records)]
+    else:
+        entries = [entry(key(record), index) for index, record in enumerate(records)]
+    
+    sort_function = STABLE_VARIANTS.get(algorithm, ALGORITHMS[algorithm]) if stable else ALGORITHMS[algorithm]
+    sort_function(entries)
+    
+    records[:] = [records[item.index] for item in entries]
+
+
+def make_records(values: MutableSequence[int]) -> List[Tuple[int, int, str]]:
+    """Benchmark records (timestamp, id, payload) whose timestamps are the dataset values"""
+    return [(int(value), index, f"payload-{index}") for index, value in enumerate(values)]
+
+
+def record_key(record: Tuple[int, int, str]) -> int:
+    """Sort key of the benchmark records: the timestamp"""
+    return record[0]
 
 
 # --- Utility functions ---
 
-def read_file(file_path: str) -> List[int]:
-    """Read integers from a file"""
+def detached_slice(array: MutableSequence[int], start: int, stop: int) -> MutableSequence[int]:
+    """Copy of array[start:stop] (numpy and memoryview slices are views, not copies)"""
+    part = array[start:stop]
+    if isinstance(part, (list, typed_array)):
+        return part
+    return list(part)
+
+
+def make_container(values: List[int], container: str = 'list') -> MutableSequence[int]:
+    """Store integers in the requested container: list, array('i'/'q') or numpy"""
+    if container == 'list':
+        return values.tolist() if isinstance(values, typed_array) else list(values)
+    
+    if container == 'array':
+        if isinstance(values, typed_array):
+            return typed_array(values.typecode, values)
+        try:
+            return typed_array('i', values)
+        except OverflowError:
+            return typed_array('q', values)
+    
+    if container == 'numpy':
+        if np is None:
+            raise ImportError("NumPy is required for the numpy container (pip install numpy)")
+        if isinstance(values, typed_array):
+            # Copied straight from the buffer; 'i' maps to int32 and 'q' to int64
+            return np.array(values)
+        fits_int32 = not values or (min(values) >= -2 ** 31 and max(values) < 2 ** 31)
+        return np.array(values, dtype=np.int32 if fits_int32 else np.int64)
+    
+    raise ValueError(f"Unknown container: {container}")
+
+
+def read_file(file_path: str) -> MutableSequence[int]:
+    """Read integers from a text file (as a list) or a binary dataset (as a typed array, see dataset_io.py)"""
     try:
+        if dataset_io.is_binary(file_path):
+            # make_container converts the typed array once, into the requested container
+            return dataset_io.read_binary(file_path)
         with open(file_path, 'r') as file:
             content = file.read().strip()
             if not content:
@@ -268,19 +977,205 @@ def read_file(file_path: str) -> List[int]:
         raise ValueError(f"Invalid data in file: {e}")
 
 
-def run_sort_multiple(algorithm: str, sort_function: Callable[[List[int]], None], 
-                     data: List[int], runs: int = 10) -> Tuple[List[float], str]:
-    """Run a sorting algorithm multiple times and return timing results"""
+def settle_heap() -> None:
+    """Collect garbage, freeze the survivors and disable the collector for the timed region"""
+    gc.collect()
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
+    gc.disable()
+
+
+def release_heap() -> None:
+    """Undo settle_heap once the timed region is over"""
+    gc.enable()
+    if hasattr(gc, 'unfreeze'):
+        gc.unfreeze()
+
+
+# --- Output verification ---
+
+def mix64(value: int) -> int:
+    """SplitMix64 finalizer of an integer taken modulo 2**64"""
+    z = (value + 0x9E3779B97F4A7C15) & MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+def numpy_chunks(array: MutableSequence[int]):
+    """Yield the data as int64 NumPy chunks; arrays are viewed, list slices converted"""
+    if isinstance(array, np.ndarray):
+        base = array
+    elif isinstance(array, typed_array):
+        base = np.frombuffer(array, dtype=f'i{array.itemsize}')
+    else:
+        base = None
+    
+    for start in range(0, len(array), VERIFY_CHUNK_SIZE):
+        if base is not None:
+            yield base[start:start + VERIFY_CHUNK_SIZE].astype(np.int64, copy=False)
+        else:
+            # Raises OverflowError for integers beyond int64
+            yield np.array(array[start:start + VERIFY_CHUNK_SIZE], dtype=np.int64)
+
+
+def scan_numpy(array: MutableSequence[int]) -> Tuple[bool, int]:
+    """Vectorized scan_output"""
+    ordered = True
+    digest = 0
+    previous = None
+    
+    for chunk in numpy_chunks(array):
+        if ordered:
+            ordered = (bool(np.all(chunk[:-1] <= chunk[1:])) and
+                       (previous is None or previous <= chunk[0]))
+        previous = chunk[-1]
+        
+        # mix64 on uint64, whose arithmetic wraps modulo 2**64
+        z = chunk.view(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z ^= z >> np.uint64(31)
+        digest = (digest + int(z.sum(dtype=np.uint64))) & MASK64
+    
+    return ordered, digest
+
+
+def scan_output(array: MutableSequence[int]) -> Tuple[bool, int]:
+    """One linear pass: is the data non-decreasing, and its order-independent multiset hash
+
+    The hash is the sum of mix64 over all elements modulo 2**64, so any
+    permutation of the same values gives the same hash.
+    """
+    if np is not None and len(array) > 0:
+        try:
+            return scan_numpy(array)
+        except OverflowError:
+            pass
+    
+    ordered = all(map(operator.le, array, itertools.islice(array, 1, None)))
+    return ordered, sum(map(mix64, array)) & MASK64
+
+
+def multiset_hash(array: MutableSequence[int]) -> int:
+    """Order-independent hash of the values (see scan_output)"""
+    return scan_output(array)[1]
+
+
+def verify_output(array: MutableSequence[int], length: int, expected_hash: int) -> bool:
+    """Check that a sort produced a sorted permutation of its input"""
+    if len(array) != length:
+        return False
+    ordered, digest = scan_output(array)
+    return ordered and digest == expected_hash
+
+
+def record_hash(records: MutableSequence[Tuple[int, int, str]]) -> int:
+    """Order-independent hash of the (timestamp, id) pairs of benchmark records"""
+    return sum(mix64(mix64(record[0]) ^ record[1]) for record in records) & MASK64
+
+
+def make_verifier(data: MutableSequence[Any], k: int = None,
+                  sorted_prefix: bool = True) -> Callable[[MutableSequence[Any]], bool]:
+    """Build the post-run check of an input: sorted (records: by key) and a permutation of it
+
+    With k, only the k smallest values must lead the output, sorted when
+    sorted_prefix is set, otherwise with the k-th smallest at index k - 1.
+    """
+    length = len(data)
+    
+    if k is not None:
+        expected_hash = multiset_hash(data)
+        
+        def verify_selection(output: MutableSequence[int]) -> bool:
+            if len(output) != length or multiset_hash(output) != expected_hash:
+                return False
+            prefix = detached_slice(output, 0, k)
+            if k < length and max(prefix) > min(output[k:]):
+                return False
+            if sorted_prefix:
+                return scan_output(prefix)[0]
+            return output[k - 1] == max(prefix)
+        
+        return verify_selection
+    
+    if length and isinstance(data[0], tuple):
+        expected_hash = record_hash(data)
+        
+        def verify_records(output: MutableSequence[Any]) -> bool:
+            if len(output) != length:
+                return False
+            keys = [record_key(record) for record in output]
+            return (all(map(operator.le, keys, itertools.islice(keys, 1, None))) and
+                    record_hash(output) == expected_hash)
+        
+        return verify_records
+    
+    expected_hash = multiset_hash(data)
+    return lambda output: verify_output(output, length, expected_hash)
+
+
+def run_sort_multiple(algorithm: str, sort_function: Callable[[MutableSequence[int]], None], 
+                     data: MutableSequence[int], runs: int = 10,
+                     harness: str = 'restore',
+                     on_run: Callable[[int, float, float, bool], None] = None,
+                     verifier: Callable[[MutableSequence[Any]], bool] = None) -> Tuple[List[float], str, List[float], bool]:
+    """Run a sorting algorithm multiple times and return timing and setup results
+
+    Every run's output is verified after the timed region; the last element
+    of the result tells whether all runs produced a sorted permutation.
+    """
     times = []
+    setup_times = []
+    verified = True
+    
+    if verifier is None:
+        verifier = make_verifier(data)
     
-    for _ in range(runs):
-        data_copy = data.copy()
-        start_time = time.perf_counter()
-        sort_function(data_copy)
-        end_time = time.perf_counter()
-        times.append(end_time - start_time)
+    # 'prebuilt' makes every input copy before the first timed run; 'restore'
+    # prepares one copy per run. array and numpy data are restored with one
+    # buffer copy into a working buffer allocated once; for lists a fresh
+    # list.copy() is cheaper, since slice assignment must also release every
+    # element it overwrites.
+    reuse_buffer = not isinstance(data, list)
+    data_copy = copy.copy(data) if reuse_buffer and harness == 'restore' else None
+    prebuilt = []
+    prebuild_time = 0.0
     
-    return times, algorithm
+    if harness == 'prebuilt':
+        with timing_lock:
+            start_time = time.perf_counter()
+            prebuilt = [copy.copy(data) for _ in range(runs)]
+            prebuild_time = (time.perf_counter() - start_time) / runs
+    
+    for run in range(runs):
+        # The whole run holds timing_lock, so no other algorithm's thread
+        # competes for the GIL or the heap while this one is measured
+        with timing_lock:
+            start_time = time.perf_counter()
+            if harness == 'prebuilt':
+                data_copy = prebuilt[run]
+                prebuilt[run] = None
+            elif reuse_buffer:
+                data_copy[:] = data
+            else:
+                data_copy = data.copy()
+            setup_times.append(time.perf_counter() - start_time + prebuild_time)
+            
+            settle_heap()
+            start_time = time.perf_counter()
+            sort_function(data_copy)
+            end_time = time.perf_counter()
+            release_heap()
+            times.append(end_time - start_time)
+            
+            run_verified = verifier(data_copy)
+            verified = verified and run_verified
+        
+        if on_run is not None:
+            on_run(run, times[-1], setup_times[-1], run_verified)
+    
+    return times, algorithm, setup_times, verified
 
 
 def calculate_statistics(times: List[float]) -> Dict[str, float]:
@@ -293,23 +1188,118 @@ def calculate_statistics(times: List[float]) -> Dict[str, float]:
     }
 
 
-def process_algorithm(algorithm: str, sort_function: Callable[[List[int]], None], 
-                     data: List[int], num_runs: int, results: List[Dict]) -> None:
+def process_algorithm(algorithm: str, sort_function: Callable[[MutableSequence[int]], None], 
+                     data: MutableSequence[int], num_runs: int, results: List[Dict],
+                     harness: str = 'restore', on_record: Callable[[Dict], None] = None,
+                     verifier: Callable[[MutableSequence[Any]], bool] = None,
+                     k: int = None) -> None:
     """Process a single algorithm with multiple runs"""
-    times, algo_name = run_sort_multiple(algorithm, sort_function, data, num_runs)
+    def on_run(run: int, elapsed: float, setup_time: float, verified: bool) -> None:
+        on_record({'type': 'run', 'algorithm': algorithm, 'run': run + 1,
+                   'time': elapsed, 'setup_time': setup_time, 'verified': verified})
+    
+    auto_sort_log.entries = []
+    times, algo_name, setup_times, verified = run_sort_multiple(
+        algorithm, sort_function, data, num_runs, harness,
+        on_run if on_record else None, verifier
+    )
     stats = calculate_statistics(times)
     
     result = {
         'algorithm': algo_name,
         'runs': num_runs,
         'times': times,
-        **stats
+        **stats,
+        'setup_time': statistics.mean(setup_times),
+        'verified': verified
     }
+    if k is not None:
+        result['k'] = k
+    
+    if not verified:
+        print(f"Warning: {algo_name} did not produce a sorted permutation of its input",
+              file=sys.stderr)
+    
+    # Record what auto_sort decided and how long profiling took
+    if auto_sort_log.entries:
+        decisions = [entry['decision'] for entry in auto_sort_log.entries]
+        result['decision'] = max(set(decisions), key=decisions.count)
+        result['profile_time'] = statistics.mean(entry['profile_time'] for entry in auto_sort_log.entries)
+        result['profile'] = auto_sort_log.entries[-1]['profile']
+    auto_sort_log.entries = None
+    
+    if on_record:
+        on_record({'type': 'algorithm', **result})
     
     with results_lock:
         results.append(result)
 
 
+def run_benchmark(data: MutableSequence[Any], algorithms: List[str], runs: int,
+                  harness: str = 'restore', on_record: Callable[[Dict], None] = None,
+                  sort_functions: Dict[str, Callable[[MutableSequence[Any]], None]] = None,
+                  k: int = DEFAULT_K) -> List[Dict]:
+    """Run the algorithms in threads and return their results sorted by name
+
+    The threads take turns one run at a time (see timing_lock): setup, the
+    timed sort and verification of a run never overlap another algorithm.
+    """
+    results = []
+    sort_functions = sort_functions or ALGORITHMS
+    
+    # Hash the input once; every run of every algorithm is verified against it
+    verifier = make_verifier(data)
+    
+    with ThreadPoolExecutor(max_workers=len(algorithms)) as executor:
+        futures = []
+        
+        for algorithm in algorithms:
+            if algorithm in SELECTION_ALGORITHMS:
+                selection_k = min(k, len(data))
+                future = executor.submit(
+                    process_algorithm, algorithm,
+                    functools.partial(SELECTION_ALGORITHMS[algorithm], k=selection_k),
+                    data, runs, results, harness, on_record,
+                    make_verifier(data, selection_k, sorted_prefix=algorithm != 'nth_element'),
+                    selection_k
+                )
+                futures.append(future)
+                continue
+            
+            sort_function = sort_functions[algorithm]
+            future = executor.submit(
+                process_algorithm, algorithm, sort_function, data, runs, results,
+                harness, on_record, verifier
+            )
+            futures.append(future)
+        
+        # Wait for all threads to complete
+        for future in futures:
+            future.result()
+    
+    # Sort results by algorithm name for consistent output
+    results.sort(key=lambda x: x['algorithm'])
+    return results
+
+
+def encode_json(value, compact: bool = False) -> str:
+    """Serialize results; compact output uses orjson when it is installed"""
+    if compact:
+        if orjson is not None:
+            return orjson.dumps(value).decode()
+        return json.dumps(value, separators=(',', ':'))
+    # orjson can only indent by two spaces; the results file keeps its 4-space format
+    return json.dumps(value, indent=4)
+
+
+def write_record(stream, record: Dict) -> None:
+    """Append one JSON Lines record and flush it, so readers see progress immediately"""
+    line = encode_json(record, compact=True) + "\n"
+    with results_lock:
+        stream.write(line)
+        stream.flush()
+
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(
@@ -320,14 +1310,46 @@ Examples:
   %(prog)s --file data.txt --algorithms quick_sort,merge_sort
   %(prog)s --file data.txt --algorithms bubble_sort --runs 15
   %(prog)s --file data.txt --algorithms quick_sort,merge_sort,heap_sort --runs 5
+  %(prog)s --file data.txt --algorithms merge_sort --runs 1000 --output-format jsonl
+  %(prog)s --file data.txt --algorithms quick_sort --runs 5000 --output results.json --quiet --compact
+  %(prog)s --shm sorting_dataset --algorithms quick_sort,merge_sort
+  %(prog)s --file data.txt --algorithms merge_sort,tim_sort --records
+  %(prog)s --file data.txt --algorithms top_k,nth_element,partial_sort,quick_sort --k 100
         '''
     )
     
-    parser.add_argument('--file', required=True, help='Input file containing integers')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--file', help='Input file containing integers (text or binary dataset)')
+    source.add_argument('--shm', metavar='NAME',
+                        help='Shared-memory segment or binary dataset file published with '
+                             'dataset_io.py; attached without parsing')
     parser.add_argument('--algorithms', required=True, 
                        help='Comma-separated list of algorithms to run')
     parser.add_argument('--runs', type=int, default=10, 
                        help='Number of runs for each algorithm (default: 10)')
+    parser.add_argument('--container', choices=CONTAINERS, default='list',
+                       help='Container holding the data: list, array or numpy (default: list)')
+    parser.add_argument('--harness', choices=HARNESS_MODES, default='restore',
+                       help='Input preparation: restore one copy per run, or prebuild all '
+                            'copies up front (uses runs x data memory) (default: restore)')
+    parser.add_argument('--output-format', choices=OUTPUT_FORMATS, default='json',
+                       help='json writes one array when all algorithms are done; jsonl streams a '
+                            'record per run and per algorithm plus a final summary (default: json)')
+    parser.add_argument('--output', metavar='PATH',
+                       help='Results file (default: ../../resources/results/results_python.json, '
+                            'or .jsonl with --output-format jsonl)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Do not echo the results to the console')
+    parser.add_argument('--compact', action='store_true',
+                       help='Write the JSON array without indentation')
+    parser.add_argument('--records', action='store_true',
+                       help='Sort (timestamp, id, payload) records by timestamp with sort() '
+                            'instead of bare integers; stable algorithms only')
+    parser.add_argument('--unstable', action='store_true',
+                       help='Allow unstable comparison algorithms with --records')
+    parser.add_argument('--k', type=int, default=DEFAULT_K,
+                       help=f'Number of smallest values top_k, nth_element and partial_sort '
+                            f'select (default: {DEFAULT_K})')
     
     args = parser.parse_args()
     
@@ -336,88 +1358,142 @@ Examples:
         print("Error: Number of runs must be at least 1.", file=sys.stderr)
         return 1
     
-    # Available algorithms
-    algorithms = {
-        'bubble_sort': bubble_sort,
-        'selection_sort': selection_sort,
-        'insertion_sort': insertion_sort,
-        'quick_sort': quick_sort,
-        'merge_sort': merge_sort,
-        'heap_sort': heap_sort,
-        'counting_sort': counting_sort,
-        'radix_sort': radix_sort,
-        'bucket_sort': bucket_sort
-    }
+    if args.k < 1:
+        print("Error: --k must be at least 1.", file=sys.stderr)
+        return 1
     
     # Parse chosen algorithms
     chosen_algorithms = [algo.strip() for algo in args.algorithms.split(',')]
     
     # Validate algorithms
     for algorithm in chosen_algorithms:
-        if algorithm not in algorithms:
+        if algorithm not in ALGORITHMS and algorithm not in SELECTION_ALGORITHMS:
             print(f"Error: Unknown algorithm: {algorithm}", file=sys.stderr)
-            print(f"Available algorithms: {', '.join(algorithms.keys())}", file=sys.stderr)
+            print(f"Available algorithms: {', '.join([*ALGORITHMS, *SELECTION_ALGORITHMS])}",
+                  file=sys.stderr)
+            return 1
+    
+    if args.records:
+        allowed = COMPARISON_ALGORITHMS if args.unstable else STABLE_ALGORITHMS
+        for algorithm in chosen_algorithms:
+            if algorithm not in allowed:
+                print(f"Error: {algorithm} cannot sort records"
+                      f"{'' if args.unstable else ' stably'}", file=sys.stderr)
+                print(f"Record algorithms: {', '.join(allowed)}", file=sys.stderr)
+                return 1
+        if args.container != 'list':
+            print("Error: --records uses the list container.", file=sys.stderr)
             return 1
     
     # Read data
-    try:
-        data = read_file(args.file)
-    except (FileNotFoundError, ValueError) as e:
-        print(f"Error reading file: {e}", file=sys.stderr)
-        return 1
+    if args.shm:
+        try:
+            data = dataset_io.load_shared(args.shm)
+        except (FileNotFoundError, ValueError, OSError) as e:
+            print(f"Error attaching shared dataset {args.shm}: {e}", file=sys.stderr)
+            return 1
+    else:
+        try:
+            data = read_file(args.file)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error reading file: {e}", file=sys.stderr)
+            return 1
     
     if not data:
         print("Error: No data to sort.", file=sys.stderr)
         return 1
     
-    # Run algorithms concurrently
-    results = []
-    
-    with ThreadPoolExecutor(max_workers=len(chosen_algorithms)) as executor:
-        futures = []
-        
-        for algorithm in chosen_algorithms:
-            sort_function = algorithms[algorithm]
-            future = executor.submit(
-                process_algorithm, algorithm, sort_function, data, args.runs, results
-            )
-            futures.append(future)
-        
-        # Wait for all threads to complete
-        for future in futures:
-            future.result()
+    try:
+        data = make_container(data, args.container)
+    except ImportError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
     
-    # Sort results by algorithm name for consistent output
-    results.sort(key=lambda x: x['algorithm'])
+    # Records are sorted through the key-based API, one partial per algorithm
+    container = args.container
+    sort_functions = None
+    if args.records:
+        data = make_records(data)
+        container = 'records'
+        sort_functions = {algorithm: functools.partial(sort, key=record_key, stable=not args.unstable,
+                                                       algorithm=algorithm)
+                          for algorithm in chosen_algorithms}
     
     # Create results directory
-    results_dir = "../../resources/results/"
-    results_file = os.path.join(results_dir, "results_python.json")
+    extension = "jsonl" if args.output_format == 'jsonl' else "json"
+    results_file = args.output or os.path.join("../../resources/results/", f"results_python.{extension}")
+    
+    os.makedirs(os.path.dirname(os.path.abspath(results_file)), exist_ok=True)
+    
+    # In jsonl mode the result file is opened up front and written as runs complete
+    stream = None
+    if args.output_format == 'jsonl':
+        try:
+            stream = open(results_file, 'w')
+        except IOError as e:
+            print(f"Error: Could not create results file at {results_file}: {e}", file=sys.stderr)
+            if args.output:
+                return 1
+            # Fallback to current directory
+            results_file = "results_python.jsonl"
+            try:
+                stream = open(results_file, 'w')
+            except IOError as e2:
+                print(f"Error: Could not write results file: {e2}", file=sys.stderr)
+                return 1
     
-    os.makedirs(results_dir, exist_ok=True)
+    def stream_record(record: Dict) -> None:
+        if record['type'] == 'algorithm':
+            record = {**record, 'container': container}
+        write_record(stream, record)
+    
+    start_time = time.perf_counter()
+    results = run_benchmark(data, chosen_algorithms, args.runs, args.harness,
+                            stream_record if stream else None, sort_functions, args.k)
+    
+    for result in results:
+        result['container'] = container
+    
+    if stream:
+        write_record(stream, {
+            'type': 'summary',
+            'algorithms': [result['algorithm'] for result in results],
+            'runs': args.runs,
+            'elements': len(data),
+            'container': container,
+            'harness': args.harness,
+            'total_time': time.perf_counter() - start_time
+        })
+        stream.close()
+        if not args.quiet:
+            print(f"Sorting completed. Results streamed to {results_file}")
+        return 0
+    
+    # Serialize once for both the file and the console
+    text = encode_json(results, args.compact)
     
     # Write results to file
     try:
         with open(results_file, 'w') as outfile:
-            json.dump(results, outfile, indent=4)
-        
-        # Print results to console
-        print(json.dumps(results, indent=4))
-        print(f"Sorting completed. Results saved to {results_file}")
-        
+            outfile.write(text)
     except IOError as e:
         print(f"Error: Could not create results file at {results_file}: {e}", file=sys.stderr)
+        if args.output:
+            return 1
         # Fallback to current directory
-        fallback_file = "results_python.json"
+        results_file = "results_python.json"
         try:
-            with open(fallback_file, 'w') as outfile:
-                json.dump(results, outfile, indent=4)
-            print(json.dumps(results, indent=4))
-            print(f"Sorting completed. Results saved to {fallback_file}")
+            with open(results_file, 'w') as outfile:
+                outfile.write(text)
         except IOError as e2:
             print(f"Error: Could not write results file: {e2}", file=sys.stderr)
             return 1
     
+    # Print results to console
+    if not args.quiet:
+        print(text)
+        print(f"Sorting completed. Results saved to {results_file}")
+    
     return 0
 
 
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Segmented sorting of ragged batches: many small independent arrays in one call.
+
+A batch is flat values plus offsets (see dataset_io.py); every segment
+values[offsets[i]:offsets[i + 1]] is sorted on its own. Methods:
+  composite  one NumPy sort of the key segment * span + (value - min), which
+             orders by segment, then value; the values are recovered from the
+             sorted keys. Falls back to np.lexsort when the key would not fit
+             in int64
+  pool       contiguous chunks of segments sorted in worker processes (each
+             with the composite method, or the loop without NumPy)
+  loop       one call of an algorithm from ALGORITHMS per segment, the
+             baseline the other methods replace
+"""
+
+import json
+import argparse
+import sys
+import os
+import time
+from array import array as typed_array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, MutableSequence, Sequence, Optional
+
+import dataset_io
+import datagen
+from algorithms import ALGORITHMS, detached_slice
+from sweep import RESULTS_DIR
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+METHODS = ['composite', 'pool', 'loop']
+
+# Chunks per worker process, so uneven chunks still balance across the pool
+POOL_CHUNKS_PER_WORKER = 4
+
+
+def require_numpy() -> None:
+    """Raise ImportError when NumPy is missing"""
+    if np is None:
+        raise ImportError("NumPy is required for the composite method (pip install numpy)")
+
+
+def store(values: MutableSequence[int], result) -> None:
+    """Copy a sorted NumPy result back into the caller's container"""
+    if isinstance(values, typed_array):
+        values[:] = typed_array(values.typecode, result.astype(values.typecode, copy=False).tobytes())
+    elif isinstance(values, list):
+        values[:] = result.tolist()
+    else:
+        values[...] = result
+
+
+# --- Segmented sorts ---
+
+def composite_sort(values, offsets):
+    """Sorted copy of a NumPy batch, segment by segment, from one flat sort"""
+    if len(values) == 0:
+        return values.copy()
+
+    lengths = np.diff(offsets)
+    segments = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+    low = int(values.min())
+    span = int(values.max()) - low + 1
+
+    if len(lengths) * span >= 2 ** 63:
+        return values[np.lexsort((values, segments))]
+
+    keys = segments * span + (values.astype(np.int64) - low)
+    keys.sort()
+    # Sorting keeps every key inside its segment, so the segment ids still line up
+    keys -= segments * span
+    return (keys + low).astype(values.dtype)
+
+
+def loop_sort(values: MutableSequence[int], offsets: Sequence[int], algorithm: str) -> None:
+    """Sort each segment with its own call of an algorithm"""
+    function = ALGORITHMS[algorithm]
+
+    for i in range(len(offsets) - 1):
+        start, stop = offsets[i], offsets[i + 1]
+        if stop - start > 1:
+            segment = detached_slice(values, start, stop)
+            function(segment)
+            values[start:stop] = segment
+
+
+def sort_chunk(values, offsets, algorithm: str):
+    """Sort one chunk of segments in a worker process and return it"""
+    sort_segments(values, offsets, 'composite' if np is not None else 'loop', algorithm)
+    return values
+
+
+def chunk_bounds(offsets: Sequence[int], chunks: int) -> List[int]:
+    """Segment indices splitting the batch into about `chunks` runs of equal element count"""
+    total = offsets[-1]
+    bounds = [0]
+
+    for i in range(1, len(offsets) - 1):
+        if offsets[i] * chunks >= total * len(bounds):
+            bounds.append(i)
+    bounds.append(len(offsets) - 1)
+
+    return bounds
+
+
+def pool_sort(values: MutableSequence[int], offsets: Sequence[int], algorithm: str,
+              workers: Optional[int] = None) -> None:
+    """Sort contiguous chunks of segments across a process pool"""
+    workers = workers or os.cpu_count() or 1
+    bounds = chunk_bounds(offsets, workers * POOL_CHUNKS_PER_WORKER)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for first, last in zip(bounds, bounds[1:]):
+            start, stop = offsets[first], offsets[last]
+            local = [offset - start for offset in offsets[first:last + 1]]
+            futures.append((start, stop, executor.submit(sort_chunk, detached_slice(values, start, stop),
+                                                         local, algorithm)))
+        for start, stop, future in futures:
+            values[start:stop] = future.result()
+
+
+def sort_segments(values: MutableSequence[int], offsets: Sequence[int], method: str = 'composite',
+                  algorithm: str = 'tim_sort', workers: Optional[int] = None) -> None:
+    """Sort every segment of a ragged batch in place
+
+    values may be a list, array('i'/'q') or NumPy array; offsets has one entry
+    per segment plus the element count. algorithm is used by the loop method.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method}")
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    if method == 'composite':
+        require_numpy()
+        store(values, composite_sort(np.asarray(values), np.asarray(offsets, dtype=np.int64)))
+    elif method == 'pool':
+        pool_sort(values, offsets, algorithm, workers)
+    else:
+        loop_sort(values, offsets, algorithm)
+
+
+def verify_segments(original: Sequence[int], result: Sequence[int], offsets: Sequence[int]) -> bool:
+    """Check that every segment of result is the sorted segment of original"""
+    if len(result) != len(original):
+        return False
+
+    # An independent per-segment oracle, so the composite method is not checked against itself
+    if np is not None:
+        original, result = np.asarray(original), np.asarray(result)
+        return all(np.array_equal(np.sort(original[start:stop]), result[start:stop])
+                   for start, stop in zip(offsets, offsets[1:]))
+
+    return all(sorted(original[offsets[i]:offsets[i + 1]]) == list(result[offsets[i]:offsets[i + 1]])
+               for i in range(len(offsets) - 1))
+
+
+# --- Benchmark ---
+
+def run_benchmark(values, offsets, methods: List[str], algorithm: str, runs: int,
+                  workers: Optional[int] = None) -> List[Dict]:
+    """Time each method on copies of one batch; every result is verified"""
+    segments = len(offsets) - 1
+    results = []
+
+    for method in methods:
+        times = []
+        verified = True
+        for _ in range(runs):
+            batch = typed_array(values.typecode, values)
+            start_time = time.perf_counter()
+            sort_segments(batch, offsets, method, algorithm, workers)
+            times.append(time.perf_counter() - start_time)
+            verified = verified and verify_segments(values, batch, offsets)
+
+        best = min(times)
+        results.append({
+            'method': method,
+            'algorithm': algorithm if method != 'composite' else None,
+            'segments': segments,
+            'elements': len(values),
+            'runs': runs,
+            'times': times,
+            'min_time': best,
+            'segments_per_second': segments / best if best > 0 else 0.0,
+            'verified': verified
+        })
+        print(f"{method:<10} {best:10.3f}s {results[-1]['segments_per_second']:>14,.0f} segments/s"
+              f"{'' if verified else '  VERIFICATION FAILED'}", flush=True)
+
+    return results
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Sort many small independent arrays (a ragged batch) in one call',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s sort batch.bin --output sorted.bin
+  %(prog)s sort batch.txt --output sorted.txt --method pool --jobs 8
+  %(prog)s bench --segments 100000 --min-length 5 --max-length 500
+  %(prog)s bench --file batch.bin --methods composite,loop --algorithm quick_sort
+
+Batches are written by datagen.py --segments: one segment per line, or the
+ragged binary format for .bin files.
+        '''
+    )
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    sort_parser = subparsers.add_parser('sort', help='Sort every segment of a ragged batch file')
+    sort_parser.add_argument('input', help='Ragged batch (text or binary)')
+    sort_parser.add_argument('--output', required=True, help='Sorted batch (binary for .bin files)')
+    sort_parser.add_argument('--method', choices=METHODS, default='composite',
+                             help='Segmented sort method (default: composite)')
+    sort_parser.add_argument('--algorithm', default='tim_sort',
+                             help='Algorithm used per segment by the loop method (default: tim_sort)')
+    sort_parser.add_argument('--jobs', type=int, help='Worker processes of the pool method (default: CPU count)')
+
+    bench_parser = subparsers.add_parser('bench', help='Compare the methods against the per-array loop')
+    bench_parser.add_argument('--file', help='Ragged batch to benchmark (default: generate one)')
+    bench_parser.add_argument('--segments', type=int, default=100000,
+                              help='Segments of the generated batch (default: 100000)')
+    bench_parser.add_argument('--min-length', type=int, default=5,
+                              help='Shortest generated segment (default: 5)')
+    bench_parser.add_argument('--max-length', type=int, default=500,
+                              help='Longest generated segment (default: 500)')
+    bench_parser.add_argument('--methods', default=','.join(METHODS),
+                              help=f"Comma-separated methods (default: {','.join(METHODS)})")
+    bench_parser.add_argument('--algorithm', default='tim_sort',
+                              help='Algorithm used per segment by the loop method (default: tim_sort)')
+    bench_parser.add_argument('--runs', type=int, default=3,
+                              help='Runs per method; the fastest is reported (default: 3)')
+    bench_parser.add_argument('--jobs', type=int, help='Worker processes of the pool method (default: CPU count)')
+    bench_parser.add_argument('--output', default=os.path.join(RESULTS_DIR, "batch_sort_python.json"),
+                              help='Results file (default: resources/results/batch_sort_python.json)')
+
+    args = parser.parse_args()
+
+    if args.command not in ('sort', 'bench'):
+        parser.print_help()
+        return 1
+
+    if args.algorithm not in ALGORITHMS:
+        print(f"Error: Unknown algorithm: {args.algorithm}", file=sys.stderr)
+        return 1
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1.", file=sys.stderr)
+        return 1
+
+    if args.command == 'sort':
+        try:
+            values, offsets = dataset_io.load_ragged(args.input)
+            start_time = time.perf_counter()
+            sort_segments(values, offsets, args.method, args.algorithm, args.jobs)
+            elapsed = time.perf_counter() - start_time
+            if args.output.endswith('.bin'):
+                dataset_io.write_ragged(args.output, values, offsets)
+            else:
+                dataset_io.write_ragged_text(args.output, values, offsets)
+        except (IOError, ValueError, ImportError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(f"Sorted {len(offsets) - 1:,} segments ({len(values):,} elements) with {args.method} "
+              f"in {elapsed:.3f}s; written to {args.output}")
+        return 0
+
+    methods = [method.strip() for method in args.methods.split(',') if method.strip()]
+    unknown = [method for method in methods if method not in METHODS]
+    if unknown or not methods:
+        print(f"Error: Unknown methods: {', '.join(unknown)}. Available: {', '.join(METHODS)}",
+              file=sys.stderr)
+        return 1
+    if args.runs < 1:
+        print("Error: --runs must be at least 1.", file=sys.stderr)
+        return 1
+
+    try:
+        if args.file:
+            values, offsets = dataset_io.load_ragged(args.file)
+        else:
+            generated, bounds = datagen.generate_ragged(args.segments, args.min_length, args.max_length,
+                                                        seed=0)
+            values, offsets = typed_array('i', generated.tobytes()), typed_array('q', bounds.tobytes())
+    except (IOError, ValueError, ImportError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Batch: {len(offsets) - 1:,} segments, {len(values):,} elements")
+    results = run_benchmark(values, offsets, methods, args.algorithm, args.runs, args.jobs)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as outfile:
+        json.dump(results, outfile, indent=4)
+    print(f"Results saved to {args.output}")
+
+    return 0 if all(result['verified'] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Benchmark campaigns: a resumable job queue over the language runners.
+
+A campaign spec (JSON) expands into one job per
+(language, algorithm, distribution, perturbation, size). Jobs are run in
+parallel across cores and every finished job is appended to a JSON Lines
+checkpoint, so an interrupted campaign resumes without redoing finished work.
+"""
+
+import json
+import argparse
+import sys
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Set, Callable
+
+from sweep import (RESULTS_DIR, LANGUAGES, DISTRIBUTIONS, max_dataset_size, check_algorithms,
+                   parse_sizes, ensure_creator, ensure_dataset, run_benchmark)
+
+
+# Serializes checkpoint appends from concurrent jobs
+checkpoint_lock = threading.Lock()
+
+
+# --- Campaign spec ---
+
+def is_number(value) -> bool:
+    """True for JSON numbers (bool is an int subclass but not a number here)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def check_list(spec: Dict, field: str, valid: Callable[[object], bool], kind: str) -> None:
+    """Raise ValueError unless spec[field] is a non-empty list of valid items"""
+    value = spec[field]
+    if not isinstance(value, list) or not value or not all(valid(item) for item in value):
+        raise ValueError(f"Campaign spec field '{field}' must be a non-empty list of {kind}")
+
+
+def load_spec(spec_file: str) -> Dict:
+    """Read a campaign spec, check its field types and fill in defaults"""
+    with open(spec_file, 'r') as file:
+        spec = json.load(file)
+
+    if not isinstance(spec, dict):
+        raise ValueError("Campaign spec must be a JSON object")
+    if not spec.get('algorithms'):
+        raise ValueError("Campaign spec needs a non-empty 'algorithms' list")
+
+    spec.setdefault('name', os.path.splitext(os.path.basename(spec_file))[0])
+    spec.setdefault('languages', ['python'])
+    spec.setdefault('distributions', ['uniform'])
+    spec.setdefault('perturbations', [1.0])
+    spec.setdefault('sizes', [10000])
+    spec.setdefault('runs', 5)
+
+    if not isinstance(spec['name'], str) or not spec['name']:
+        raise ValueError("Campaign spec field 'name' must be a non-empty string")
+    for field in ('languages', 'algorithms', 'distributions'):
+        check_list(spec, field, lambda item: isinstance(item, str), "strings")
+    check_list(spec, 'perturbations', is_number, "numbers")
+    if not isinstance(spec['runs'], int) or isinstance(spec['runs'], bool):
+        raise ValueError("Campaign spec field 'runs' must be an integer")
+
+    # Sizes are a range string as in sweep.py, or a list of integers
+    if isinstance(spec['sizes'], str):
+        spec['sizes'] = parse_sizes(spec['sizes'])
+    else:
+        check_list(spec, 'sizes', lambda item: isinstance(item, int) and not isinstance(item, bool),
+                   "integers (or a range string like \"1000:100000:x10\")")
+        spec['sizes'] = sorted(set(spec['sizes']))
+    if not spec['sizes'] or spec['sizes'][0] < 1:
+        raise ValueError("Sizes must be at least 1.")
+
+    for language in spec['languages']:
+        if language not in LANGUAGES:
+            raise ValueError(f"Unknown language: {language}")
+    check_algorithms(spec['languages'], spec['algorithms'])
+    for distribution in spec['distributions']:
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution: {distribution}")
+    if any(not 0.0 <= float(p) <= 1.0 for p in spec['perturbations']):
+        raise ValueError("Perturbation levels must be between 0.0 and 1.0.")
+    max_size = max_dataset_size()
+    if max_size and any(size > max_size for size in spec['sizes']):
+        raise ValueError(f"The creator supports at most {max_size:,} elements "
+                         f"(install NumPy to generate larger datasets).")
+    if spec['runs'] < 1:
+        raise ValueError("Number of runs must be at least 1.")
+
+    return spec
+
+
+def expand_jobs(spec: Dict) -> List[Dict]:
+    """One job per (language, algorithm, distribution, perturbation, size)"""
+    jobs = []
+
+    for language in spec['languages']:
+        for algorithm in spec['algorithms']:
+            for distribution in spec['distributions']:
+                for perturbation in spec['perturbations']:
+                    for size in spec['sizes']:
+                        jobs.append({
+                            'id': f"{language}/{algorithm}/{distribution}/{float(perturbation):.2f}/{size}",
+                            'language': language,
+                            'algorithm': algorithm,
+                            'distribution': distribution,
+                            'perturbation': float(perturbation),
+                            'size': size,
+                            'runs': int(spec['runs'])
+                        })
+
+    return jobs
+
+
+# --- Checkpoint ---
+
+def load_checkpoint(checkpoint_file: str) -> Dict[str, Dict]:
+    """Latest checkpoint record of every job id"""
+    records = {}
+
+    if not os.path.exists(checkpoint_file):
+        return records
+
+    with open(checkpoint_file, 'r') as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A partial last line from an interrupted write
+                continue
+            records[record['id']] = record
+
+    return records
+
+
+def append_checkpoint(checkpoint_file: str, record: Dict) -> None:
+    """Durably append one finished job"""
+    line = json.dumps(record) + "\n"
+    with checkpoint_lock:
+        with open(checkpoint_file, 'a') as file:
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+
+
+# --- Execution ---
+
+def run_job(job: Dict, dataset_path: str) -> Dict:
+    """Run one job and build its checkpoint record"""
+    start_time = time.perf_counter()
+    record = {**job, 'timestamp': time.time()}
+
+    try:
+        results = run_benchmark(job['language'], dataset_path, [job['algorithm']], job['runs'])
+        record['status'] = 'ok'
+        record['result'] = results[0]
+    except (RuntimeError, OSError, ValueError, IndexError) as e:
+        record['status'] = 'failed'
+        record['error'] = str(e)
+
+    record['elapsed'] = time.perf_counter() - start_time
+    return record
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as H:MM:SS"""
+    seconds = int(round(seconds))
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def run_campaign(jobs: List[Dict], checkpoint_file: str, workers: int) -> List[Dict]:
+    """Run pending jobs in parallel, checkpointing each; returns the failed records"""
+    datasets_needed = sorted({(job['size'], job['distribution'], job['perturbation']) for job in jobs})
+    failures = []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Datasets are shared by all languages and algorithms, so create them first
+        ensure_creator()
+        paths = list(executor.map(lambda key: ensure_dataset(*key), datasets_needed))
+        datasets = dict(zip(datasets_needed, paths))
+
+        futures = [executor.submit(run_job, job,
+                                   datasets[(job['size'], job['distribution'], job['perturbation'])])
+                   for job in jobs]
+        start_time = time.perf_counter()
+        recorded = set()
+
+        def finish(future) -> None:
+            record = future.result()
+            append_checkpoint(checkpoint_file, record)
+            recorded.add(future)
+
+            done = len(recorded)
+            elapsed = time.perf_counter() - start_time
+            eta = elapsed / done * (len(jobs) - done)
+            if record['status'] == 'ok':
+                status = f"ok {record['result']['average_time']:.6f}s"
+            else:
+                status = f"FAILED: {record['error']}"
+                failures.append(record)
+            print(f"[{done}/{len(jobs)}] {record['id']} {status} "
+                  f"(elapsed {format_duration(elapsed)}, ETA {format_duration(eta)})", flush=True)
+
+        try:
+            for future in as_completed(futures):
+                finish(future)
+        except KeyboardInterrupt:
+            # Queued jobs are dropped; running ones finish anyway, so checkpoint them too
+            executor.shutdown(wait=False, cancel_futures=True)
+            running = [future for future in futures if future not in recorded and not future.cancelled()]
+            if running:
+                print(f"\nInterrupted. Waiting for {len(running)} running jobs to checkpoint them...",
+                      file=sys.stderr, flush=True)
+            for future in as_completed(running):
+                finish(future)
+            raise
+
+    return failures
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Run a resumable benchmark campaign from a spec file',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Spec file (JSON):
+  {"name": "overnight", "languages": ["python", "cpp"],
+   "algorithms": ["quick_sort", "merge_sort"], "sizes": "1000:100000:x10",
+   "distributions": ["uniform", "normal"], "perturbations": [0.0, 0.5, 1.0], "runs": 5}
+
+Examples:
+  %(prog)s overnight.json
+  %(prog)s overnight.json --jobs 4
+  %(prog)s overnight.json --status
+        '''
+    )
+
+    parser.add_argument('spec', help='Campaign spec file (JSON)')
+    parser.add_argument('--checkpoint',
+                        help='Checkpoint file (default: resources/results/campaign_<name>.jsonl)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of jobs run in parallel (default: CPU count)')
+    parser.add_argument('--skip-failed', action='store_true',
+                        help='Do not retry jobs that failed in a previous session')
+    parser.add_argument('--status', action='store_true',
+                        help='Only report the progress recorded in the checkpoint')
+
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1.", file=sys.stderr)
+        return 1
+
+    try:
+        spec = load_spec(args.spec)
+    except (IOError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    checkpoint_file = args.checkpoint or os.path.join(RESULTS_DIR, f"campaign_{spec['name']}.jsonl")
+    os.makedirs(os.path.dirname(os.path.abspath(checkpoint_file)), exist_ok=True)
+
+    jobs = expand_jobs(spec)
+    records = load_checkpoint(checkpoint_file)
+    finished: Set[str] = {job_id for job_id, record in records.items()
+                          if record['status'] == 'ok' or args.skip_failed}
+    pending = [job for job in jobs if job['id'] not in finished]
+    failed_before = sum(1 for job in jobs if records.get(job['id'], {}).get('status') == 'failed')
+
+    print(f"Campaign '{spec['name']}': {len(jobs)} jobs, {len(jobs) - len(pending)} finished, "
+          f"{len(pending)} pending ({failed_before} previously failed)")
+    print(f"Checkpoint: {checkpoint_file}")
+
+    if args.status or not pending:
+        return 0
+
+    try:
+        failures = run_campaign(pending, checkpoint_file, args.jobs)
+    except KeyboardInterrupt:
+        print("\nInterrupted. Finished jobs are checkpointed; rerun the same command to resume.",
+              file=sys.stderr)
+        return 130
+    except (RuntimeError, ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Campaign completed: {len(pending) - len(failures)} succeeded, {len(failures)} failed.")
+    for record in failures:
+        print(f"  FAILED {record['id']}: {record['error']}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
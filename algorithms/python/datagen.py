@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Vectorized dataset generator, an in-process alternative to resources/sets/creator.
+
+Reproduces the distributions of creator.cpp with NumPy:
+  uniform      u1
+  normal       Box-Muller with mean 0.5 and stddev 0.2, one (u1, u2) pair per
+               two elements; like creator.cpp, the cached second value is
+               scaled by the stddev twice
+  exponential  1 - exp(log(1 - u1) / 2) = 1 - (1 - u1) ** 0.5
+  beta         x / (x + y) with x = u1 ** (1/2), y = u2 ** (1/5)
+Values are clamped to [0, 1] and mapped to int(v * (size - 1)) + 1.
+
+Perturbation sorts the first int(size * (1 - level)) elements, so 0.5 leaves
+the second half random and 1.0 is fully random. Like creator.cpp, the sort is
+skipped at exactly 0.0, which is therefore random as well: a sweep that
+switches from the creator to datagen above CREATOR_MAX_SIZE must not change
+its input.
+
+Generation runs in fixed-size chunks, so the output for a given seed does not
+depend on where it is written, and large datasets go straight into a
+memory-mapped binary file without holding the floating-point temporaries.
+
+Ragged mode generates a batch of independent arrays (see dataset_io.py) with
+lengths drawn uniformly from [min_length, max_length]. Values are drawn for the
+whole batch and mapped to [1, total elements]; perturbation applies to each
+segment on its own.
+"""
+
+import argparse
+import sys
+import os
+import time
+from typing import Optional
+
+import dataset_io
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+DISTRIBUTIONS = ['uniform', 'normal', 'exponential', 'beta']
+
+OUTPUT_FORMATS = ['text', 'binary']
+
+# Elements generated per chunk; part of the seeded stream, so changing it changes the data
+CHUNK_SIZE = 1 << 22
+
+NORMAL_MEAN = 0.5
+NORMAL_STDDEV = 0.2
+EXPONENTIAL_LAMBDA = 2.0
+BETA_ALPHA = 2.0
+BETA_BETA = 5.0
+
+
+def require_numpy() -> None:
+    """Raise ImportError when NumPy is missing"""
+    if np is None:
+        raise ImportError("NumPy is required for datagen (pip install numpy)")
+
+
+def validate(size: int, distribution: str, perturbation: float) -> None:
+    """Check generation parameters"""
+    if size < 1:
+        raise ValueError("Array size must be at least 1")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution type: {distribution}")
+    if not 0.0 <= perturbation <= 1.0:
+        raise ValueError("Perturbation level must be between 0.0 and 1.0")
+
+
+def transform(rng, count: int, distribution: str):
+    """Draw count values in [0, 1] (before clamping) from the distribution"""
+    if distribution == 'uniform':
+        return rng.random(count)
+
+    if distribution == 'normal':
+        pairs = (count + 1) // 2
+        u1, u2 = rng.random(pairs), rng.random(pairs)
+        with np.errstate(divide='ignore'):
+            magnitude = NORMAL_STDDEV * np.sqrt(-2.0 * np.log(u1))
+        angle = 2.0 * np.pi * u2
+        values = np.empty(pairs * 2)
+        values[0::2] = magnitude * np.sin(angle) + NORMAL_MEAN
+        values[1::2] = magnitude * np.cos(angle) * NORMAL_STDDEV + NORMAL_MEAN
+        return values[:count]
+
+    if distribution == 'exponential':
+        return 1.0 - np.power(1.0 - rng.random(count), 1.0 / EXPONENTIAL_LAMBDA)
+
+    if distribution == 'beta':
+        x = np.power(rng.random(count), 1.0 / BETA_ALPHA)
+        y = np.power(rng.random(count), 1.0 / BETA_BETA)
+        with np.errstate(invalid='ignore'):
+            return x / (x + y)
+
+    raise ValueError(f"Unknown distribution type: {distribution}")
+
+
+def fill(out, distribution: str, perturbation: float, seed: Optional[int] = None) -> None:
+    """Generate len(out) values into an int32 array (in memory or memory-mapped)"""
+    size = len(out)
+    validate(size, distribution, perturbation)
+    rng = np.random.default_rng(seed)
+
+    for start in range(0, size, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, size)
+        with np.errstate(invalid='ignore'):
+            values = transform(rng, stop - start, distribution)
+        # Zero draws can give log(0) or 0 / 0; creator.cpp clamps the infinities too
+        values = np.clip(np.nan_to_num(values, nan=0.0), 0.0, 1.0)
+        if size <= 1:
+            out[start:stop] = 1
+        else:
+            out[start:stop] = (values * (size - 1)).astype(np.int64) + 1
+
+    # creator.cpp only sorts for perturbation > 0.0
+    sorted_elements = int(size * (1.0 - perturbation)) if perturbation > 0.0 else 0
+    if sorted_elements > 1:
+        out[:sorted_elements].sort()
+
+
+def generate(size: int, distribution: str = 'uniform', perturbation: float = 1.0,
+             seed: Optional[int] = None):
+    """Generate a dataset in memory as an int32 NumPy array"""
+    require_numpy()
+    validate(size, distribution, perturbation)
+    out = np.empty(size, dtype=np.int32)
+    fill(out, distribution, perturbation, seed)
+    return out
+
+
+def generate_binary(file_path: str, size: int, distribution: str = 'uniform',
+                    perturbation: float = 1.0, seed: Optional[int] = None) -> None:
+    """Generate a dataset straight into a binary dataset file (see dataset_io.py)"""
+    require_numpy()
+    validate(size, distribution, perturbation)
+
+    with open(file_path, 'wb') as file:
+        file.write(dataset_io.HEADER.pack(dataset_io.MAGIC, size, b'i'))
+        file.truncate(dataset_io.HEADER.size + size * 4)
+
+    out = np.memmap(file_path, dtype='<i4', mode='r+', offset=dataset_io.HEADER.size, shape=(size,))
+    try:
+        fill(out, distribution, perturbation, seed)
+        out.flush()
+    finally:
+        del out
+
+
+def write_binary(file_path: str, values) -> None:
+    """Write an in-memory dataset in the binary format"""
+    with open(file_path, 'wb') as file:
+        file.write(dataset_io.HEADER.pack(dataset_io.MAGIC, len(values), b'i'))
+        file.write(values.astype('<i4', copy=False).tobytes())
+
+
+def write_text(file_path: str, values) -> None:
+    """Write one value per line, like creator.cpp"""
+    with open(file_path, 'w') as file:
+        for start in range(0, len(values), CHUNK_SIZE):
+            file.write('\n'.join(map(str, values[start:start + CHUNK_SIZE].tolist())))
+            file.write('\n')
+
+
+def validate_ragged(segments: int, min_length: int, max_length: int, distribution: str,
+                    perturbation: float) -> None:
+    """Check ragged generation parameters"""
+    if segments < 1:
+        raise ValueError("Segment count must be at least 1")
+    if not 1 <= min_length <= max_length:
+        raise ValueError("Segment lengths must satisfy 1 <= min_length <= max_length")
+    validate(1, distribution, perturbation)
+
+
+def generate_ragged(segments: int, min_length: int, max_length: int, distribution: str = 'uniform',
+                    perturbation: float = 1.0, seed: Optional[int] = None):
+    """Generate a ragged batch as (int32 values, int64 offsets) NumPy arrays"""
+    require_numpy()
+    validate_ragged(segments, min_length, max_length, distribution, perturbation)
+    length_seed, value_seed = np.random.SeedSequence(seed).spawn(2)
+
+    lengths = np.random.default_rng(length_seed).integers(min_length, max_length + 1, segments)
+    offsets = np.zeros(segments + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    values = np.empty(int(offsets[-1]), dtype=np.int32)
+    fill(values, distribution, 1.0, value_seed)
+
+    # Sort the first int(length * (1 - perturbation)) elements of every segment
+    if 0.0 < perturbation < 1.0:
+        prefix = (lengths * (1.0 - perturbation)).astype(np.int64)
+        position = np.arange(len(values)) - np.repeat(offsets[:-1], lengths)
+        mask = position < np.repeat(prefix, lengths)
+        segment = np.repeat(np.arange(segments), lengths)[mask]
+        part = values[mask]
+        values[mask] = part[np.lexsort((part, segment))]
+
+    return values, offsets
+
+
+def write_ragged_binary(file_path: str, values, offsets) -> None:
+    """Write an in-memory ragged batch in the binary format"""
+    with open(file_path, 'wb') as file:
+        file.write(dataset_io.RAGGED_HEADER.pack(dataset_io.RAGGED_MAGIC, len(offsets) - 1, len(values), b'i'))
+        file.write(offsets.astype('<i8', copy=False).tobytes())
+        file.write(values.astype('<i4', copy=False).tobytes())
+
+
+def generate_file(file_path: str, size: int, distribution: str = 'uniform',
+                  perturbation: float = 1.0, seed: Optional[int] = None,
+                  output_format: str = 'text') -> None:
+    """Generate a dataset file in the text or binary format"""
+    if output_format == 'binary':
+        generate_binary(file_path, size, distribution, perturbation, seed)
+    else:
+        write_text(file_path, generate(size, distribution, perturbation, seed))
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Generate datasets with the distributions of creator.cpp, without a compiler',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s --size 1000 --distribution uniform --perturbation 1.0 --output data.txt
+  %(prog)s --size 5000 --distribution normal --perturbation 0.2 --output test_data.txt --seed 42
+  %(prog)s --size 100000000 --distribution beta --output big.bin
+  %(prog)s --segments 1000000 --min-length 5 --max-length 500 --output batch.bin
+
+Perturbation: 0.5 = first half sorted, 1.0 = fully random; as with the
+creator, 0.0 skips the sort and is fully random too.
+Values are in the range [1, size]. Files ending in .bin are written in the
+binary dataset format (see dataset_io.py) unless --format is given.
+With --segments, a ragged batch is written instead: one segment per line, or
+the ragged binary format for .bin files.
+        '''
+    )
+
+    parser.add_argument('--size', type=int, help='Number of elements')
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='uniform',
+                        help='Value distribution (default: uniform)')
+    parser.add_argument('--perturbation', type=float, default=1.0,
+                        help='Unsorted fraction, 0.0 to 1.0 (default: 1.0)')
+    parser.add_argument('--output', required=True, help='Output file')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS,
+                        help='Output format (default: binary for .bin files, text otherwise)')
+    parser.add_argument('--seed', type=int, help='Random seed for a reproducible dataset')
+    parser.add_argument('--segments', type=int,
+                        help='Generate a ragged batch of this many independent arrays instead')
+    parser.add_argument('--min-length', type=int, default=5,
+                        help='Shortest segment of a ragged batch (default: 5)')
+    parser.add_argument('--max-length', type=int, default=500,
+                        help='Longest segment of a ragged batch (default: 500)')
+
+    args = parser.parse_args()
+
+    if (args.size is None) == (args.segments is None):
+        print("Error: Give either --size or --segments.", file=sys.stderr)
+        return 1
+
+    output_format = args.format or ('binary' if args.output.endswith('.bin') else 'text')
+
+    start_time = time.perf_counter()
+    try:
+        if args.segments is not None:
+            values, offsets = generate_ragged(args.segments, args.min_length, args.max_length,
+                                              args.distribution, args.perturbation, args.seed)
+            if output_format == 'binary':
+                write_ragged_binary(args.output, values, offsets)
+            else:
+                dataset_io.write_ragged_text(args.output, values, offsets)
+            args.size = len(values)
+        else:
+            generate_file(args.output, args.size, args.distribution, args.perturbation,
+                          args.seed, output_format)
+    except (ImportError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except IOError as e:
+        print(f"Error: Could not save data to file: {args.output}: {e}", file=sys.stderr)
+        return 1
+
+    print("Data set created successfully!")
+    if args.segments is not None:
+        print(f"Segments: {args.segments:,} ({args.min_length} to {args.max_length} elements)")
+    print(f"Size: {args.size:,} elements")
+    print(f"Distribution: {args.distribution}")
+    print(f"Perturbation level: {args.perturbation:.2f}")
+    print(f"Output file: {os.path.abspath(args.output)} ({output_format})")
+    print(f"Time: {time.perf_counter() - start_time:.2f}s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Binary dataset format and shared-memory handoff between processes.
+
+A binary dataset is a 24-byte header (magic, element count, typecode)
+followed by the values as little-endian int32 ('i') or int64 ('q'). The same
+layout is used for files, which readers memory-map, and for named
+shared-memory segments, so a dataset parsed or generated once can be handed
+to any number of runner processes without re-parsing text.
+
+A ragged dataset holds many independent arrays (segments) as one flat value
+array plus offsets: segment i is values[offsets[i]:offsets[i + 1]]. Its binary
+form is a 32-byte header, the offsets as int64 and then the values; its text
+form has one segment per line.
+"""
+
+import argparse
+import sys
+import os
+import mmap
+import signal
+import struct
+from array import array as typed_array
+from multiprocessing import shared_memory, resource_tracker
+from typing import Sequence, Tuple
+
+
+MAGIC = b'SORTDAT1'
+
+# magic, element count, typecode, padding (keeps the values 8-byte aligned)
+HEADER = struct.Struct('<8sQ1s7x')
+
+TYPECODES = {'i': 4, 'q': 8}
+
+RAGGED_MAGIC = b'SORTRAG1'
+
+# magic, segment count, element count, value typecode, padding
+RAGGED_HEADER = struct.Struct('<8sQQ1s7x')
+
+
+def to_typed_array(values: Sequence[int]) -> typed_array:
+    """Pack integers as int32 when they fit, int64 otherwise"""
+    if isinstance(values, typed_array) and values.typecode in TYPECODES:
+        return values
+    try:
+        return typed_array('i', values)
+    except OverflowError:
+        return typed_array('q', values)
+
+
+def encode(values: Sequence[int]) -> bytes:
+    """Header and little-endian payload of a binary dataset"""
+    packed = to_typed_array(values)
+    if sys.byteorder == 'big':
+        packed = typed_array(packed.typecode, packed)
+        packed.byteswap()
+    return HEADER.pack(MAGIC, len(packed), packed.typecode.encode()) + packed.tobytes()
+
+
+def decode(buffer) -> typed_array:
+    """Copy the values out of a binary dataset buffer (file mapping or shared memory)"""
+    if len(buffer) < HEADER.size:
+        raise ValueError("Binary dataset is truncated")
+
+    magic, count, typecode = HEADER.unpack_from(buffer)
+    typecode = typecode.decode()
+    if magic != MAGIC or typecode not in TYPECODES:
+        raise ValueError("Not a binary dataset")
+
+    end = HEADER.size + count * TYPECODES[typecode]
+    if len(buffer) < end:
+        raise ValueError("Binary dataset is truncated")
+
+    values = typed_array(typecode)
+    values.frombytes(buffer[HEADER.size:end])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def is_binary(file_path: str) -> bool:
+    """Check the magic number of a file"""
+    with open(file_path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def write_binary(file_path: str, values: Sequence[int]) -> None:
+    """Write values as a binary dataset file"""
+    with open(file_path, 'wb') as file:
+        file.write(encode(values))
+
+
+def read_binary(file_path: str) -> typed_array:
+    """Read a binary dataset file through a read-only memory map"""
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            with memoryview(mapping) as view:
+                return decode(view)
+
+
+def publish(values: Sequence[int], name: str = None) -> shared_memory.SharedMemory:
+    """Copy values into a new shared-memory segment; the caller closes and unlinks it"""
+    payload = encode(values)
+    segment = shared_memory.SharedMemory(name=name, create=True, size=len(payload))
+    segment.buf[:len(payload)] = payload
+    return segment
+
+
+def attach(name: str) -> typed_array:
+    """Copy the values out of a shared-memory segment published by another process"""
+    try:
+        segment = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the segment with this process's
+        # resource tracker, which would unlink it when this process exits
+        segment = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(segment._name, 'shared_memory')
+
+    try:
+        with segment.buf[:] as view:
+            return decode(view)
+    finally:
+        segment.close()
+
+
+def load_shared(name: str) -> typed_array:
+    """Load a dataset from a binary file path or a shared-memory segment name"""
+    if os.path.exists(name):
+        return read_binary(name)
+    return attach(name)
+
+
+def read_text(file_path: str) -> typed_array:
+    """Parse a whitespace-separated text dataset (as written by the creator)"""
+    with open(file_path, 'r') as file:
+        return to_typed_array([int(x) for x in file.read().split()])
+
+
+# --- Ragged datasets ---
+
+def check_offsets(offsets: Sequence[int], total: int) -> None:
+    """Raise ValueError unless offsets start at 0, never decrease and end at total"""
+    if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != total:
+        raise ValueError(f"Offsets must start at 0 and end at the element count ({total})")
+    if any(offsets[i] > offsets[i + 1] for i in range(len(offsets) - 1)):
+        raise ValueError("Offsets must be non-decreasing")
+
+
+def write_ragged(file_path: str, values: Sequence[int], offsets: Sequence[int]) -> None:
+    """Write a ragged dataset file"""
+    packed = to_typed_array(values)
+    bounds = typed_array('q', offsets)
+    check_offsets(bounds, len(packed))
+
+    if sys.byteorder == 'big':
+        packed = typed_array(packed.typecode, packed)
+        packed.byteswap()
+        bounds.byteswap()
+
+    with open(file_path, 'wb') as file:
+        file.write(RAGGED_HEADER.pack(RAGGED_MAGIC, len(bounds) - 1, len(packed), packed.typecode.encode()))
+        file.write(bounds.tobytes())
+        file.write(packed.tobytes())
+
+
+def read_ragged(file_path: str) -> Tuple[typed_array, typed_array]:
+    """Read the values and offsets of a ragged dataset file through a memory map"""
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            if len(mapping) < RAGGED_HEADER.size:
+                raise ValueError("Ragged dataset is truncated")
+
+            magic, segments, count, typecode = RAGGED_HEADER.unpack_from(mapping)
+            typecode = typecode.decode()
+            if magic != RAGGED_MAGIC or typecode not in TYPECODES:
+                raise ValueError(f"Not a ragged dataset: {file_path}")
+
+            start = RAGGED_HEADER.size + (segments + 1) * 8
+            end = start + count * TYPECODES[typecode]
+            if len(mapping) < end:
+                raise ValueError("Ragged dataset is truncated")
+
+            offsets = typed_array('q')
+            offsets.frombytes(mapping[RAGGED_HEADER.size:start])
+            values = typed_array(typecode)
+            values.frombytes(mapping[start:end])
+
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+        values.byteswap()
+    return values, offsets
+
+
+def is_ragged(file_path: str) -> bool:
+    """Check the magic number of a file"""
+    with open(file_path, 'rb') as file:
+        return file.read(len(RAGGED_MAGIC)) == RAGGED_MAGIC
+
+
+def read_ragged_text(file_path: str) -> Tuple[typed_array, typed_array]:
+    """Parse a text ragged dataset: one whitespace-separated segment per line"""
+    values = []
+    offsets = typed_array('q', [0])
+
+    with open(file_path, 'r') as file:
+        for line in file:
+            values.extend(int(x) for x in line.split())
+            offsets.append(len(values))
+
+    return to_typed_array(values), offsets
+
+
+def write_ragged_text(file_path: str, values: Sequence[int], offsets: Sequence[int]) -> None:
+    """Write one segment per line"""
+    with open(file_path, 'w') as file:
+        for i in range(len(offsets) - 1):
+            segment = values[offsets[i]:offsets[i + 1]]
+            file.write(' '.join(map(str, segment.tolist() if hasattr(segment, 'tolist') else segment)))
+            file.write('\n')
+
+
+def load_ragged(file_path: str) -> Tuple[typed_array, typed_array]:
+    """Read a ragged dataset in the binary or text format"""
+    if is_ragged(file_path):
+        return read_ragged(file_path)
+    return read_ragged_text(file_path)
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Convert datasets to the binary format and publish them in shared memory',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s convert ../../resources/sets/dataset.txt ../../resources/sets/dataset.bin
+  %(prog)s publish ../../resources/sets/dataset.txt --name sorting_dataset
+  python3 algorithms.py --shm sorting_dataset --algorithms quick_sort
+        '''
+    )
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    convert_parser = subparsers.add_parser('convert', help='Convert a text dataset to a binary file')
+    convert_parser.add_argument('input', help='Text dataset')
+    convert_parser.add_argument('output', help='Binary dataset to write')
+
+    publish_parser = subparsers.add_parser('publish',
+                                           help='Publish a dataset in shared memory until interrupted')
+    publish_parser.add_argument('input', help='Text or binary dataset')
+    publish_parser.add_argument('--name', help='Segment name (default: generated)')
+
+    args = parser.parse_args()
+
+    if args.command not in ('convert', 'publish'):
+        parser.print_help()
+        return 1
+
+    try:
+        values = read_binary(args.input) if is_binary(args.input) else read_text(args.input)
+    except (IOError, ValueError) as e:
+        print(f"Error reading dataset: {e}", file=sys.stderr)
+        return 1
+
+    if args.command == 'convert':
+        write_binary(args.output, values)
+        print(f"Wrote {len(values):,} values to {args.output}")
+        return 0
+
+    try:
+        segment = publish(values, args.name)
+    except (FileExistsError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Published {len(values):,} values as {segment.name} (Ctrl-C to remove)", flush=True)
+    try:
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        signal.pause() if hasattr(signal, 'pause') else input()
+    except (KeyboardInterrupt, SystemExit, EOFError):
+        pass
+    finally:
+        segment.close()
+        segment.unlink()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Streaming k-way merge of pre-sorted sequences, files and binary datasets.
+
+The merge generalizes the two-way merge of merge_sort to k inputs with a
+loser tree: every output element costs about log2(k) comparisons, ties go to
+the earlier source (so the merge is stable, like merge_sort's `<=`), and only
+one head element per source is held in memory. Files are read and written in
+fixed-size buffers, so memory stays bounded regardless of the total size.
+"""
+
+import json
+import argparse
+import sys
+import os
+import mmap
+import time
+import heapq
+import random
+from array import array as typed_array
+from typing import List, Dict, Iterable, Iterator, Any
+
+import dataset_io
+from algorithms import merge_sort
+from sweep import RESULTS_DIR, parse_sizes
+
+
+# Elements read or written per buffer when streaming files
+MERGE_BUFFER_SIZE = 1 << 16
+
+OUTPUT_FORMATS = ['text', 'binary']
+
+# Merge implementations compared by the benchmark: this module, the C-accelerated
+# standard library merge, and re-sorting the concatenation with merge_sort
+BENCHMARK_METHODS = ['loser_tree', 'heapq_merge', 'merge_sort']
+
+
+# --- Loser tree ---
+
+# Head of an exhausted source. It is only tested by identity: values such as
+# KeyedIndex entries cannot be compared with a foreign sentinel
+EXHAUSTED = object()
+
+
+def merge(sources: Iterable[Iterable[Any]], check_sorted: bool = True) -> Iterator[Any]:
+    """Merge sorted iterables into one sorted stream with a loser tree
+
+    Raises ValueError when check_sorted is set and a source goes backwards.
+    """
+    iterators = [iter(source) for source in sources]
+    k = len(iterators)
+
+    if k == 0:
+        return
+
+    heads = [next(iterator, EXHAUSTED) for iterator in iterators]
+
+    def beats(a: int, b: int) -> bool:
+        # Exhausted sources lose; equal heads go to the earlier source, which keeps the merge stable
+        if heads[a] is EXHAUSTED or heads[b] is EXHAUSTED:
+            return heads[b] is EXHAUSTED and (heads[a] is not EXHAUSTED or a < b)
+        return heads[a] < heads[b] or (heads[a] <= heads[b] and a < b)
+
+    # tree[1..k-1] holds the loser of each match, tree[0] the overall winner;
+    # leaf i sits at position k + i of the implicit tree
+    tree = [0] * k
+    winners = [0] * (2 * k)
+    for i in range(k):
+        winners[k + i] = i
+    for node in range(k - 1, 0, -1):
+        left, right = winners[2 * node], winners[2 * node + 1]
+        if beats(left, right):
+            winners[node], tree[node] = left, right
+        else:
+            winners[node], tree[node] = right, left
+    tree[0] = winners[1] if k > 1 else 0
+
+    winner = tree[0]
+    value = heads[winner]
+
+    while value is not EXHAUSTED:
+        yield value
+
+        head = next(iterators[winner], EXHAUSTED)
+        if check_sorted and head is not EXHAUSTED and head < value:
+            raise ValueError(f"Source {winner} is not sorted")
+        heads[winner] = head
+
+        # Replay the winner's path to the root against the stored losers
+        node = (winner + k) >> 1
+        while node:
+            loser = tree[node]
+            challenger = heads[loser]
+            if challenger is not EXHAUSTED and (
+                    head is EXHAUSTED or (challenger <= head and (challenger < head or loser < winner))):
+                tree[node] = winner
+                winner, head = loser, challenger
+            node >>= 1
+
+        tree[0] = winner
+        value = head
+
+
+# --- Sources and sinks ---
+
+def read_text_stream(file_path: str) -> Iterator[int]:
+    """Stream the integers of a whitespace-separated text file"""
+    with open(file_path, 'r') as file:
+        for line in file:
+            for token in line.split():
+                yield int(token)
+
+
+def read_binary_stream(file_path: str, buffer_size: int = MERGE_BUFFER_SIZE) -> Iterator[int]:
+    """Stream a binary dataset file through a memory map, one buffer at a time"""
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            magic, count, typecode = dataset_io.HEADER.unpack_from(mapping)
+            typecode = typecode.decode()
+            if magic != dataset_io.MAGIC or typecode not in dataset_io.TYPECODES:
+                raise ValueError(f"Not a binary dataset: {file_path}")
+
+            itemsize = dataset_io.TYPECODES[typecode]
+            offset = dataset_io.HEADER.size
+            end = offset + count * itemsize
+            step = buffer_size * itemsize
+
+            while offset < end:
+                chunk = typed_array(typecode)
+                chunk.frombytes(mapping[offset:min(offset + step, end)])
+                if sys.byteorder == 'big':
+                    chunk.byteswap()
+                yield from chunk
+                offset += step
+
+
+def open_source(file_path: str) -> Iterator[int]:
+    """Stream a text or binary dataset file"""
+    if dataset_io.is_binary(file_path):
+        return read_binary_stream(file_path)
+    return read_text_stream(file_path)
+
+
+def write_text_stream(file_path: str, values: Iterable[int],
+                      buffer_size: int = MERGE_BUFFER_SIZE) -> int:
+    """Write values one per line in buffered batches; returns the count"""
+    count = 0
+    buffer = []
+
+    with open(file_path, 'w') as file:
+        for value in values:
+            buffer.append(str(value))
+            if len(buffer) >= buffer_size:
+                file.write('\n'.join(buffer))
+                file.write('\n')
+                count += len(buffer)
+                buffer = []
+        if buffer:
+            file.write('\n'.join(buffer))
+            file.write('\n')
+            count += len(buffer)
+
+    return count
+
+
+def write_binary_stream(file_path: str, values: Iterable[int],
+                        buffer_size: int = MERGE_BUFFER_SIZE) -> int:
+    """Write values as an int64 binary dataset in buffered batches; returns the count"""
+    count = 0
+    buffer = typed_array('q')
+
+    with open(file_path, 'wb') as file:
+        # The count is patched in once the stream has ended
+        file.write(dataset_io.HEADER.pack(dataset_io.MAGIC, 0, b'q'))
+
+        for value in values:
+            buffer.append(value)
+            if len(buffer) >= buffer_size:
+                if sys.byteorder == 'big':
+                    buffer.byteswap()
+                file.write(buffer.tobytes())
+                count += len(buffer)
+                buffer = typed_array('q')
+        if buffer:
+            if sys.byteorder == 'big':
+                buffer.byteswap()
+            file.write(buffer.tobytes())
+            count += len(buffer)
+
+        file.seek(0)
+        file.write(dataset_io.HEADER.pack(dataset_io.MAGIC, count, b'q'))
+
+    return count
+
+
+def merge_files(input_paths: List[str], output_path: str, output_format: str = 'text') -> int:
+    """Merge sorted dataset files into one output file; returns the element count"""
+    merged = merge([open_source(path) for path in input_paths])
+    if output_format == 'binary':
+        return write_binary_stream(output_path, merged)
+    return write_text_stream(output_path, merged)
+
+
+# --- Benchmark ---
+
+def make_shards(total: int, k: int, seed: int = 0) -> List[List[int]]:
+    """k sorted shards of random values, interleaved so the merge has real work to do"""
+    rng = random.Random(seed)
+    values = [rng.randint(1, total) for _ in range(total)]
+    shards = [values[i::k] for i in range(k)]
+    for shard in shards:
+        shard.sort()
+    return shards
+
+
+def benchmark_merge(shards: List[List[int]], method: str) -> float:
+    """Seconds taken to drain one merge of the shards"""
+    start_time = time.perf_counter()
+
+    if method == 'merge_sort':
+        merge_sort([value for shard in shards for value in shard])
+        return time.perf_counter() - start_time
+
+    if method == 'loser_tree':
+        merged = merge(shards, check_sorted=False)
+    else:
+        merged = heapq.merge(*shards)
+
+    for _ in merged:
+        pass
+
+    return time.perf_counter() - start_time
+
+
+def run_benchmark(ks: List[int], sizes: List[int], runs: int) -> List[Dict]:
+    """Throughput of each merge method for every (k, total size)"""
+    results = []
+
+    for total in sizes:
+        for k in ks:
+            if k > total:
+                continue
+            shards = make_shards(total, k)
+            for method in BENCHMARK_METHODS:
+                times = [benchmark_merge(shards, method) for _ in range(runs)]
+                best = min(times)
+                results.append({
+                    'method': method,
+                    'k': k,
+                    'size': total,
+                    'runs': runs,
+                    'times': times,
+                    'min_time': best,
+                    'elements_per_second': total / best if best > 0 else 0.0
+                })
+                print(f"{method:<12} k={k:<6} n={total:<10,} "
+                      f"{results[-1]['elements_per_second']:>14,.0f} elements/s", flush=True)
+
+    return results
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Streaming k-way merge of sorted datasets',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s merge shard1.txt shard2.txt shard3.bin --output merged.txt
+  %(prog)s merge shards/*.bin --output merged.bin
+  %(prog)s bench --k 2,8,64,512 --sizes 1e5,1e6
+        '''
+    )
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    merge_parser = subparsers.add_parser('merge', help='Merge sorted text or binary dataset files')
+    merge_parser.add_argument('inputs', nargs='+', help='Sorted input files')
+    merge_parser.add_argument('--output', required=True, help='Merged output file')
+    merge_parser.add_argument('--format', choices=OUTPUT_FORMATS,
+                              help='Output format (default: binary for .bin files, text otherwise)')
+
+    bench_parser = subparsers.add_parser('bench', help='Measure merge throughput against k and size')
+    bench_parser.add_argument('--k', default='2,4,16,64,256',
+                              help='Comma-separated numbers of shards (default: 2,4,16,64,256)')
+    bench_parser.add_argument('--sizes', default='1e5,1e6',
+                              help='Total sizes, list or range like sweep.py (default: 1e5,1e6)')
+    bench_parser.add_argument('--runs', type=int, default=3,
+                              help='Runs per measurement; the fastest is reported (default: 3)')
+    bench_parser.add_argument('--output',
+                              default=os.path.join(RESULTS_DIR, "kway_merge_python.json"),
+                              help='Results file (default: resources/results/kway_merge_python.json)')
+
+    args = parser.parse_args()
+
+    if args.command == 'merge':
+        output_format = args.format or ('binary' if args.output.endswith('.bin') else 'text')
+        start_time = time.perf_counter()
+        try:
+            count = merge_files(args.inputs, args.output, output_format)
+        except (IOError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        elapsed = time.perf_counter() - start_time
+        rate = count / elapsed if elapsed > 0 else 0.0
+        print(f"Merged {count:,} elements from {len(args.inputs)} files into {args.output} "
+              f"in {elapsed:.2f}s ({rate:,.0f} elements/s)")
+        return 0
+
+    if args.command == 'bench':
+        try:
+            ks = sorted({int(k) for k in args.k.split(',') if k.strip()})
+            sizes = parse_sizes(args.sizes)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        if not ks or ks[0] < 1 or args.runs < 1:
+            print("Error: k and runs must be at least 1.", file=sys.stderr)
+            return 1
+
+        results = run_benchmark(ks, sizes, args.runs)
+
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as outfile:
+            json.dump(results, outfile, indent=4)
+        print(f"Results saved to {args.output}")
+        return 0
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
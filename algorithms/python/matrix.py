@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Matrix benchmark: run algorithms over a grid of distribution x perturbation x size.
+
+Every cell of the grid is an independent runner invocation, so cells are
+executed in parallel across cores. All cells are stored in a single result
+set that the GUI renders as a heatmap of relative speed per algorithm.
+"""
+
+import json
+import argparse
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict
+
+from sweep import (RESULTS_DIR, LANGUAGES, DISTRIBUTIONS, max_dataset_size, check_algorithms,
+                   parse_sizes, ensure_creator, ensure_dataset, run_benchmark)
+
+
+DEFAULT_PERTURBATIONS = "0.0,0.25,0.5,0.75,1.0"
+
+
+def run_cell(language: str, distribution: str, perturbation: float, size: int,
+             dataset_path: str, algorithms: List[str], runs: int) -> List[Dict]:
+    """Benchmark one grid cell and tag every result with its coordinates"""
+    cell = {
+        'language': language,
+        'distribution': distribution,
+        'perturbation': perturbation,
+        'size': size
+    }
+
+    try:
+        results = run_benchmark(language, dataset_path, algorithms, runs)
+    except (RuntimeError, OSError, ValueError) as e:
+        return [{**cell, 'algorithm': algorithm, 'error': str(e)} for algorithm in algorithms]
+
+    return [{**cell, **result} for result in results]
+
+
+def relative_speed(cells: List[Dict], metric: str = 'average_time') -> None:
+    """Annotate each cell with its time relative to the fastest algorithm of that cell"""
+    best = {}
+    for item in cells:
+        if metric not in item:
+            continue
+        key = (item['language'], item['distribution'], item['perturbation'], item['size'])
+        best[key] = min(best.get(key, item[metric]), item[metric])
+
+    for item in cells:
+        key = (item['language'], item['distribution'], item['perturbation'], item['size'])
+        if metric in item and best.get(key):
+            item['relative_time'] = item[metric] / best[key]
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark sorting algorithms over a distribution x perturbation grid',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s --algorithms quick_sort,merge_sort,bucket_sort --sizes 10000
+  %(prog)s --algorithms quick_sort,heap_sort --perturbations 0,0.1,1 --distributions uniform,exponential
+  %(prog)s --algorithms merge_sort --languages cpp,java --sizes 1e4,1e5 --jobs 4
+        '''
+    )
+
+    parser.add_argument('--algorithms', required=True,
+                        help='Comma-separated list of algorithms to run')
+    parser.add_argument('--languages', default='python',
+                        help='Comma-separated list of languages (default: python)')
+    parser.add_argument('--distributions', default=','.join(DISTRIBUTIONS),
+                        help='Comma-separated list of distributions (default: all)')
+    parser.add_argument('--perturbations', default=DEFAULT_PERTURBATIONS,
+                        help=f'Comma-separated perturbation levels (default: {DEFAULT_PERTURBATIONS})')
+    parser.add_argument('--sizes', default='10000',
+                        help="Sizes as a list or 'start:stop:xFACTOR' range (default: 10000)")
+    parser.add_argument('--runs', type=int, default=5,
+                        help='Number of runs for each algorithm and cell (default: 5)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of cells benchmarked in parallel (default: CPU count)')
+    parser.add_argument('--output', default=os.path.join(RESULTS_DIR, "matrix_results.json"),
+                        help='Result file (default: resources/results/matrix_results.json)')
+
+    args = parser.parse_args()
+
+    if args.runs < 1 or args.jobs < 1:
+        print("Error: --runs and --jobs must be at least 1.", file=sys.stderr)
+        return 1
+
+    try:
+        sizes = parse_sizes(args.sizes)
+        perturbations = sorted({float(p) for p in args.perturbations.split(',') if p.strip()})
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    max_size = max_dataset_size()
+    if max_size and any(size > max_size for size in sizes):
+        print(f"Error: The creator supports at most {max_size:,} elements "
+              f"(install NumPy to generate larger datasets).", file=sys.stderr)
+        return 1
+
+    if any(not 0.0 <= p <= 1.0 for p in perturbations):
+        print("Error: Perturbation levels must be between 0.0 and 1.0.", file=sys.stderr)
+        return 1
+
+    distributions = [d.strip() for d in args.distributions.split(',')]
+    languages = [lang.strip() for lang in args.languages.split(',')]
+    chosen_algorithms = [algo.strip() for algo in args.algorithms.split(',')]
+
+    for distribution in distributions:
+        if distribution not in DISTRIBUTIONS:
+            print(f"Error: Unknown distribution: {distribution}", file=sys.stderr)
+            return 1
+
+    for language in languages:
+        if language not in LANGUAGES:
+            print(f"Error: Unknown language: {language}", file=sys.stderr)
+            return 1
+
+    try:
+        check_algorithms(languages, chosen_algorithms)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    grid = [(d, p, n) for d in distributions for p in perturbations for n in sizes]
+
+    # Datasets are shared by all languages, so create them before any cell runs
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        try:
+            ensure_creator()
+            paths = list(executor.map(lambda cell: ensure_dataset(cell[2], cell[0], cell[1]), grid))
+        except (RuntimeError, ValueError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    datasets = dict(zip(grid, paths))
+
+    cells = []
+    total = len(grid) * len(languages)
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [
+            executor.submit(run_cell, language, d, p, n, datasets[(d, p, n)],
+                            chosen_algorithms, args.runs)
+            for language in languages for (d, p, n) in grid
+        ]
+
+        for done, future in enumerate(as_completed(futures), 1):
+            results = future.result()
+            cells.extend(results)
+            first = results[0]
+            status = "failed" if any('error' in item for item in results) else "ok"
+            print(f"[{done}/{total}] {first['language']} {first['distribution']} "
+                  f"p={first['perturbation']:.2f} n={first['size']:,}: {status}")
+
+    cells.sort(key=lambda x: (x['language'], x['distribution'], x['perturbation'],
+                              x['size'], x['algorithm']))
+    relative_speed(cells)
+
+    matrix = {
+        'algorithms': chosen_algorithms,
+        'languages': languages,
+        'distributions': distributions,
+        'perturbations': perturbations,
+        'sizes': sizes,
+        'runs': args.runs,
+        'cells': cells
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as outfile:
+        json.dump(matrix, outfile, indent=4)
+
+    failures = sum(1 for item in cells if 'error' in item)
+    print(f"Matrix completed: {len(cells) - failures} measurements, {failures} failure(s).")
+    print(f"Results saved to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
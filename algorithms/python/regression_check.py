@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Performance regression detector over historical benchmark results.
+
+Results files produced by the language runners (JSON arrays or JSON Lines
+streams) are appended to a JSON Lines history with `record`; `check`
+compares the latest run of every (language, algorithm, dataset) against a
+rolling baseline of previous runs using a one-sided Mann-Whitney U test on
+the raw `times` arrays.
+"""
+
+import json
+import time
+import argparse
+import sys
+import os
+import hashlib
+import math
+import statistics
+from typing import List, Tuple, Dict, Optional
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "..", "..", "resources", "results")
+DEFAULT_HISTORY = os.path.join(RESULTS_DIR, "history.jsonl")
+LANGUAGES = ["cpp", "python", "java"]
+
+# Largest n1 * n2 for which the exact U distribution is enumerated
+EXACT_LIMIT = 2500
+
+
+# --- Statistics ---
+
+def rank_with_ties(values: List[float]) -> Tuple[List[float], List[int]]:
+    """Return average ranks (1-based) and the sizes of tied groups"""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    tie_sizes = []
+    index = 0
+
+    while index < len(order):
+        end = index
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[index]]:
+            end += 1
+
+        average_rank = (index + end) / 2 + 1
+        for position in range(index, end + 1):
+            ranks[order[position]] = average_rank
+
+        tie_sizes.append(end - index + 1)
+        index = end + 1
+
+    return ranks, tie_sizes
+
+
+def exact_u_upper_tail(u: int, n1: int, n2: int) -> float:
+    """P(U >= u) under H0 using the exact (tie-free) U distribution"""
+    # counts[j][v]: number of arrangements of i x-values and j y-values with U == v
+    counts = [[1] + [0] * (n1 * n2) for _ in range(n2 + 1)]
+
+    for _ in range(n1):
+        new_counts = [[0] * (n1 * n2 + 1) for _ in range(n2 + 1)]
+        new_counts[0] = [1] + [0] * (n1 * n2)
+
+        for j in range(1, n2 + 1):
+            for v in range(n1 * n2 + 1):
+                total = new_counts[j - 1][v]
+                if v >= j:
+                    total += counts[j][v - j]
+                new_counts[j][v] = total
+
+        counts = new_counts
+
+    distribution = counts[n2]
+    total = sum(distribution)
+    return sum(distribution[u:]) / total
+
+
+def mann_whitney_greater(sample: List[float], baseline: List[float]) -> Tuple[float, float]:
+    """One-sided Mann-Whitney U test that `sample` is stochastically greater than `baseline`"""
+    n1, n2 = len(sample), len(baseline)
+    ranks, tie_sizes = rank_with_ties(list(sample) + list(baseline))
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    has_ties = any(size > 1 for size in tie_sizes)
+
+    if not has_ties and n1 * n2 <= EXACT_LIMIT:
+        return u, exact_u_upper_tail(int(round(u)), n1, n2)
+
+    # Normal approximation with tie and continuity correction
+    n = n1 + n2
+    tie_term = sum(size ** 3 - size for size in tie_sizes)
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+
+    if variance <= 0:
+        return u, 1.0
+
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+# --- History handling ---
+
+def dataset_key(dataset_file: Optional[str], label: Optional[str]) -> str:
+    """Build the dataset identifier stored with each history entry"""
+    if label:
+        return label
+
+    if not dataset_file:
+        return "default"
+
+    digest = hashlib.sha1()
+    with open(dataset_file, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+
+    return f"{os.path.basename(dataset_file)}:{digest.hexdigest()[:12]}"
+
+
+def load_history(history_file: str) -> List[Dict]:
+    """Read all entries from a JSON Lines history file"""
+    entries = []
+
+    if not os.path.exists(history_file):
+        return entries
+
+    with open(history_file, 'r') as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                print(f"Warning: Skipping malformed history line {line_number}", file=sys.stderr)
+
+    return entries
+
+
+def load_results_file(results_file: str) -> List[Dict]:
+    """Read a results file written as a JSON array or as JSON Lines (--output-format jsonl)"""
+    with open(results_file, 'r') as file:
+        if not results_file.endswith('.jsonl'):
+            return json.load(file)
+        
+        results = []
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A run still in progress may leave a partial last line
+                continue
+            if record.get('type') == 'algorithm':
+                results.append(record)
+        return results
+
+
+def latest_results_file(language: str) -> Optional[str]:
+    """Most recently written results file of a language in either output format"""
+    candidates = [os.path.join(RESULTS_DIR, f"results_{language}.{extension}") for extension in ('json', 'jsonl')]
+    candidates = [path for path in candidates if os.path.exists(path)]
+    return max(candidates, key=os.path.getmtime) if candidates else None
+
+
+def record_results(results_file: str, language: str, key: str, history_file: str,
+                   timestamp: float) -> int:
+    """Append every algorithm of a results file to the history"""
+    results = load_results_file(results_file)
+
+    os.makedirs(os.path.dirname(os.path.abspath(history_file)), exist_ok=True)
+    recorded = 0
+
+    with open(history_file, 'a') as outfile:
+        for result in results:
+            times = result.get('times')
+            if not result.get('algorithm') or not times:
+                continue
+
+            entry = {
+                'timestamp': timestamp,
+                'language': language,
+                'dataset': key,
+                'algorithm': result['algorithm'],
+                'times': times
+            }
+            outfile.write(json.dumps(entry) + "\n")
+            recorded += 1
+
+    return recorded
+
+
+def find_regressions(entries: List[Dict], window: int, alpha: float,
+                     threshold: float) -> List[Dict]:
+    """Compare the latest entry of each series against its rolling baseline"""
+    series = {}
+    for entry in entries:
+        key = (entry['language'], entry['algorithm'], entry['dataset'])
+        series.setdefault(key, []).append(entry)
+
+    report = []
+
+    for (language, algorithm, dataset), history in sorted(series.items()):
+        history.sort(key=lambda x: x['timestamp'])
+        if len(history) < 2:
+            continue
+
+        latest = history[-1]['times']
+        baseline = [t for entry in history[-1 - window:-1] for t in entry['times']]
+        baseline_median = statistics.median(baseline)
+        latest_median = statistics.median(latest)
+        change = latest_median / baseline_median - 1 if baseline_median > 0 else 0.0
+        _, p_value = mann_whitney_greater(latest, baseline)
+
+        report.append({
+            'language': language,
+            'algorithm': algorithm,
+            'dataset': dataset,
+            'baseline_runs': min(window, len(history) - 1),
+            'baseline_median': baseline_median,
+            'latest_median': latest_median,
+            'change': change,
+            'p_value': p_value,
+            'regression': p_value < alpha and change >= threshold
+        })
+
+    return report
+
+
+def print_report(report: List[Dict], verbose: bool) -> None:
+    """Print a concise regression report"""
+    regressions = [item for item in report if item['regression']]
+
+    for item in report:
+        if not item['regression'] and not verbose:
+            continue
+
+        status = "REGRESSION" if item['regression'] else "ok"
+        print(f"{status:<10} {item['language']:<6} {item['algorithm']:<16} {item['dataset']:<28} "
+              f"{item['baseline_median']:.6f}s -> {item['latest_median']:.6f}s "
+              f"({item['change']:+.1%}, p={item['p_value']:.4f})")
+
+    print(f"Checked {len(report)} series, {len(regressions)} regression(s) found.")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Detect performance regressions in historical benchmark results',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s record --dataset ../../resources/sets/dataset.txt
+  %(prog)s record --language python --results results_python.json --dataset-key uniform-10k
+  %(prog)s check --window 5 --threshold 0.15
+        '''
+    )
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    record_parser = subparsers.add_parser('record', help='Append results files to the history')
+    record_parser.add_argument('--language', choices=LANGUAGES,
+                               help='Language to record (default: every available results file)')
+    record_parser.add_argument('--results', help='Results file (.json or .jsonl) to record (requires --language)')
+    record_parser.add_argument('--dataset', help='Dataset file the results were measured on')
+    record_parser.add_argument('--dataset-key', help='Explicit dataset identifier')
+    record_parser.add_argument('--history', default=DEFAULT_HISTORY,
+                               help='History file (default: resources/results/history.jsonl)')
+
+    check_parser = subparsers.add_parser('check', help='Check the latest runs for regressions')
+    check_parser.add_argument('--history', default=DEFAULT_HISTORY,
+                              help='History file (default: resources/results/history.jsonl)')
+    check_parser.add_argument('--window', type=int, default=5,
+                              help='Number of previous runs forming the baseline (default: 5)')
+    check_parser.add_argument('--alpha', type=float, default=0.05,
+                              help='Significance level (default: 0.05)')
+    check_parser.add_argument('--threshold', type=float, default=0.15,
+                              help='Minimum relative slowdown of the median (default: 0.15)')
+    check_parser.add_argument('--verbose', action='store_true',
+                              help='Also list series without regressions')
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        if args.results and not args.language:
+            print("Error: --results requires --language.", file=sys.stderr)
+            return 2
+
+        try:
+            key = dataset_key(args.dataset, args.dataset_key)
+        except IOError as e:
+            print(f"Error reading dataset: {e}", file=sys.stderr)
+            return 2
+
+        if args.results:
+            sources = [(args.language, args.results)]
+        else:
+            languages = [args.language] if args.language else LANGUAGES
+            sources = [(lang, latest_results_file(lang)) for lang in languages]
+            sources = [(lang, path) for lang, path in sources if path]
+
+        if not sources:
+            print("Error: No results files to record.", file=sys.stderr)
+            return 2
+
+        timestamp = time.time()
+        for language, results_file in sources:
+            try:
+                count = record_results(results_file, language, key, args.history, timestamp)
+            except (IOError, ValueError) as e:
+                print(f"Error recording {results_file}: {e}", file=sys.stderr)
+                return 2
+            print(f"Recorded {count} algorithm(s) for {language} on dataset {key}")
+
+        return 0
+
+    if args.command == 'check':
+        if args.window < 1:
+            print("Error: Window must be at least 1.", file=sys.stderr)
+            return 2
+
+        entries = load_history(args.history)
+        if not entries:
+            print(f"Error: No history found at {args.history}", file=sys.stderr)
+            return 2
+
+        report = find_regressions(entries, args.window, args.alpha, args.threshold)
+        print_report(report, args.verbose)
+
+        return 1 if any(item['regression'] for item in report) else 0
+
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
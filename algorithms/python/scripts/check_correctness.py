@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Correctness checks of the algorithms against sorted() as the oracle.
+
+Every algorithm sorts sizes 0 to 1000 (including the sizes around the
+insertion, network and tile cutoffs) of random, duplicate-heavy, sorted and
+reversed inputs, in each container (list, array and, when installed, numpy).
+The same inputs check the selection algorithms and record sorting with
+sort(); k-way merges and segmented sorts get inputs of their own.
+Run from algorithms/python, like the other scripts; the exit status is 1 when
+any check fails.
+"""
+
+import os
+import random
+import sys
+import tempfile
+from typing import List, Callable, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from algorithms import (ALGORITHMS, SELECTION_ALGORITHMS, STABLE_ALGORITHMS, COMPARISON_ALGORITHMS,
+                        CONTAINERS, KeyedIndex, np, make_container, sort)
+import kway_merge
+import batch_sort
+
+
+SIZES = [*range(34), 63, 64, 65, 100, 127, 128, 129, 257, 500, 1000]
+
+PATTERNS = ['random', 'duplicates', 'sorted', 'reversed']
+
+SELECTION_KS = [1, 2, 10, 100]
+
+MERGE_KS = [0, 1, 2, 3, 5, 8, 17, 64]
+
+# Segment lengths of the ragged batches, empty segments included
+SEGMENT_LENGTHS = [0, 1, 2, 3, 16, 17, 100, 1000]
+
+
+def containers() -> List[str]:
+    """Containers available here; numpy needs NumPy"""
+    return [container for container in CONTAINERS if container != 'numpy' or np is not None]
+
+
+def make_input(size: int, pattern: str, rng: random.Random) -> List[int]:
+    """Test input of one pattern, with values in [1, size] like the generated datasets"""
+    if pattern == 'duplicates':
+        return [rng.randint(1, 4) for _ in range(size)]
+    values = [rng.randint(1, max(size, 1)) for _ in range(size)]
+    if pattern == 'sorted':
+        values.sort()
+    elif pattern == 'reversed':
+        values.sort(reverse=True)
+    return values
+
+
+def inputs(seed: int = 0):
+    """Every (size, pattern, values) combination, reproducible for a seed"""
+    rng = random.Random(seed)
+    for size in SIZES:
+        for pattern in PATTERNS:
+            yield size, pattern, make_input(size, pattern, rng)
+
+
+# --- Checks ---
+
+def check_sorting(failures: List[str]) -> int:
+    """Every algorithm must return sorted(values) in every container"""
+    checks = 0
+    for size, pattern, values in inputs():
+        expected = sorted(values)
+        for container in containers():
+            for algorithm, function in ALGORITHMS.items():
+                data = make_container(values, container)
+                function(data)
+                checks += 1
+                if [int(value) for value in data] != expected:
+                    failures.append(f"{algorithm}: {pattern} input of {size} in {container}")
+    return checks
+
+
+def selection_ok(algorithm: str, output: List[int], values: List[int], k: int) -> bool:
+    """Check one selection result against the sorted input"""
+    expected = sorted(values)
+    if sorted(output) != expected:
+        return False
+    if algorithm != 'nth_element':
+        return output[:k] == expected[:k]
+    nth = expected[k - 1]
+    return (output[k - 1] == nth and all(value <= nth for value in output[:k])
+            and all(value >= nth for value in output[k:]))
+
+
+def check_selection(failures: List[str]) -> int:
+    """top_k and partial_sort must lead with the k smallest sorted, nth_element must place the k-th"""
+    checks = 0
+    for size, pattern, values in inputs(seed=1):
+        for k in SELECTION_KS:
+            for container in containers():
+                for algorithm, function in SELECTION_ALGORITHMS.items():
+                    data = make_container(values, container)
+                    function(data, k=k)
+                    checks += 1
+                    output = [int(value) for value in data]
+                    if size and not selection_ok(algorithm, output, values, min(k, size)):
+                        failures.append(f"{algorithm}: k={k}, {pattern} input of {size} in {container}")
+                    elif not size and output:
+                        failures.append(f"{algorithm}: k={k}, empty input in {container}")
+    return checks
+
+
+def check_records(failures: List[str]) -> int:
+    """sort() must match sorted() with the same key, and stable algorithms must keep ties in order"""
+    checks = 0
+    for size, pattern, values in inputs(seed=3):
+        # The tag makes every record distinct, so reordered ties show up
+        records = [(value, index) for index, value in enumerate(values)]
+        for reverse in (False, True):
+            expected = sorted(records, key=lambda record: record[0], reverse=reverse)
+            expected_keys = [record[0] for record in expected]
+            for algorithm in STABLE_ALGORITHMS:
+                output = list(records)
+                sort(output, key=lambda record: record[0], reverse=reverse, algorithm=algorithm)
+                checks += 1
+                if output != expected:
+                    failures.append(f"sort: {algorithm} reverse={reverse}, {pattern} input of {size}")
+            for algorithm in COMPARISON_ALGORITHMS:
+                output = list(records)
+                sort(output, key=lambda record: record[0], reverse=reverse, stable=False, algorithm=algorithm)
+                checks += 1
+                if sorted(output) != sorted(records) or [record[0] for record in output] != expected_keys:
+                    failures.append(f"sort: {algorithm} stable=False reverse={reverse}, {pattern} input of {size}")
+    return checks
+
+
+def make_sources(k: int, rng: random.Random) -> List[List[KeyedIndex]]:
+    """k sorted sources of duplicate-heavy keys, some empty; each index records (source, position)"""
+    sources = []
+    for source in range(k):
+        keys = sorted(rng.randint(1, 5) for _ in range(rng.choice([0, 1, 7, 40])))
+        sources.append([KeyedIndex(key, source * 1000 + position) for position, key in enumerate(keys)])
+    return sources
+
+
+def check_kway_merge(failures: List[str]) -> int:
+    """merge must be stable across sources, reject unsorted sources and round-trip through files"""
+    checks = 0
+    rng = random.Random(2)
+
+    for k in MERGE_KS:
+        for _ in range(20):
+            sources = make_sources(k, rng)
+            # sorted() is stable, so equal keys keep source order, then position order
+            expected = [(entry.key, entry.index) for entry in sorted(sum(sources, []), key=lambda entry: entry.key)]
+            merged = [(entry.key, entry.index) for entry in kway_merge.merge(sources)]
+            checks += 1
+            if merged != expected:
+                failures.append(f"merge: {k} sources are not merged stably")
+
+    for sources in ([[1, 2], [3, 1]], [[2, 1]], [[1, 5], [2, 3], [4, 4, 0]]):
+        checks += 1
+        try:
+            list(kway_merge.merge(sources))
+            failures.append(f"merge: unsorted sources {sources} did not raise ValueError")
+        except ValueError:
+            pass
+        checks += 1
+        if sorted(kway_merge.merge(sources, check_sorted=False)) != sorted(sum(sources, [])):
+            failures.append(f"merge: unchecked merge of {sources} lost values")
+
+    with tempfile.TemporaryDirectory(prefix="check_merge_") as directory:
+        shards = [sorted(rng.randint(1, 50) for _ in range(rng.randint(0, 300))) for _ in range(5)]
+        expected = sorted(sum(shards, []))
+        for output_format in kway_merge.OUTPUT_FORMATS:
+            paths = []
+            for i, shard in enumerate(shards):
+                path = os.path.join(directory, f"shard_{i}.{'bin' if output_format == 'binary' else 'txt'}")
+                if output_format == 'binary':
+                    kway_merge.write_binary_stream(path, shard)
+                else:
+                    kway_merge.write_text_stream(path, shard)
+                paths.append(path)
+            output = os.path.join(directory, f"merged_{output_format}")
+            count = kway_merge.merge_files(paths, output, output_format)
+            checks += 1
+            if count != len(expected) or list(kway_merge.open_source(output)) != expected:
+                failures.append(f"merge_files: {output_format} output differs from the sorted shards")
+
+    return checks
+
+
+def make_batch(rng: random.Random, segments: int, low: int, high: int):
+    """Flat values and offsets of a ragged batch with lengths from SEGMENT_LENGTHS"""
+    lengths = [rng.choice(SEGMENT_LENGTHS) for _ in range(segments)]
+    offsets = [0]
+    for length in lengths:
+        offsets.append(offsets[-1] + length)
+    return [rng.randint(low, high) for _ in range(offsets[-1])], offsets
+
+
+def segments_ok(values: List[int], output: List[int], offsets: List[int]) -> bool:
+    """Every segment of output must be sorted(segment of values)"""
+    return len(output) == len(values) and all(
+        output[start:stop] == sorted(values[start:stop]) for start, stop in zip(offsets, offsets[1:]))
+
+
+def check_segments(failures: List[str]) -> int:
+    """sort_segments must sort every segment on its own, with every method and container"""
+    checks = 0
+    rng = random.Random(4)
+    methods = [method for method in batch_sort.METHODS if method != 'composite' or np is not None]
+
+    for segments, low, high in ((1, 1, 5), (7, 1, 4), (40, 1, 1000), (40, -50, 50)):
+        values, offsets = make_batch(rng, segments, low, high)
+        for container in containers():
+            for method in methods:
+                # Process pools are slow to start, so they only see the list container
+                if method == 'pool' and container != 'list':
+                    continue
+                data = make_container(values, container)
+                batch_sort.sort_segments(data, offsets, method, 'insertion_sort', workers=2)
+                checks += 1
+                if not segments_ok(values, [int(value) for value in data], offsets):
+                    failures.append(f"sort_segments: {method}, {segments} segments in {container}")
+
+    # A span too wide for the composite key takes the lexsort fallback
+    if np is not None:
+        values, offsets = make_batch(rng, 20, -2 ** 62, 2 ** 62)
+        data = np.array(values, dtype=np.int64)
+        batch_sort.sort_segments(data, offsets, 'composite')
+        checks += 1
+        if not segments_ok(values, data.tolist(), offsets):
+            failures.append("sort_segments: composite lexsort fallback")
+
+    return checks
+
+
+CHECKS: Dict[str, Callable[[List[str]], int]] = {
+    'sorting algorithms': check_sorting,
+    'selection algorithms': check_selection,
+    'record sorting': check_records,
+    'k-way merge': check_kway_merge,
+    'segmented sorting': check_segments,
+}
+
+
+def main():
+    """Main function"""
+    failed = False
+
+    for name, check in CHECKS.items():
+        failures = []
+        checks = check(failures)
+        status = "ok" if not failures else f"{len(failures)} FAILED"
+        print(f"{name:<24} {checks:>7} checks  {status}")
+        for failure in failures[:20]:
+            print(f"  {failure}")
+        failed = failed or bool(failures)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
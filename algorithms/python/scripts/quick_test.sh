@@ -20,10 +20,14 @@ python3 algorithms.py --file quick_test.txt --algorithms heap_sort --runs 1
 
 echo ""
 echo "Test 4: Multiple algorithms with custom runs"
-python3 algorithms.py --file quick_test.txt --algorithms bubble_sort,quick_sort --runs 3
+python3 algorithms.py --file quick_test.txt --algorithms bubble_sort,quick_sort,tim_sort,auto_sort,blocked_merge_sort --runs 3
 
 echo ""
-echo "Test 5: Error handling test"
+echo "Test 5: Selection algorithms (k = 3)"
+python3 algorithms.py --file quick_test.txt --algorithms top_k,nth_element,partial_sort --runs 3 --k 3
+
+echo ""
+echo "Test 6: Error handling test"
 echo "Testing with invalid algorithm:"
 python3 algorithms.py --file quick_test.txt --algorithms invalid_sort --runs 3 2>&1 | head -3
 
@@ -46,6 +50,7 @@ echo "Scripts available:"
 echo "  ./test_algorithms.sh       - Comprehensive algorithm testing"
 echo "  ./performance_benchmark.sh - Performance benchmarking"
 echo "  ./verify_correctness.sh    - Correctness verification"
+echo "  ./check_correctness.py     - Every algorithm checked against sorted()"
 echo ""
 echo "Usage examples:"
 echo "  python3 algorithms.py --file data.txt --algorithms quick_sort,merge_sort"
@@ -27,26 +27,34 @@ echo "5 3 5 1 3 5 1 3 5 1" > duplicate_data.txt
 echo "Test files created!"
 echo ""
 
+# Every registered algorithm, including the selection algorithms
+all_algorithms=$(python3 -c "from algorithms import ALGORITHMS, SELECTION_ALGORITHMS; print(','.join([*ALGORITHMS, *SELECTION_ALGORITHMS]))")
+
 # Test all algorithms on small data with custom runs
 echo "=== Testing all algorithms on small dataset (3 runs each) ==="
-python3 algorithms.py --file small_data.txt --algorithms bubble_sort,selection_sort,insertion_sort,quick_sort,merge_sort,heap_sort,counting_sort,radix_sort,bucket_sort --runs 3
+python3 algorithms.py --file small_data.txt --algorithms "$all_algorithms" --runs 3
+
+echo ""
+echo "=== Testing all algorithms on medium dataset (5 runs each) ==="
+python3 algorithms.py --file medium_data.txt --algorithms "$all_algorithms" --runs 5
 
 echo ""
-echo "=== Testing performance on medium dataset (5 runs each) ==="
-python3 algorithms.py --file medium_data.txt --algorithms quick_sort,merge_sort,heap_sort --runs 5
+echo "=== Testing the large dataset in an array container and as stably sorted records ==="
+python3 algorithms.py --file large_data.txt --algorithms "$all_algorithms" --runs 3 --container array
+python3 algorithms.py --file large_data.txt --algorithms merge_sort,blocked_merge_sort,tim_sort,binary_insertion_sort,insertion_sort_fast --runs 3 --records
 
 echo ""
 echo "=== Testing edge cases ==="
 echo "Testing on sorted data (3 runs each):"
-python3 algorithms.py --file sorted_data.txt --algorithms quick_sort,merge_sort --runs 3
+python3 algorithms.py --file sorted_data.txt --algorithms "$all_algorithms" --runs 3
 
 echo ""
 echo "Testing on reverse sorted data (3 runs each):"
-python3 algorithms.py --file reverse_data.txt --algorithms quick_sort,merge_sort --runs 3
+python3 algorithms.py --file reverse_data.txt --algorithms "$all_algorithms" --runs 3
 
 echo ""
 echo "Testing on duplicate data (3 runs each):"
-python3 algorithms.py --file duplicate_data.txt --algorithms counting_sort,radix_sort --runs 3
+python3 algorithms.py --file duplicate_data.txt --algorithms "$all_algorithms" --runs 3
 
 echo ""
 echo "=== Testing different run counts ==="
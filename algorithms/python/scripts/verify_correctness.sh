@@ -15,26 +15,35 @@ verify_sorting() {
     original_data=$(cat "$input_file")
     echo "Original: $original_data"
     
-    # Run sorting algorithm
-    python3 algorithms.py --file "$input_file" --algorithms "$algorithm" --runs "$runs" > /dev/null 2>&1
-    
-    # Create a sorted version using system sort for comparison
-    echo "$original_data" | tr ' ' '\n' | sort -n | tr '\n' ' ' > expected_sorted.txt
-    expected=$(cat expected_sorted.txt | sed 's/ $//')
-    
-    echo "Expected sorted: $expected"
-    echo "Algorithm completed successfully"
+    # Run sorting algorithm; every run's output is verified by algorithms.py
+    if ! python3 algorithms.py --file "$input_file" --algorithms "$algorithm" --runs "$runs" \
+            --output verify_results.json --quiet > /dev/null 2>&1; then
+        echo "FAILED: $algorithm did not run"
+        failures=$((failures + 1))
+    elif grep -q '"verified": false' verify_results.json; then
+        echo "FAILED: $algorithm did not sort its input"
+        failures=$((failures + 1))
+    else
+        # Create a sorted version using system sort for comparison
+        echo "$original_data" | tr ' ' '\n' | sort -n | tr '\n' ' ' > expected_sorted.txt
+        expected=$(cat expected_sorted.txt | sed 's/ $//')
+        
+        echo "Expected sorted: $expected"
+        echo "Algorithm completed successfully"
+    fi
     echo ""
 }
 
+failures=0
+
 # Create simple test cases
 echo "5 2 8 1 9" > simple_test.txt
 echo "3 3 1 1 2 2" > duplicate_test.txt  
 echo "1 2 3 4 5" > sorted_test.txt
 echo "5 4 3 2 1" > reverse_test.txt
 
-# Test each algorithm with different run counts
-algorithms=("bubble_sort" "selection_sort" "insertion_sort" "quick_sort" "merge_sort" "heap_sort" "counting_sort" "radix_sort" "bucket_sort")
+# Test each algorithm with different run counts, including the selection algorithms
+algorithms=($(python3 -c "from algorithms import ALGORITHMS, SELECTION_ALGORITHMS; print(*ALGORITHMS, *SELECTION_ALGORITHMS)"))
 
 for algo in "${algorithms[@]}"; do
     echo "=== Testing $algo ==="
@@ -52,9 +61,13 @@ verify_sorting simple_test.txt "quick_sort" 1
 echo "Testing merge_sort with 10 runs:"
 verify_sorting simple_test.txt "merge_sort" 10
 
-echo "=== All correctness tests completed ==="
+echo "=== Checking every algorithm against sorted() ==="
+python3 scripts/check_correctness.py || failures=$((failures + 1))
+echo ""
+
+echo "=== All correctness tests completed ($failures failed) ==="
 
 # Clean up
-rm expected_sorted.txt simple_test.txt duplicate_test.txt sorted_test.txt reverse_test.txt
+rm -f expected_sorted.txt verify_results.json simple_test.txt duplicate_test.txt sorted_test.txt reverse_test.txt
 
-echo "Final results saved to: ../../resources/results/results_python.json"
+[ "$failures" -eq 0 ]
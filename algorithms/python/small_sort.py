@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Sorting networks for tiny subarrays (2 to 16 elements).
+
+Every network has the smallest known number of comparators for its size
+(proven optimal up to 12 inputs; the 14- and 15-input networks are pruned from
+Green's 60-comparator network for 16).
+Each one is compiled at import into a straight-line function: the elements are
+loaded into locals, every comparator is one compare-and-swap with no loop or
+index arithmetic, and the results are stored back. The same comparators sort
+all rows of a NumPy matrix at once, as element-wise minimum/maximum over
+whole columns.
+
+Networks are not stable: equal elements may change order.
+"""
+
+import argparse
+import sys
+import random
+import time
+from typing import List, Dict, Tuple, Callable, MutableSequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Comparators (i, j) of each network, one line per layer; each puts the
+# smaller element on wire i
+NETWORKS: Dict[int, List[Tuple[int, int]]] = {
+    2: [(0, 1)],
+    3: [(0, 2),
+        (0, 1),
+        (1, 2)],
+    4: [(0, 2), (1, 3),
+        (0, 1), (2, 3),
+        (1, 2)],
+    5: [(0, 3), (1, 4),
+        (0, 2), (1, 3),
+        (0, 1), (2, 4),
+        (1, 2), (3, 4),
+        (2, 3)],
+    6: [(0, 5), (1, 3), (2, 4),
+        (1, 2), (3, 4),
+        (0, 3), (2, 5),
+        (0, 1), (2, 3), (4, 5),
+        (1, 2), (3, 4)],
+    7: [(0, 6), (2, 3), (4, 5),
+        (0, 2), (1, 4), (3, 6),
+        (0, 1), (2, 5), (3, 4),
+        (1, 2), (4, 6),
+        (2, 3), (4, 5),
+        (1, 2), (3, 4), (5, 6)],
+    8: [(0, 2), (1, 3), (4, 6), (5, 7),
+        (0, 4), (1, 5), (2, 6), (3, 7),
+        (0, 1), (2, 3), (4, 5), (6, 7),
+        (2, 4), (3, 5),
+        (1, 4), (3, 6),
+        (1, 2), (3, 4), (5, 6)],
+    9: [(0, 3), (1, 7), (2, 5), (4, 8),
+        (0, 7), (2, 4), (3, 8), (5, 6),
+        (0, 2), (1, 3), (4, 5), (7, 8),
+        (1, 4), (3, 6), (5, 7),
+        (0, 1), (2, 4), (3, 5), (6, 8),
+        (2, 3), (4, 5), (6, 7),
+        (1, 2), (3, 4), (5, 6)],
+    10: [(0, 8), (1, 9), (2, 7), (3, 5), (4, 6),
+         (0, 2), (1, 4), (5, 8), (7, 9),
+         (0, 3), (2, 4), (5, 7), (6, 9),
+         (0, 1), (3, 6), (8, 9),
+         (1, 5), (2, 3), (4, 8), (6, 7),
+         (1, 2), (3, 5), (4, 6), (7, 8),
+         (2, 3), (4, 5), (6, 7),
+         (3, 4), (5, 6)],
+    11: [(0, 9), (1, 6), (2, 4), (3, 7), (5, 8),
+         (0, 1), (3, 5), (4, 10), (6, 9), (7, 8),
+         (1, 3), (2, 5), (4, 7), (8, 10),
+         (0, 4), (1, 2), (3, 7), (5, 9), (6, 8),
+         (0, 1), (2, 6), (4, 5), (7, 8), (9, 10),
+         (2, 4), (3, 6), (5, 7), (8, 9),
+         (1, 2), (3, 4), (5, 6), (7, 8),
+         (2, 3), (4, 5), (6, 7)],
+    12: [(0, 8), (1, 7), (2, 6), (3, 11), (4, 10), (5, 9),
+         (0, 1), (2, 5), (3, 4), (6, 9), (7, 8), (10, 11),
+         (0, 2), (1, 6), (5, 10), (9, 11),
+         (0, 3), (1, 2), (4, 6), (5, 7), (8, 11), (9, 10),
+         (1, 4), (3, 5), (6, 8), (7, 10),
+         (1, 3), (2, 5), (6, 9), (8, 10),
+         (2, 3), (4, 5), (6, 7), (8, 9),
+         (4, 6), (5, 7),
+         (3, 4), (5, 6), (7, 8)],
+    13: [(0, 12), (1, 10), (2, 9), (3, 7), (5, 11), (6, 8),
+         (1, 6), (2, 3), (4, 11), (7, 9), (8, 10),
+         (0, 4), (1, 2), (3, 6), (7, 8), (9, 10), (11, 12),
+         (4, 6), (5, 9), (8, 11), (10, 12),
+         (0, 5), (3, 8), (4, 7), (6, 11), (9, 10),
+         (0, 1), (2, 5), (6, 9), (7, 8), (10, 11),
+         (1, 3), (2, 4), (5, 6), (9, 10),
+         (1, 2), (3, 4), (5, 7), (6, 8),
+         (2, 3), (4, 5), (6, 7), (8, 9),
+         (3, 4), (5, 6)],
+    14: [(0, 13), (1, 12), (2, 6), (3, 4), (5, 9), (7, 8),
+         (0, 7), (1, 2), (3, 11), (5, 10), (6, 12), (8, 13),
+         (0, 1), (2, 11), (3, 5), (4, 6), (7, 10), (8, 9), (12, 13),
+         (0, 3), (1, 5), (2, 8), (4, 7), (6, 10), (9, 11),
+         (1, 3), (2, 4), (5, 12), (6, 8), (7, 9), (10, 11),
+         (1, 2), (3, 4), (6, 7), (8, 9), (10, 13),
+         (2, 3), (4, 5), (10, 12), (11, 13),
+         (4, 6), (5, 7), (8, 10), (9, 12),
+         (3, 4), (5, 6), (7, 8), (9, 10), (11, 12),
+         (6, 7), (8, 9)],
+    15: [(0, 11), (1, 14), (2, 13), (3, 7), (4, 5), (6, 10), (8, 9),
+         (0, 6), (1, 8), (2, 3), (4, 12), (7, 13), (9, 14), (10, 11),
+         (0, 4), (1, 2), (3, 12), (5, 7), (6, 8), (9, 10), (13, 14),
+         (0, 1), (2, 4), (3, 9), (5, 6), (7, 8), (10, 12), (11, 13),
+         (1, 2), (3, 5), (4, 11), (6, 10), (7, 9), (8, 12), (13, 14),
+         (1, 3), (2, 5), (6, 7), (8, 13), (9, 10), (12, 14),
+         (2, 3), (4, 5), (8, 11), (12, 13),
+         (4, 6), (5, 7), (8, 9), (10, 11),
+         (3, 4), (5, 6), (7, 8), (9, 10), (11, 12),
+         (6, 7), (8, 9)],
+    16: [(0, 13), (1, 12), (2, 15), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10),
+         (0, 5), (1, 7), (2, 9), (3, 4), (6, 13), (8, 14), (10, 15), (11, 12),
+         (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (12, 13), (14, 15),
+         (0, 2), (1, 3), (4, 10), (5, 11), (6, 7), (8, 9), (12, 14), (13, 15),
+         (1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11), (13, 14),
+         (1, 4), (2, 6), (5, 8), (7, 10), (9, 13), (11, 14),
+         (2, 4), (3, 6), (9, 12), (11, 13),
+         (3, 5), (6, 8), (7, 9), (10, 12),
+         (3, 4), (5, 6), (7, 8), (9, 10), (11, 12),
+         (6, 7), (8, 9)]
+}
+
+MAX_NETWORK_SIZE = max(NETWORKS)
+
+
+def layers(comparators: List[Tuple[int, int]]) -> List[List[Tuple[int, int]]]:
+    """Group comparators into layers of disjoint wires, each as early as its inputs allow"""
+    ready: Dict[int, int] = {}
+    grouped: List[List[Tuple[int, int]]] = []
+
+    for i, j in comparators:
+        layer = max(ready.get(i, 0), ready.get(j, 0))
+        if layer == len(grouped):
+            grouped.append([])
+        grouped[layer].append((i, j))
+        ready[i] = ready[j] = layer + 1
+
+    return grouped
+
+
+def is_sorting_network(size: int, comparators: List[Tuple[int, int]]) -> bool:
+    """Check a network on all 2**size 0-1 inputs, which suffices by the 0-1 principle"""
+    inputs = 1 << size
+    # wires[w] holds bit w of every input at once: bit x of wires[w] is bit w of x
+    wires = []
+    for w in range(size):
+        pattern, period = ((1 << (1 << w)) - 1) << (1 << w), 1 << (w + 1)
+        while period < inputs:
+            pattern |= pattern << period
+            period *= 2
+        wires.append(pattern)
+
+    for i, j in comparators:
+        wires[i], wires[j] = wires[i] & wires[j], wires[i] | wires[j]
+
+    # Sorted when no input has a 1 on a wire followed by a 0 on the next
+    return all(wires[w] & ~wires[w + 1] == 0 for w in range(size - 1))
+
+
+def compile_network(size: int) -> Callable[[MutableSequence[int], int], None]:
+    """Straight-line function sorting array[lo:lo + size] in place with the network"""
+    names = [f"x{w}" for w in range(size)]
+    lines = [f"def sort_{size}(array, lo):",
+             f"    {', '.join(names)}, = array[lo:lo + {size}]"]
+    for i, j in NETWORKS[size]:
+        lines.append(f"    if x{j} < x{i}: x{i}, x{j} = x{j}, x{i}")
+    # Element stores work for every container; slice assignment would not for typed arrays
+    for w in range(size):
+        lines.append(f"    array[lo + {w}] = x{w}")
+
+    namespace: Dict = {}
+    exec("\n".join(lines), namespace)
+    return namespace[f"sort_{size}"]
+
+
+KERNELS = {size: compile_network(size) for size in NETWORKS}
+
+NETWORK_LAYERS = {size: layers(comparators) for size, comparators in NETWORKS.items()}
+
+
+def sort_range(array: MutableSequence[int], lo: int, hi: int) -> None:
+    """Sort array[lo:hi] (at most MAX_NETWORK_SIZE elements) with a sorting network"""
+    size = hi - lo
+    if size > 1:
+        KERNELS[size](array, lo)
+
+
+def sort_small(array: MutableSequence[int]) -> None:
+    """Sort a whole array of at most MAX_NETWORK_SIZE elements"""
+    sort_range(array, 0, len(array))
+
+
+def insertion_sort_range(array: MutableSequence[int], lo: int, hi: int) -> None:
+    """Stable insertion sort of array[lo:hi], the leaf baseline networks replace"""
+    for index in range(lo + 1, hi):
+        key = array[index]
+        j = index - 1
+
+        while j >= lo and array[j] > key:
+            array[j + 1] = array[j]
+            j -= 1
+
+        array[j + 1] = key
+
+
+def require_numpy() -> None:
+    """Raise ImportError when NumPy is missing"""
+    if np is None:
+        raise ImportError("NumPy is required for batch sorting (pip install numpy)")
+
+
+def sort_batch(matrix) -> None:
+    """Sort every row of a 2-D NumPy array in place (rows of 2 to 16 elements)"""
+    require_numpy()
+    size = matrix.shape[1]
+    if size < 2:
+        return
+
+    # One contiguous array per wire, so every comparator streams two columns
+    columns = np.ascontiguousarray(matrix.T)
+    low = np.empty_like(columns[0])
+    for i, j in NETWORKS[size]:
+        np.minimum(columns[i], columns[j], out=low)
+        np.maximum(columns[i], columns[j], out=columns[j])
+        columns[i] = low
+
+    matrix[...] = columns.T
+
+
+# --- Benchmark ---
+
+def time_leaves(function: Callable[[MutableSequence[int], int, int], None], blocks: List[List[int]],
+                size: int, repeats: int) -> float:
+    """Best-of-repeats seconds per call of function on fresh copies of the blocks"""
+    best = float('inf')
+
+    for _ in range(repeats):
+        copies = [list(block) for block in blocks]
+        start_time = time.perf_counter()
+        for block in copies:
+            function(block, 0, size)
+        best = min(best, time.perf_counter() - start_time)
+
+    return best / len(blocks)
+
+
+def run_benchmark(blocks_per_size: int, repeats: int, seed: int = 0) -> List[Dict]:
+    """Per-leaf cost of the network kernels against insertion sort, and batch against np.sort"""
+    rng = random.Random(seed)
+    results = []
+
+    for size in range(2, MAX_NETWORK_SIZE + 1):
+        blocks = [[rng.randint(1, 1000) for _ in range(size)] for _ in range(blocks_per_size)]
+        network = time_leaves(sort_range, blocks, size, repeats)
+        insertion = time_leaves(insertion_sort_range, blocks, size, repeats)
+        result = {'size': size, 'network': network, 'insertion': insertion}
+
+        if np is not None:
+            matrix = np.array(blocks)
+            batch = np_sort = float('inf')
+            for _ in range(repeats):
+                copy = matrix.copy()
+                start_time = time.perf_counter()
+                sort_batch(copy)
+                batch = min(batch, time.perf_counter() - start_time)
+                start_time = time.perf_counter()
+                np.sort(matrix, axis=1)
+                np_sort = min(np_sort, time.perf_counter() - start_time)
+            result['batch'] = batch / len(blocks)
+            result['np_sort'] = np_sort / len(blocks)
+
+        results.append(result)
+
+    return results
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Sorting-network kernels for tiny subarrays',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s verify
+  %(prog)s bench
+  %(prog)s bench --blocks 100000 --repeats 5
+        '''
+    )
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    subparsers.add_parser('verify', help='Check every network with the 0-1 principle')
+
+    bench_parser = subparsers.add_parser('bench', help='Time the kernels against insertion sort per leaf')
+    bench_parser.add_argument('--blocks', type=int, default=20000,
+                              help='Random blocks sorted per size (default: 20000)')
+    bench_parser.add_argument('--repeats', type=int, default=3,
+                              help='Repetitions; the fastest is kept (default: 3)')
+
+    args = parser.parse_args()
+
+    if args.command == 'verify':
+        failed = 0
+        print(f"{'size':>4} {'comparators':>12} {'depth':>6}  0-1 check")
+        for size, comparators in NETWORKS.items():
+            valid = is_sorting_network(size, comparators)
+            failed += not valid
+            print(f"{size:>4} {len(comparators):>12} {len(NETWORK_LAYERS[size]):>6}  "
+                  f"{'ok' if valid else 'FAILED'}")
+        return 1 if failed else 0
+
+    if args.command == 'bench':
+        if args.blocks < 1 or args.repeats < 1:
+            print("Error: --blocks and --repeats must be at least 1.", file=sys.stderr)
+            return 1
+
+        results = run_benchmark(args.blocks, args.repeats)
+
+        print("Nanoseconds per leaf (random blocks):")
+        header = f"{'size':>4} {'network':>10} {'insertion':>10} {'speedup':>8}"
+        if np is not None:
+            header += f" {'batch':>10} {'np.sort':>10}"
+        print(header)
+        for result in results:
+            line = (f"{result['size']:>4} {result['network'] * 1e9:>10.0f} {result['insertion'] * 1e9:>10.0f} "
+                    f"{result['insertion'] / result['network']:>7.2f}x")
+            if 'batch' in result:
+                line += f" {result['batch'] * 1e9:>10.1f} {result['np_sort'] * 1e9:>10.1f}"
+            print(line)
+        return 0
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
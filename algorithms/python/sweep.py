@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Scaling sweep: benchmark algorithms over a geometric range of input sizes.
+
+For every size a dataset is generated with the creator tool (with datagen
+above the creator's size limit) or reused from the sweep cache. Each selected
+language runner is invoked with a run count adapted to the measured cost of a
+probe run, and an empirical complexity exponent is fitted per algorithm from
+log(time) against log(n).
+"""
+
+import json
+import argparse
+import sys
+import os
+import math
+import statistics
+import subprocess
+import tempfile
+from typing import List, Tuple, Dict, Optional
+
+from algorithms import ALGORITHMS
+import datagen
+
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "resources", "results")
+SETS_DIR = os.path.join(PROJECT_ROOT, "resources", "sets")
+CACHE_DIR = os.path.join(SETS_DIR, "sweep")
+LANGUAGES = ["cpp", "python", "java"]
+DISTRIBUTIONS = ["uniform", "normal", "exponential", "beta"]
+
+# Algorithms the C++ and Java runners implement; the Python runner has all of ALGORITHMS
+NATIVE_ALGORITHMS = ['bubble_sort', 'selection_sort', 'insertion_sort', 'quick_sort', 'merge_sort',
+                     'heap_sort', 'counting_sort', 'radix_sort', 'bucket_sort']
+
+# Largest dataset the creator tool accepts; larger ones are generated with datagen
+CREATOR_MAX_SIZE = 500000
+
+
+# --- Algorithm selection ---
+
+def language_algorithms(language: str) -> List[str]:
+    """Algorithms the runner of a language accepts"""
+    return list(ALGORITHMS) if language == 'python' else NATIVE_ALGORITHMS
+
+
+def check_algorithms(languages: List[str], algorithms: List[str]) -> None:
+    """Raise ValueError for an algorithm that one of the languages does not implement"""
+    for language in languages:
+        available = language_algorithms(language)
+        for algorithm in algorithms:
+            if algorithm not in available:
+                raise ValueError(f"Unknown algorithm for {language}: {algorithm}\n"
+                                 f"Available algorithms: {', '.join(available)}")
+
+
+# --- Size specification ---
+
+def parse_size(text: str) -> int:
+    """Parse a size such as '1000', '1e5' or '2.5e4'"""
+    value = float(text)
+    if value < 1 or value != int(value):
+        raise ValueError(f"Invalid size: {text}")
+    return int(value)
+
+
+def parse_sizes(spec: str) -> List[int]:
+    """Parse 'start:stop:xFACTOR', 'start:stop:+STEP' or a comma-separated list"""
+    if ':' not in spec:
+        return sorted({parse_size(item) for item in spec.split(',') if item.strip()})
+
+    parts = spec.split(':')
+    if len(parts) != 3:
+        raise ValueError(f"Invalid size range: {spec}")
+
+    start, stop, step = parse_size(parts[0]), parse_size(parts[1]), parts[2].strip()
+    if stop < start:
+        raise ValueError(f"Range end must not be smaller than its start: {spec}")
+
+    sizes = []
+    if step.startswith('x'):
+        factor = float(step[1:])
+        if factor <= 1:
+            raise ValueError(f"Geometric factor must be greater than 1: {spec}")
+        value = float(start)
+        while value <= stop * (1 + 1e-9):
+            sizes.append(int(round(value)))
+            value *= factor
+    elif step.startswith('+'):
+        increment = parse_size(step[1:])
+        sizes = list(range(start, stop + 1, increment))
+    else:
+        raise ValueError(f"Step must be 'xFACTOR' or '+STEP': {spec}")
+
+    return sorted(set(sizes))
+
+
+# --- Datasets ---
+
+def ensure_creator() -> str:
+    """Return the creator executable path, compiling it if needed"""
+    creator_path = os.path.join(SETS_DIR, "creator")
+    cpp_file = os.path.join(SETS_DIR, "creator.cpp")
+
+    if (not os.path.exists(creator_path) or
+            (os.path.exists(cpp_file) and os.path.getmtime(cpp_file) > os.path.getmtime(creator_path))):
+        compile_cmd = ["g++", "-std=c++17", "-O2", "creator.cpp", "-o", "creator"]
+        result = subprocess.run(compile_cmd, capture_output=True, text=True, cwd=SETS_DIR)
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to compile creator: {result.stderr}")
+
+    return creator_path
+
+
+def max_dataset_size() -> Optional[int]:
+    """Largest dataset ensure_dataset can create (None when datagen lifts the limit)"""
+    return None if datagen.np is not None else CREATOR_MAX_SIZE
+
+
+def ensure_dataset(size: int, distribution: str, perturbation: float,
+                   cache_dir: str = CACHE_DIR) -> str:
+    """Return the path of a cached dataset, generating it on first use"""
+    dataset_path = os.path.join(cache_dir, f"dataset_{distribution}_{perturbation:.2f}_{size}.txt")
+    if os.path.exists(dataset_path):
+        return dataset_path
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # Sizes up to the creator limit keep using the creator, so cached results stay comparable
+    if size > CREATOR_MAX_SIZE:
+        if datagen.np is None:
+            raise ValueError(f"The creator supports at most {CREATOR_MAX_SIZE:,} elements "
+                             f"(requested {size:,}); install NumPy to generate larger datasets")
+        partial_path = dataset_path + ".tmp"
+        datagen.generate_file(partial_path, size, distribution, perturbation)
+        os.replace(partial_path, dataset_path)
+        return dataset_path
+
+    cmd = [
+        ensure_creator(),
+        "--size", str(size),
+        "--distribution", distribution,
+        "--perturbation", str(perturbation),
+        "--output", dataset_path
+    ]
+
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to create dataset: {result.stderr}")
+
+    return dataset_path
+
+
+# --- Language runners ---
+
+def runner_command(language: str) -> List[str]:
+    """Build the base command line of a language runner, compiling it if needed"""
+    algo_dir = os.path.join(PROJECT_ROOT, "algorithms", language)
+
+    if language == "python":
+        return [sys.executable, os.path.join(algo_dir, "algorithms.py")]
+
+    if language == "cpp":
+        executable_path = os.path.join(algo_dir, "algorithms")
+        cpp_source = os.path.join(algo_dir, "algorithms.cpp")
+        if (not os.path.exists(executable_path) or
+                os.path.getmtime(cpp_source) > os.path.getmtime(executable_path)):
+            compile_cmd = ["g++", "-std=c++17", "-O2", "algorithms.cpp", "-o", "algorithms"]
+            result = subprocess.run(compile_cmd, capture_output=True, text=True, cwd=algo_dir)
+            if result.returncode != 0:
+                raise RuntimeError(f"C++ compilation failed: {result.stderr}")
+        return [executable_path]
+
+    if language == "java":
+        src_file = os.path.join(algo_dir, "src", "SortingAlgorithms.java")
+        class_file = os.path.join(algo_dir, "bin", "SortingAlgorithms.class")
+        if (not os.path.exists(class_file) or
+                os.path.getmtime(src_file) > os.path.getmtime(class_file)):
+            compile_cmd = ["javac", "-cp", "lib/gson-2.10.1.jar", "-d", "bin", "src/SortingAlgorithms.java"]
+            result = subprocess.run(compile_cmd, capture_output=True, text=True, cwd=algo_dir)
+            if result.returncode != 0:
+                raise RuntimeError(f"Java compilation failed: {result.stderr}")
+        classpath = os.pathsep.join([os.path.join(algo_dir, "bin"),
+                                     os.path.join(algo_dir, "lib", "gson-2.10.1.jar")])
+        return ["java", "-cp", classpath, "SortingAlgorithms"]
+
+    raise ValueError(f"Unknown language: {language}")
+
+
+def run_benchmark(language: str, dataset_path: str, algorithms: List[str], runs: int) -> List[Dict]:
+    """Run a language runner once and return its parsed results"""
+    cmd = runner_command(language) + [
+        "--file", os.path.abspath(dataset_path),
+        "--algorithms", ','.join(algorithms),
+        "--runs", str(runs)
+    ]
+    if language == "python":
+        # Only the results file is read back, so skip the console echo
+        cmd += ["--quiet", "--compact"]
+
+    # The runners write to ../../resources/results/ relative to their working
+    # directory, so run them two levels deep inside a scratch directory.
+    with tempfile.TemporaryDirectory(prefix="sweep_") as scratch:
+        workdir = os.path.join(scratch, "run", language)
+        os.makedirs(workdir)
+
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=workdir)
+        if result.returncode != 0:
+            raise RuntimeError(f"{language} runner failed: {result.stderr.strip()}")
+
+        results_file = os.path.join(scratch, "resources", "results", f"results_{language}.json")
+        if not os.path.exists(results_file):
+            results_file = os.path.join(workdir, f"results_{language}.json")
+
+        with open(results_file, 'r') as file:
+            return json.load(file)
+
+
+def adaptive_runs(probe_time: float, budget: float, min_runs: int, max_runs: int) -> int:
+    """Number of runs that fit the per-algorithm time budget"""
+    if probe_time <= 0:
+        return max_runs
+    return max(min_runs, min(max_runs, int(budget / probe_time)))
+
+
+# --- Complexity fitting ---
+
+def fit_exponent(sizes: List[int], times: List[float]) -> Optional[Tuple[float, float]]:
+    """Least-squares fit of time = coefficient * n ** exponent in log-log space"""
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = statistics.mean(x for x, _ in points)
+    mean_y = statistics.mean(y for _, y in points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+
+    exponent = sum((x - mean_x) * (y - mean_y) for x, y in points) / sxx
+    coefficient = math.exp(mean_y - exponent * mean_x)
+    return exponent, coefficient
+
+
+def sweep_language(language: str, algorithms: List[str], sizes: List[int], distribution: str,
+                   perturbation: float, budget: float, min_runs: int, max_runs: int,
+                   time_limit: float) -> Dict:
+    """Run the sweep for one language and return its result set"""
+    points = []
+    active = list(algorithms)
+
+    for size in sizes:
+        if not active:
+            break
+
+        dataset_path = ensure_dataset(size, distribution, perturbation)
+        print(f"[{language}] n={size:,}: probing {len(active)} algorithm(s)")
+
+        probes = {item['algorithm']: item for item in run_benchmark(language, dataset_path, active, 1)}
+
+        # Group algorithms that need the same number of additional runs
+        groups = {}
+        for algorithm in active:
+            probe = probes.get(algorithm)
+            if probe is None:
+                continue
+            runs = adaptive_runs(probe['min_time'], budget, min_runs, max_runs)
+            groups.setdefault(runs, []).append(algorithm)
+
+        for runs, group in sorted(groups.items()):
+            for item in run_benchmark(language, dataset_path, group, runs):
+                item['size'] = size
+                points.append(item)
+
+        # Drop algorithms that have become too slow for the next (larger) size
+        active = [algo for algo in active
+                  if algo in probes and probes[algo]['min_time'] <= time_limit]
+
+    fits = {}
+    for algorithm in algorithms:
+        series = sorted((p['size'], statistics.median(p['times'])) for p in points
+                        if p['algorithm'] == algorithm)
+        fit = fit_exponent([n for n, _ in series], [t for _, t in series])
+        if fit:
+            fits[algorithm] = {'exponent': fit[0], 'coefficient': fit[1]}
+
+    return {
+        'language': language,
+        'distribution': distribution,
+        'perturbation': perturbation,
+        'sizes': sizes,
+        'points': points,
+        'fits': fits
+    }
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark sorting algorithms across a range of input sizes',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s --sizes 1e3:1e5:x2 --algorithms quick_sort,merge_sort
+  %(prog)s --sizes 1000,10000,100000 --languages cpp,python --distribution normal
+  %(prog)s --sizes 1e3:5e5:x4 --algorithms heap_sort --budget 2 --max-runs 20
+        '''
+    )
+
+    parser.add_argument('--sizes', required=True,
+                        help="Sizes as 'start:stop:xFACTOR', 'start:stop:+STEP' or a comma-separated list")
+    parser.add_argument('--algorithms', required=True,
+                        help='Comma-separated list of algorithms to run')
+    parser.add_argument('--languages', default='python',
+                        help='Comma-separated list of languages (default: python)')
+    parser.add_argument('--distribution', default='uniform', choices=DISTRIBUTIONS,
+                        help='Data distribution (default: uniform)')
+    parser.add_argument('--perturbation', type=float, default=1.0,
+                        help='Perturbation level as for the creator, 1.0 = random (default: 1.0)')
+    parser.add_argument('--budget', type=float, default=1.0,
+                        help='Target seconds of measurement per algorithm and size (default: 1.0)')
+    parser.add_argument('--min-runs', type=int, default=3,
+                        help='Minimum runs per algorithm and size (default: 3)')
+    parser.add_argument('--max-runs', type=int, default=50,
+                        help='Maximum runs per algorithm and size (default: 50)')
+    parser.add_argument('--time-limit', type=float, default=10.0,
+                        help='Stop growing an algorithm once one run exceeds this many seconds (default: 10)')
+
+    args = parser.parse_args()
+
+    try:
+        sizes = parse_sizes(args.sizes)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    max_size = max_dataset_size()
+    oversized = [size for size in sizes if max_size and size > max_size]
+    if oversized:
+        print(f"Warning: Skipping sizes above the creator limit of {max_size:,} (install NumPy "
+              f"to lift it): {', '.join(f'{size:,}' for size in oversized)}", file=sys.stderr)
+        sizes = [size for size in sizes if size <= max_size]
+        if not sizes:
+            print("Error: No sizes left to benchmark.", file=sys.stderr)
+            return 1
+
+    if not 0.0 <= args.perturbation <= 1.0:
+        print("Error: Perturbation level must be between 0.0 and 1.0.", file=sys.stderr)
+        return 1
+
+    if args.min_runs < 1 or args.max_runs < args.min_runs:
+        print("Error: Run limits must satisfy 1 <= --min-runs <= --max-runs.", file=sys.stderr)
+        return 1
+
+    languages = [lang.strip() for lang in args.languages.split(',')]
+    for language in languages:
+        if language not in LANGUAGES:
+            print(f"Error: Unknown language: {language}", file=sys.stderr)
+            return 1
+
+    chosen_algorithms = [algo.strip() for algo in args.algorithms.split(',')]
+    try:
+        check_algorithms(languages, chosen_algorithms)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+
+    for language in languages:
+        try:
+            sweep = sweep_language(language, chosen_algorithms, sizes, args.distribution,
+                                   args.perturbation, args.budget, args.min_runs,
+                                   args.max_runs, args.time_limit)
+        except (RuntimeError, ValueError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        results_file = os.path.join(RESULTS_DIR, f"sweep_{language}.json")
+        with open(results_file, 'w') as outfile:
+            json.dump(sweep, outfile, indent=4)
+
+        print(f"\n{language.upper()} empirical complexity (time ~ n^k):")
+        for algorithm, fit in sorted(sweep['fits'].items()):
+            print(f"  {algorithm:<16} k = {fit['exponent']:.2f}")
+        print(f"Sweep results saved to {results_file}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Per-machine tuning of the adaptive algorithms from benchmark results.
+
+Tuned parameters are written to tuning.json next to algorithms.py, which
+loads them at import time.
+"""
+
+import json
+import argparse
+import sys
+import os
+import itertools
+import random
+import time
+from typing import List, Dict, Callable, Tuple
+
+import algorithms
+from algorithms import (AUTO_SORT_MODEL, TUNING_FILE, ALGORITHMS, CONTAINERS, load_tuning,
+                        profile_input, choose_algorithm, read_file, make_container)
+from sweep import RESULTS_DIR, ensure_dataset
+
+
+AUTO_SORT_CANDIDATES = ['counting_sort', 'radix_sort', 'tim_sort', 'quick_sort']
+
+# Values explored for each tunable auto_sort parameter
+AUTO_SORT_GRID = {
+    'presorted_ratio': [0.55, 0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95],
+    'counting_range_factor': [0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 64.0],
+    'radix_digit_cost': [0.5, 1.0, 2.0, 3.0, 4.0, 6.0, 8.0],
+    'max_quick_run': [64, 256, 1024, 4096]
+}
+
+
+# Small-input benchmark of the insertion variants against the O(n log n) sorts
+CROSSOVER_SIZES = [8, 16, 32, 64, 128, 256, 512, 1024, 2048]
+CROSSOVER_ALGORITHMS = ['insertion_sort', 'insertion_sort_fast', 'binary_insertion_sort', 'shell_sort',
+                        'shell_sort_tokuda', 'shell_sort_sedgewick', 'quick_sort', 'merge_sort', 'tim_sort']
+
+# Run lengths tried for tim_sort's insertion sort extension
+INSERTION_THRESHOLDS = [8, 12, 16, 24, 32, 48, 64, 96, 128]
+
+# Leaf sizes tried for quick_sort and merge_sort (up to small_sort.MAX_NETWORK_SIZE)
+LEAF_CUTOFFS = [2, 4, 6, 8, 10, 12, 14, 16]
+
+# Tile sizes tried for blocked_merge_sort
+MERGE_TILE_SIZES = [16, 32, 64, 128, 256, 512, 1024, 2048, 4096]
+
+
+def save_tuning(section: str, values: Dict, file_path: str = TUNING_FILE) -> None:
+    """Store one section of tuning.json, keeping the others"""
+    tuning = load_tuning(file_path)
+    tuning[section] = values
+
+    with open(file_path, 'w') as outfile:
+        json.dump(tuning, outfile, indent=4)
+
+
+# --- auto_sort cost model ---
+
+def auto_sort_observations(matrix: Dict, language: str = 'python') -> List[Dict]:
+    """Pair the input profile of each matrix cell with the candidate timings measured on it"""
+    cells = {}
+    for item in matrix.get('cells', []):
+        if item.get('language') != language or item.get('algorithm') not in AUTO_SORT_CANDIDATES:
+            continue
+        if 'average_time' not in item:
+            continue
+        key = (item['distribution'], item['perturbation'], item['size'])
+        cells.setdefault(key, {})[item['algorithm']] = item['average_time']
+
+    observations = []
+    for (distribution, perturbation, size), times in sorted(cells.items()):
+        if len(times) < 2:
+            continue
+        data = read_file(ensure_dataset(size, distribution, perturbation))
+        observations.append({'profile': profile_input(data), 'times': times})
+
+    return observations
+
+
+def auto_sort_regret(model: Dict, observations: List[Dict]) -> float:
+    """Mean slowdown of the model's choices relative to the fastest measured candidate"""
+    total = 0.0
+
+    for observation in observations:
+        times = observation['times']
+        best = min(times.values())
+        choice = choose_algorithm(observation['profile'], model)
+        # An unmeasured choice is charged as the worst measured candidate
+        total += times.get(choice, max(times.values())) / best
+
+    return total / len(observations)
+
+
+def tune_auto_sort(observations: List[Dict]) -> Dict:
+    """Grid-search the auto_sort thresholds that minimise the mean regret"""
+    names = sorted(AUTO_SORT_GRID)
+    best_model, best_regret = dict(AUTO_SORT_MODEL), auto_sort_regret(AUTO_SORT_MODEL, observations)
+
+    for values in itertools.product(*(AUTO_SORT_GRID[name] for name in names)):
+        model = {**AUTO_SORT_MODEL, **dict(zip(names, values))}
+        regret = auto_sort_regret(model, observations)
+        if regret < best_regret:
+            best_model, best_regret = model, regret
+
+    return best_model
+
+
+# --- Insertion sort crossover ---
+
+def time_sort(function: Callable[[List[int]], None], inputs: List[List[int]], repeats: int,
+              container: str = 'list') -> float:
+    """Best-of-repeats seconds per input to sort fresh copies of the inputs"""
+    best = float('inf')
+
+    for _ in range(repeats):
+        copies = [make_container(values, container) for values in inputs]
+        start_time = time.perf_counter()
+        for values in copies:
+            function(values)
+        best = min(best, time.perf_counter() - start_time)
+
+    return best / len(inputs)
+
+
+def random_inputs(size: int, elements: int, rng: random.Random) -> List[List[int]]:
+    """Random inputs of one size, about `elements` values in total"""
+    return [[rng.randint(1, size) for _ in range(size)]
+            for _ in range(max(1, elements // size))]
+
+
+def crossover_table(sizes: List[int], names: List[str], elements: int,
+                    repeats: int, seed: int = 0) -> Dict[int, Dict[str, float]]:
+    """Seconds per sort of every algorithm at every size"""
+    rng = random.Random(seed)
+    table = {}
+
+    for size in sizes:
+        inputs = random_inputs(size, elements, rng)
+        table[size] = {name: time_sort(ALGORITHMS[name], inputs, repeats) for name in names}
+
+    return table
+
+
+def crossover_points(table: Dict[int, Dict[str, float]], baseline: str = 'insertion_sort') -> Dict[str, int]:
+    """Smallest size from which each algorithm stays faster than the baseline"""
+    sizes = sorted(table)
+    points = {}
+
+    for name in table[sizes[0]]:
+        if name == baseline:
+            continue
+        faster = [table[size][name] < table[size][baseline] for size in sizes]
+        for i, size in enumerate(sizes):
+            if all(faster[i:]):
+                points[name] = size
+                break
+
+    return points
+
+
+def tune_insertion_threshold(size: int, thresholds: List[int], repeats: int,
+                             seed: int = 0) -> Tuple[int, Dict[int, float]]:
+    """Time tim_sort with each insertion threshold and return the fastest"""
+    rng = random.Random(seed)
+    inputs = random_inputs(size, size * 4, rng)
+    original = algorithms.INSERTION_SORT_THRESHOLD
+    times = {}
+
+    try:
+        for threshold in thresholds:
+            algorithms.INSERTION_SORT_THRESHOLD = threshold
+            times[threshold] = time_sort(algorithms.tim_sort, inputs, repeats)
+    finally:
+        algorithms.INSERTION_SORT_THRESHOLD = original
+
+    return min(times, key=times.get), times
+
+
+def tune_leaf_cutoff(size: int, cutoffs: List[int], repeats: int,
+                     seed: int = 0) -> Tuple[int, Dict[int, float]]:
+    """Time quick_sort plus merge_sort with each leaf cutoff and return the fastest"""
+    rng = random.Random(seed)
+    inputs = random_inputs(size, size * 4, rng)
+    original = algorithms.SMALL_SORT_CUTOFF
+    times = {}
+
+    try:
+        for cutoff in cutoffs:
+            algorithms.SMALL_SORT_CUTOFF = cutoff
+            times[cutoff] = (time_sort(algorithms.quick_sort, inputs, repeats) +
+                             time_sort(algorithms.merge_sort, inputs, repeats))
+    finally:
+        algorithms.SMALL_SORT_CUTOFF = original
+
+    return min(times, key=times.get), times
+
+
+# --- Merge tile size ---
+
+def tune_merge_tile(size: int, tile_sizes: List[int], container: str, repeats: int,
+                    seed: int = 0) -> Tuple[int, Dict[int, float]]:
+    """Time blocked_merge_sort with each tile size and return the fastest"""
+    rng = random.Random(seed)
+    inputs = random_inputs(size, size, rng)
+    times = {}
+
+    for tile_size in tile_sizes:
+        times[tile_size] = time_sort(lambda values: algorithms.blocked_merge_sort(values, tile_size),
+                                     inputs, repeats, container)
+
+    return min(times, key=times.get), times
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Tune adaptive sorting parameters for this machine',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  python3 matrix.py --algorithms counting_sort,radix_sort,tim_sort,quick_sort
+  %(prog)s auto
+  %(prog)s auto --matrix results/matrix_results.json --dry-run
+  %(prog)s insertion
+  %(prog)s insertion --size 20000 --dry-run
+  %(prog)s merge-tile --size 1000000 --container numpy
+        '''
+    )
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    auto_parser = subparsers.add_parser('auto', help='Fit the auto_sort cost model to matrix results')
+    auto_parser.add_argument('--matrix', default=os.path.join(RESULTS_DIR, "matrix_results.json"),
+                             help='Matrix result set (default: resources/results/matrix_results.json)')
+    auto_parser.add_argument('--dry-run', action='store_true',
+                             help='Report the tuned model without writing tuning.json')
+
+    insertion_parser = subparsers.add_parser(
+        'insertion', help='Benchmark small-input crossovers and tune the hybrid leaf thresholds')
+    insertion_parser.add_argument('--size', type=int, default=10000,
+                                  help='Input size used to tune the hybrid sorts (default: 10000)')
+    insertion_parser.add_argument('--elements', type=int, default=20000,
+                                  help='Values sorted per crossover measurement (default: 20000)')
+    insertion_parser.add_argument('--repeats', type=int, default=3,
+                                  help='Repetitions; the fastest is kept (default: 3)')
+    insertion_parser.add_argument('--dry-run', action='store_true',
+                                  help='Report the tuned thresholds without writing tuning.json')
+
+    tile_parser = subparsers.add_parser('merge-tile', help='Sweep the tile size of blocked_merge_sort')
+    tile_parser.add_argument('--size', type=int, default=1000000,
+                             help='Input size (default: 1000000)')
+    tile_parser.add_argument('--container', choices=CONTAINERS, default='list',
+                             help='Container holding the data: list, array or numpy (default: list)')
+    tile_parser.add_argument('--tiles', default=','.join(map(str, MERGE_TILE_SIZES)),
+                             help=f"Comma-separated tile sizes (default: {','.join(map(str, MERGE_TILE_SIZES))})")
+    tile_parser.add_argument('--repeats', type=int, default=3,
+                             help='Repetitions; the fastest is kept (default: 3)')
+    tile_parser.add_argument('--dry-run', action='store_true',
+                             help='Report the tuned tile size without writing tuning.json')
+
+    args = parser.parse_args()
+
+    if args.command == 'auto':
+        try:
+            with open(args.matrix, 'r') as file:
+                matrix = json.load(file)
+            observations = auto_sort_observations(matrix)
+        except (IOError, ValueError, RuntimeError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        if not observations:
+            print(f"Error: No Python cells with at least two of {', '.join(AUTO_SORT_CANDIDATES)} "
+                  f"in {args.matrix}", file=sys.stderr)
+            return 1
+
+        before = auto_sort_regret(AUTO_SORT_MODEL, observations)
+        model = tune_auto_sort(observations)
+        after = auto_sort_regret(model, observations)
+
+        print(f"auto_sort mean slowdown vs. best candidate over {len(observations)} cells: "
+              f"{before:.3f}x -> {after:.3f}x")
+        for name in sorted(AUTO_SORT_GRID):
+            print(f"  {name:<22} {AUTO_SORT_MODEL[name]} -> {model[name]}")
+
+        if not args.dry_run:
+            save_tuning('auto_sort', model)
+            print(f"Tuning saved to {TUNING_FILE}")
+
+        return 0
+
+    if args.command == 'insertion':
+        if args.size < 2 or args.elements < 1 or args.repeats < 1:
+            print("Error: --size must be at least 2, --elements and --repeats at least 1.",
+                  file=sys.stderr)
+            return 1
+
+        table = crossover_table(CROSSOVER_SIZES, CROSSOVER_ALGORITHMS, args.elements, args.repeats)
+
+        print("Microseconds per sort on random input (* = fastest):")
+        print(f"{'size':>6}" + "".join(f"{name[:21]:>22}" for name in CROSSOVER_ALGORITHMS))
+        for size in CROSSOVER_SIZES:
+            best = min(table[size], key=table[size].get)
+            print(f"{size:>6}" + "".join(f"{table[size][name] * 1e6:>21.1f}{'*' if name == best else ' '}"
+                                         for name in CROSSOVER_ALGORITHMS))
+
+        print("\nFaster than insertion_sort from:")
+        points = crossover_points(table)
+        for name in CROSSOVER_ALGORITHMS[1:]:
+            crossover = f"n >= {points[name]}" if name in points else "not within the sizes measured"
+            print(f"  {name:<22} {crossover}")
+
+        best, times = tune_insertion_threshold(args.size, INSERTION_THRESHOLDS, args.repeats)
+        print(f"\ntim_sort on {args.size:,} random values by insertion threshold:")
+        for threshold, elapsed in times.items():
+            print(f"  {threshold:>4}  {elapsed * 1e3:8.2f} ms{'  <- best' if threshold == best else ''}")
+
+        cutoff, times = tune_leaf_cutoff(args.size, LEAF_CUTOFFS, args.repeats)
+        print(f"\nquick_sort + merge_sort on {args.size:,} random values by leaf cutoff:")
+        for leaf, elapsed in times.items():
+            print(f"  {leaf:>4}  {elapsed * 1e3:8.2f} ms{'  <- best' if leaf == cutoff else ''}")
+
+        if not args.dry_run:
+            save_tuning('hybrid', {**load_tuning().get('hybrid', {}), 'insertion_threshold': best,
+                                   'small_sort_cutoff': cutoff})
+            print(f"Tuning saved to {TUNING_FILE}")
+
+        return 0
+
+    if args.command == 'merge-tile':
+        try:
+            tile_sizes = sorted({int(tile) for tile in args.tiles.split(',') if tile.strip()})
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        if not tile_sizes or tile_sizes[0] < 2 or args.size < 2 or args.repeats < 1:
+            print("Error: tile sizes and --size must be at least 2, --repeats at least 1.",
+                  file=sys.stderr)
+            return 1
+
+        try:
+            best, times = tune_merge_tile(args.size, tile_sizes, args.container, args.repeats)
+        except ImportError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        print(f"blocked_merge_sort on {args.size:,} random values ({args.container}) by tile size:")
+        for tile_size, elapsed in times.items():
+            print(f"  {tile_size:>6}  {elapsed:8.3f} s{'  <- best' if tile_size == best else ''}")
+
+        if not args.dry_run:
+            save_tuning('hybrid', {**load_tuning().get('hybrid', {}), 'merge_tile_size': best})
+            print(f"Tuning saved to {TUNING_FILE}")
+
+        return 0
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+This file is part of the Python Algorithms project.
+Long-lived benchmark worker listening on a local Unix socket.
+
+A worker keeps the interpreter, the algorithms module and recently used
+datasets loaded between jobs, so repeated benchmarks skip process startup
+and dataset parsing. Jobs are newline-delimited JSON objects; the worker
+answers with the same run / algorithm / summary records that
+`algorithms.py --output-format jsonl` writes, one per line, as they complete.
+"""
+
+import io
+import json
+import argparse
+import sys
+import os
+import socket
+import socketserver
+import subprocess
+import tempfile
+import time
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Callable, MutableSequence, Optional
+
+from algorithms import (ALGORITHMS, SELECTION_ALGORITHMS, DEFAULT_K, CONTAINERS, HARNESS_MODES,
+                        TUNING_FILE, read_file, make_container, run_benchmark, encode_json,
+                        write_record)
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "..", "..", "resources", "results")
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(),
+                              f"sorting_worker_{os.getuid() if hasattr(os, 'getuid') else 0}.sock")
+
+# Number of datasets (per container type) kept in memory between jobs
+DATASET_CACHE_SIZE = 4
+
+# Seconds to wait for a freshly started worker to accept connections
+STARTUP_TIMEOUT = 10.0
+
+# Record types that end the reply to a job
+FINAL_RECORDS = ('summary', 'error', 'pong', 'bye')
+
+
+# --- Worker ---
+
+class DatasetCache:
+    """Parsed datasets keyed by path and container, invalidated when the file changes"""
+
+    def __init__(self, capacity: int = DATASET_CACHE_SIZE):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+
+    def get(self, file_path: str, container: str) -> MutableSequence[int]:
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        key = (file_path, container)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == signature:
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        values = read_file(file_path)
+        if not values:
+            raise ValueError("No data to sort.")
+
+        self.entries[key] = (signature, make_container(values, container))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+        return self.entries[key][1]
+
+
+def validate_job(job: Dict) -> Dict:
+    """Fill in defaults and reject malformed jobs"""
+    if not job.get('file'):
+        raise ValueError("Job is missing 'file'")
+
+    algorithms = job.get('algorithms')
+    if isinstance(algorithms, str):
+        algorithms = [algo.strip() for algo in algorithms.split(',')]
+    if not algorithms:
+        raise ValueError("Job is missing 'algorithms'")
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS and algorithm not in SELECTION_ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    runs = int(job.get('runs', 10))
+    if runs < 1:
+        raise ValueError("Number of runs must be at least 1.")
+
+    k = int(job.get('k', DEFAULT_K))
+    if k < 1:
+        raise ValueError("k must be at least 1.")
+
+    container = job.get('container', 'list')
+    if container not in CONTAINERS:
+        raise ValueError(f"Unknown container: {container}")
+
+    harness = job.get('harness', 'restore')
+    if harness not in HARNESS_MODES:
+        raise ValueError(f"Unknown harness: {harness}")
+
+    return {**job, 'algorithms': algorithms, 'runs': runs, 'k': k, 'container': container,
+            'harness': harness}
+
+
+def run_job(job: Dict, cache: DatasetCache, send: Callable[[Dict], None]) -> None:
+    """Benchmark one job, streaming its records through `send`"""
+    job = validate_job(job)
+    start_time = time.perf_counter()
+    data = cache.get(job['file'], job['container'])
+    load_time = time.perf_counter() - start_time
+
+    def on_record(record: Dict) -> None:
+        if record['type'] == 'algorithm':
+            record = {**record, 'container': job['container']}
+        send(record)
+
+    results = run_benchmark(data, job['algorithms'], job['runs'], job['harness'], on_record,
+                            k=job['k'])
+    for result in results:
+        result['container'] = job['container']
+
+    # Same array format as algorithms.py, so existing consumers keep working
+    if job.get('output'):
+        output = os.path.abspath(job['output'])
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        with open(output, 'w') as outfile:
+            outfile.write(encode_json(results, job.get('compact', False)))
+
+    send({
+        'type': 'summary',
+        'algorithms': [result['algorithm'] for result in results],
+        'runs': job['runs'],
+        'elements': len(data),
+        'container': job['container'],
+        'harness': job['harness'],
+        'load_time': load_time,
+        'total_time': time.perf_counter() - start_time,
+        'output': job.get('output')
+    })
+
+
+class JobHandler(socketserver.StreamRequestHandler):
+    """Serve the jobs of one client connection, one JSON object per line"""
+
+    def handle(self):
+        # write_record expects a text stream
+        writer = io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True)
+
+        def send(record: Dict) -> None:
+            write_record(writer, record)
+
+        for line in self.rfile:
+            try:
+                job = json.loads(line)
+                command = job.get('command', 'run')
+
+                if command == 'ping':
+                    send({'type': 'pong', 'pid': os.getpid(), 'started': self.server.started,
+                          'cached': len(self.server.cache.entries)})
+                elif command == 'shutdown':
+                    send({'type': 'bye'})
+                    self.server.stopping = True
+                    return
+                elif command == 'run':
+                    run_job(job, self.server.cache, send)
+                else:
+                    raise ValueError(f"Unknown command: {command}")
+
+            except BrokenPipeError:
+                return
+            except (ValueError, OSError, ImportError) as e:
+                send({'type': 'error', 'message': str(e)})
+            except Exception as e:
+                # A failing algorithm must not leave the client waiting for a summary
+                send({'type': 'error', 'message': f"{type(e).__name__}: {e}"})
+
+
+class WorkerServer(socketserver.UnixStreamServer):
+    """Single-threaded server, so concurrent jobs never disturb each other's timings"""
+
+    def __init__(self, socket_path: str):
+        self.cache = DatasetCache()
+        self.stopping = False
+        self.started = time.time()
+        # Bind with owner-only permissions; a chmod afterwards would leave a window
+        # in which other users could connect
+        previous_umask = os.umask(0o077)
+        try:
+            super().__init__(socket_path, JobHandler)
+        finally:
+            os.umask(previous_umask)
+
+
+def warm_up() -> None:
+    """Run every algorithm once on a small input so first jobs are not measured cold"""
+    values = list(range(256, 0, -1))
+    for sort_function in ALGORITHMS.values():
+        sort_function(values.copy())
+
+
+def serve(socket_path: str, idle_timeout: float = 0.0) -> int:
+    """Accept jobs until shutdown, or until idle for `idle_timeout` seconds"""
+    if os.path.exists(socket_path):
+        if is_listening(socket_path):
+            print(f"Error: A worker is already listening on {socket_path}", file=sys.stderr)
+            return 1
+        # Left behind by a worker that did not shut down cleanly
+        os.unlink(socket_path)
+
+    warm_up()
+
+    server = WorkerServer(socket_path)
+    server.timeout = idle_timeout or None
+    idle = threading.Event()
+    server.handle_timeout = idle.set
+
+    print(f"Worker {os.getpid()} listening on {socket_path}", flush=True)
+    try:
+        while not server.stopping and not idle.is_set():
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+    return 0
+
+
+# --- Client ---
+
+def request(socket_path: str, job: Dict, on_record: Callable[[Dict], None] = None,
+            timeout: float = None) -> List[Dict]:
+    """Send one job and collect its records until the final summary (or error)"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(socket_path)
+        connection.sendall((json.dumps(job) + "\n").encode())
+
+        records = []
+        with connection.makefile('r') as replies:
+            for line in replies:
+                record = json.loads(line)
+                records.append(record)
+                if on_record:
+                    on_record(record)
+                if record['type'] in FINAL_RECORDS:
+                    break
+
+    if not records or records[-1]['type'] not in FINAL_RECORDS:
+        raise RuntimeError("Worker closed the connection before finishing the job")
+    if records[-1]['type'] == 'error':
+        raise RuntimeError(records[-1]['message'])
+    return records
+
+
+def is_listening(socket_path: str) -> bool:
+    """Check whether a worker accepts connections on the socket (it may be busy with a job)"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+            return True
+        except OSError:
+            return False
+
+
+def ping(socket_path: str) -> Optional[Dict]:
+    """Status of the worker on the socket, or None if it does not answer in time"""
+    try:
+        return request(socket_path, {'command': 'ping'}, timeout=2.0)[-1]
+    except (OSError, ValueError, RuntimeError, IndexError):
+        return None
+
+
+def source_mtime() -> float:
+    """Newest modification time of the code and tuning a worker has loaded"""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    paths = [os.path.join(directory, "algorithms.py"), os.path.abspath(__file__), TUNING_FILE]
+    return max(os.path.getmtime(path) for path in paths if os.path.exists(path))
+
+
+def ensure_worker(socket_path: str = DEFAULT_SOCKET, idle_timeout: float = 600.0) -> None:
+    """Start a background worker unless an up-to-date one is already listening"""
+    if is_listening(socket_path):
+        status = ping(socket_path)
+        # A busy worker does not answer the ping; its job queue is reused as is
+        if status is None or status.get('started', 0) >= source_mtime():
+            return
+
+        # Restart a worker running code older than the sources on disk
+        request(socket_path, {'command': 'shutdown'})
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while os.path.exists(socket_path) and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    subprocess.Popen([sys.executable, os.path.abspath(__file__), "serve",
+                      "--socket", socket_path, "--idle-timeout", str(idle_timeout)],
+                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if is_listening(socket_path):
+            return
+        time.sleep(0.05)
+
+    raise RuntimeError(f"Worker did not start on {socket_path}")
+
+
+def submit(job: Dict, socket_path: str = DEFAULT_SOCKET,
+           on_record: Callable[[Dict], None] = None) -> List[Dict]:
+    """Run a job on the (possibly freshly started) worker and return its algorithm results"""
+    ensure_worker(socket_path)
+    records = request(socket_path, job, on_record)
+    return [record for record in records if record['type'] == 'algorithm']
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Persistent benchmark worker for the Python sorting algorithms',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s serve --idle-timeout 600
+  %(prog)s submit --file ../../resources/sets/dataset.txt --algorithms quick_sort,merge_sort --runs 10
+  %(prog)s stop
+        '''
+    )
+    parser.add_argument('--socket', default=DEFAULT_SOCKET,
+                        help=f'Unix socket path (default: {DEFAULT_SOCKET})')
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    serve_parser = subparsers.add_parser('serve', help='Run the worker in the foreground')
+    serve_parser.add_argument('--socket', default=argparse.SUPPRESS, help='Unix socket path')
+    serve_parser.add_argument('--idle-timeout', type=float, default=0.0,
+                              help='Exit after this many idle seconds (default: never)')
+
+    submit_parser = subparsers.add_parser('submit', help='Run a job, starting a worker if needed')
+    submit_parser.add_argument('--file', required=True, help='Input file containing integers')
+    submit_parser.add_argument('--algorithms', required=True,
+                               help='Comma-separated list of algorithms to run')
+    submit_parser.add_argument('--runs', type=int, default=10,
+                               help='Number of runs for each algorithm (default: 10)')
+    submit_parser.add_argument('--k', type=int, default=DEFAULT_K,
+                               help=f'Number of smallest values the selection algorithms '
+                                    f'select (default: {DEFAULT_K})')
+    submit_parser.add_argument('--container', choices=CONTAINERS, default='list',
+                               help='Container holding the data (default: list)')
+    submit_parser.add_argument('--harness', choices=HARNESS_MODES, default='restore',
+                               help='Input preparation mode (default: restore)')
+    submit_parser.add_argument('--output', default=os.path.join(RESULTS_DIR, "results_python.json"),
+                               help='Results file (default: resources/results/results_python.json)')
+
+    subparsers.add_parser('stop', help='Stop a running worker')
+
+    args = parser.parse_args()
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("Error: Unix sockets are not supported on this platform.", file=sys.stderr)
+        return 1
+
+    if args.command == 'serve':
+        return serve(args.socket, args.idle_timeout)
+
+    if args.command == 'submit':
+        job = {
+            'file': os.path.abspath(args.file),
+            'algorithms': args.algorithms,
+            'runs': args.runs,
+            'k': args.k,
+            'container': args.container,
+            'harness': args.harness,
+            'output': os.path.abspath(args.output)
+        }
+
+        def report(record: Dict) -> None:
+            if record['type'] == 'algorithm':
+                print(f"{record['algorithm']:<16} {record['average_time']:.6f}s average "
+                      f"over {record['runs']} runs")
+
+        try:
+            submit(job, args.socket, report)
+        except (OSError, RuntimeError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        print(f"Sorting completed. Results saved to {args.output}")
+        return 0
+
+    if args.command == 'stop':
+        if not is_listening(args.socket):
+            print(f"No worker listening on {args.socket}")
+            return 0
+        request(args.socket, {'command': 'shutdown'})
+        print("Worker stopped")
+        return 0
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
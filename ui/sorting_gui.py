@@ -4,20 +4,91 @@ Sorting Algorithms Comparison GUI
 A comprehensive Tkinter application for visualizing sorting algorithm performance comparisons.
 """
 
+import time
+
+STARTUP_T0 = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 import os
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import numpy as np
+import argparse
+import threading
 from typing import Dict, List, Any
 import sys
 
+# matplotlib and numpy are imported on first use (see load_plotting_modules)
+Figure = None
+FigureCanvasTkAgg = None
+NavigationToolbar2Tk = None
+np = None
+plotting_lock = threading.Lock()
+
+RESULT_LANGUAGES = ["cpp", "python", "java"]
+
+# Results files are checked for changes (mtime/size) at this interval
+RESULTS_WATCH_INTERVAL_MS = 1000
+
+# Delay used to coalesce bursts of checkbox changes into one redraw
+PLOT_UPDATE_DELAY_MS = 150
+
+# Per-run samples are drawn as raw points only up to this count per record
+RAW_POINTS_THRESHOLD = 200
+MAX_DRAWN_FLIERS = 40
+
+LANGUAGE_COLORS = {'cpp': '#ff7f0e', 'python': '#1f77b4', 'java': '#2ca02c'}
+
+
+def load_plotting_modules():
+    """Import matplotlib and numpy once; safe to call from any thread"""
+    global Figure, FigureCanvasTkAgg, NavigationToolbar2Tk, np
+    
+    with plotting_lock:
+        if Figure is not None:
+            return
+        
+        import numpy
+        from matplotlib.figure import Figure as figure_class
+        from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg as canvas_class,
+                                                       NavigationToolbar2Tk as toolbar_class)
+        
+        np = numpy
+        FigureCanvasTkAgg, NavigationToolbar2Tk = canvas_class, toolbar_class
+        Figure = figure_class
+
+
+def file_signature(path):
+    """(mtime, size) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def read_results_file(path):
+    """Load a results file; JSON Lines streams yield their completed algorithm records"""
+    with open(path, 'r') as f:
+        if not path.endswith('.jsonl'):
+            return json.load(f)
+        
+        records = []
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # The last line of a stream that is still being written may be partial
+                continue
+            if record.get('type') == 'algorithm':
+                records.append(record)
+        return records
+
+
 class SortingComparisonGUI:
-    def __init__(self, root):
+    def __init__(self, root, startup_profile=False):
         self.root = root
+        self.startup_profile = startup_profile
+        self.startup_marks = [("module imported", MODULE_READY - STARTUP_T0)]
         self.root.title("Sorting Algorithms Performance Comparison")
         
         # Get screen dimensions and set responsive window size
@@ -44,6 +115,16 @@ class SortingComparisonGUI:
         
         # Data storage
         self.results_data = {}
+        self.results_index = {}
+        self.sweep_data = {}
+        self.matrix_data = None
+        self.comparison_artists = None
+        self.run_summaries = {}
+        self.pending_update = None
+        self.file_signatures = {}
+        self.pending_signatures = {}
+        self.watch_job = None
+        self.use_python_worker = True
         self.available_algorithms = [
             "bubble_sort",
             "bucket_sort",
@@ -58,11 +139,17 @@ class SortingComparisonGUI:
         
         # Setup UI
         self.setup_ui()
+        self.mark_startup("window created")
+        # Expose only arrives from mainloop once the mapped window is drawn;
+        # idle callbacks already run in main()'s update_idletasks()
+        self.root.bind('<Expose>', self.on_first_expose, add='+')
         
         # Clean up old results on startup
         self.cleanup_old_results()
         
-        self.load_results_data()
+        # Plotting libraries and result files are loaded off the UI thread
+        self.update_status("Loading results...", "blue")
+        self.load_results_async()
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -102,7 +189,7 @@ class SortingComparisonGUI:
             var = tk.BooleanVar(value=True)
             self.language_vars[lang_key] = var
             chk = ttk.Checkbutton(lang_frame, text=display_name, variable=var,
-                                command=self.update_plots)
+                                command=self.schedule_plot_update)
             chk.grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
         
         # Algorithm selection
@@ -129,7 +216,7 @@ class SortingComparisonGUI:
             # Format algorithm name for display
             display_name = algorithm.replace('_', ' ').title()
             chk = ttk.Checkbutton(algo_frame, text=display_name, variable=var,
-                                command=self.update_plots)
+                                command=self.schedule_plot_update)
             
             chk.grid(row=(i//2)+1, column=i%2, sticky=tk.W, padx=5, pady=2)
         
@@ -241,7 +328,7 @@ class SortingComparisonGUI:
         self.perturbation_scale.pack(fill=tk.X, pady=5)
         
         # Add help text for perturbation
-        help_text = ttk.Label(perturbation_frame, text="0.0 = fully sorted, 1.0 = fully random", 
+        help_text = ttk.Label(perturbation_frame, text="0.01 = nearly sorted, 1.0 = fully random\n(0.0 skips the sort, as in the creator)", 
                              font=("Arial", 8), foreground="gray")
         help_text.pack(anchor=tk.W, pady=(0, 5))
         
@@ -260,9 +347,30 @@ class SortingComparisonGUI:
         
         for display_name, value in plot_types:
             rb = ttk.Radiobutton(plot_frame, text=display_name, value=value,
-                               variable=self.plot_type_var, command=self.update_plots)
+                               variable=self.plot_type_var, command=self.schedule_plot_update)
             rb.pack(anchor=tk.W, pady=2)
         
+        # View selection
+        view_frame = ttk.LabelFrame(control_frame, text="View", padding="5")
+        view_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        row += 1
+        
+        self.view_var = tk.StringVar(value="comparison")
+        views = [
+            ("Comparison", "comparison"),
+            ("Scaling Sweep (log-log)", "sweep"),
+            ("Distribution Heatmap", "heatmap")
+        ]
+        
+        for display_name, value in views:
+            rb = ttk.Radiobutton(view_frame, text=display_name, value=value,
+                               variable=self.view_var, command=self.schedule_plot_update)
+            rb.pack(anchor=tk.W, pady=2)
+        
+        self.show_run_distributions_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(view_frame, text="Show run distributions", variable=self.show_run_distributions_var,
+                        command=self.schedule_plot_update).pack(anchor=tk.W, pady=(6, 2))
+        
         # Action buttons
         button_frame = ttk.Frame(control_frame)
         button_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=10)
@@ -281,64 +389,250 @@ class SortingComparisonGUI:
         ttk.Button(button_frame, text="Reload Data", 
                   command=self.load_results_data).pack(fill=tk.X)
         
+        self.watch_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(button_frame, text="Auto-reload results", 
+                        variable=self.watch_var).pack(anchor=tk.W, pady=(5, 0))
+        
         # Status label
         self.status_label = ttk.Label(control_frame, text="Ready", 
                                     foreground="green", font=("Arial", 9, "italic"))
         self.status_label.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=5)
         
     def setup_plot_panel(self, parent):
-        """Setup the right panel for plots"""
-        plot_frame = ttk.LabelFrame(parent, text="Performance Comparison", padding="10")
-        plot_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
+        """Setup the right panel for plots (the canvas is created on first use)"""
+        self.plot_frame = ttk.LabelFrame(parent, text="Performance Comparison", padding="10")
+        self.plot_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        self.fig = None
+        self.canvas = None
+        self.plot_placeholder = ttk.Label(self.plot_frame, text="Loading results and plotting libraries...",
+                                        foreground="gray", font=("Arial", 12, "italic"),
+                                        anchor=tk.CENTER)
+        self.plot_placeholder.pack(fill=tk.BOTH, expand=True)
+        
+    def ensure_plot_canvas(self):
+        """Create the matplotlib figure, canvas and toolbar if not done yet"""
+        if self.canvas is not None:
+            return
+        
+        load_plotting_modules()
+        self.plot_placeholder.destroy()
         
         # Create matplotlib figure
         self.fig = Figure(figsize=(10, 8), dpi=100)
-        self.canvas = FigureCanvasTkAgg(self.fig, plot_frame)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.plot_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Add toolbar
-        toolbar_frame = ttk.Frame(plot_frame)
+        toolbar_frame = ttk.Frame(self.plot_frame)
         toolbar_frame.pack(fill=tk.X, pady=(5, 0))
         
-        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
         self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
         self.toolbar.update()
         
-    def load_results_data(self):
-        """Load results data from JSON files"""
-        self.results_data = {}
-        results_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                                  "resources", "results")
+    def get_results_path(self):
+        """Directory holding the results JSON files"""
+        return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
+                            "resources", "results")
+        
+    def results_files(self):
+        """Map every watched results file to its (kind, language)"""
+        results_path = self.get_results_path()
+        files = {}
+        
+        for lang in RESULT_LANGUAGES:
+            files[os.path.join(results_path, f"results_{lang}.json")] = ('results', lang)
+            # Streamed by algorithms.py --output-format jsonl
+            files[os.path.join(results_path, f"results_{lang}.jsonl")] = ('results', lang)
+        # Scaling sweep results written by sweep.py
+        for lang in RESULT_LANGUAGES:
+            files[os.path.join(results_path, f"sweep_{lang}.json")] = ('sweep', lang)
+        # Distribution x perturbation matrix written by matrix.py
+        files[os.path.join(results_path, "matrix_results.json")] = ('matrix', None)
+        
+        return files
+        
+    def read_results_files(self, paths=None):
+        """Read result files (all, or only `paths`) without touching Tk, so it can run in a worker thread"""
+        loaded = {'results': {}, 'sweep': {}, 'matrix': None, 'messages': [], 
+                  'read': [], 'files': [], 'signatures': {}}
+        messages = loaded['messages']
+        files = self.results_files()
+        wanted = None if paths is None else {files[path] for path in paths}
+        
+        # Group the candidate files of each (kind, language)
+        sources = {}
+        for file_path, source in files.items():
+            if wanted is None or source in wanted:
+                sources.setdefault(source, []).append(file_path)
+        
+        for (kind, lang), candidates in sources.items():
+            # Taken before reading, so a file still being written is picked up again
+            for file_path in candidates:
+                loaded['signatures'][file_path] = file_signature(file_path)
+            loaded['read'].append((kind, lang))
+            
+            existing = [file_path for file_path in candidates if os.path.exists(file_path)]
+            loaded['files'].append(max(existing, key=os.path.getmtime) if existing else candidates[0])
+            if not existing:
+                if kind == 'results':
+                    messages.append((f"Warning: {candidates[0]} not found", "orange"))
+                continue
+            
+            # The most recently written format wins
+            file_path = loaded['files'][-1]
+            
+            try:
+                data = read_results_file(file_path)
+            except Exception as e:
+                name = f"{lang} {kind}" if lang else kind
+                messages.append((f"Error loading {name} data: {str(e)}", "red"))
+                continue
+            
+            if kind == 'results':
+                loaded['results'][lang] = data
+                
+                # Extract available algorithms from this language's data
+                available_algos = [item.get('algorithm') for item in data if item.get('algorithm')]
+                messages.append((f"Loaded {lang}: {len(available_algos)} algorithms", "green"))
+            elif kind == 'sweep':
+                loaded['sweep'][lang] = data
+            else:
+                loaded['matrix'] = data
         
-        languages = ["cpp", "python", "java"]
-        loaded_count = 0
+        return loaded
         
-        for lang in languages:
-            file_path = os.path.join(results_path, f"results_{lang}.json")
-            try:
-                if os.path.exists(file_path):
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        self.results_data[lang] = data
-                        loaded_count += 1
-                    
-                    # Extract available algorithms from this language's data
-                    available_algos = [item.get('algorithm') for item in data if item.get('algorithm')]
-                    self.update_status(f"Loaded {lang}: {len(available_algos)} algorithms", "green")
+    def apply_results(self, loaded, incremental=False):
+        """Merge data returned by read_results_files and refresh the plots"""
+        changed_languages = set()
+        previous_keys = set(self.results_index)
+        
+        for kind, lang in loaded['read']:
+            if kind == 'results':
+                changed_languages.add(lang)
+                if lang in loaded['results']:
+                    self.results_data[lang] = loaded['results'][lang]
                 else:
-                    self.update_status(f"Warning: {file_path} not found", "orange")
-            except Exception as e:
-                self.update_status(f"Error loading {lang} data: {str(e)}", "red")
+                    self.results_data.pop(lang, None)
+            elif kind == 'sweep':
+                if lang in loaded['sweep']:
+                    self.sweep_data[lang] = loaded['sweep'][lang]
+                else:
+                    self.sweep_data.pop(lang, None)
+            else:
+                self.matrix_data = loaded['matrix']
+        
+        self.file_signatures.update(loaded['signatures'])
+        self.build_results_index()
+        
+        # Only series of changed languages are recomputed; the comparison artists
+        # are kept as long as the set of (language, algorithm) records is unchanged
+        self.run_summaries = {key: summary for key, summary in self.run_summaries.items() 
+                              if key[0] not in changed_languages}
+        if set(self.results_index) != previous_keys or not incremental:
+            self.comparison_artists = None
+        
+        if incremental:
+            self.update_available_algorithms()
+            self.update_plots()
+            for message, color in loaded['messages']:
+                if color == "red":
+                    self.update_status(message, color)
+                    return
+            names = sorted(os.path.basename(path) for path in loaded['files'])
+            self.update_status(f"Auto-reloaded {', '.join(names)}", "green")
+            return
         
-        if loaded_count == 0:
+        for message, color in loaded['messages']:
+            self.update_status(message, color)
+        
+        if not self.results_data:
             self.update_status("No result files found! Please check the results directory.", "red")
         else:
             # Update available algorithms based on loaded data
             self.update_available_algorithms()
-            self.update_status(f"Successfully loaded {loaded_count} language(s)", "green")
-                
+            self.update_status(f"Successfully loaded {len(self.results_data)} language(s)", "green")
+        
         self.update_plots()
         
+    def load_results_data(self):
+        """Load results data from JSON files"""
+        self.apply_results(self.read_results_files())
+        
+    def poll_results_files(self):
+        """Re-ingest results files whose modification time or size changed"""
+        self.watch_job = self.root.after(RESULTS_WATCH_INTERVAL_MS, self.poll_results_files)
+        if not self.watch_var.get():
+            self.pending_signatures = {}
+            return
+        
+        current = {path: file_signature(path) for path in self.results_files()}
+        changed = {path for path, signature in current.items() 
+                   if signature != self.file_signatures.get(path)}
+        
+        # Wait until a changed JSON file looks the same on two consecutive polls, so it
+        # is not parsed while a runner is still writing it; JSON Lines streams are
+        # ingested as they grow, since partial lines are skipped
+        settled = {path for path in changed 
+                   if path.endswith('.jsonl') or self.pending_signatures.get(path) == current[path]}
+        self.pending_signatures = {path: current[path] for path in changed - settled}
+        
+        if settled:
+            self.apply_results(self.read_results_files(settled), incremental=True)
+        
+    def start_results_watch(self):
+        """Start polling the results directory for changes"""
+        if self.watch_job is None:
+            self.watch_job = self.root.after(RESULTS_WATCH_INTERVAL_MS, self.poll_results_files)
+        
+    def load_results_async(self):
+        """Import plotting libraries and read results in a worker thread"""
+        outcome = {}
+        
+        def worker():
+            try:
+                load_plotting_modules()
+                self.mark_startup("plotting libraries imported")
+                outcome['loaded'] = self.read_results_files()
+                self.mark_startup("results files parsed")
+            except Exception as e:
+                outcome['error'] = e
+        
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        
+        def poll():
+            if thread.is_alive():
+                self.root.after(50, poll)
+                return
+            if 'error' in outcome:
+                self.update_status(f"Error loading results: {outcome['error']}", "red")
+                return
+            self.apply_results(outcome['loaded'])
+            self.mark_startup("first plot drawn")
+            self.report_startup_profile()
+            self.start_results_watch()
+        
+        self.root.after(50, poll)
+        
+    def on_first_expose(self, event=None):
+        """Record the first paint of the window, once"""
+        self.root.unbind('<Expose>')
+        self.mark_startup("first paint")
+        
+    def mark_startup(self, label):
+        """Record a startup milestone relative to process start"""
+        self.startup_marks.append((label, time.perf_counter() - STARTUP_T0))
+        
+    def report_startup_profile(self):
+        """Print the startup milestones when --startup-profile is given"""
+        if not self.startup_profile:
+            return
+        
+        print("Startup profile (seconds since launch):", file=sys.stderr)
+        for label, elapsed in sorted(self.startup_marks, key=lambda mark: mark[1]):
+            print(f"  {elapsed:8.3f}  {label}", file=sys.stderr)
+        
     def update_available_algorithms(self):
         """Update the list of available algorithms based on loaded data"""
         algorithms_in_data = set()
@@ -440,7 +734,7 @@ Algorithms: {len(selected_algorithms)} selected
 Runs: {num_runs}
 Elements: {num_elements:,}
 Distribution: {selected_distribution_display}
-Perturbation: {perturbation_level:.2f} (0.0=sorted, 1.0=random)
+Perturbation: {perturbation_level:.2f} (0.01=nearly sorted, 1.0 and 0.0=random)
 
 This will execute the benchmark scripts and may take some time.
 """
@@ -466,7 +760,8 @@ This will execute the benchmark scripts and may take some time.
             selected_distribution_display = self.distribution_combo.get()
             selected_distribution = self.distribution_map.get(selected_distribution_display, "uniform")
             
-            dataset_path = self.create_dataset_with_creator(num_elements, perturbation_level, selected_distribution)
+            dataset_path = (self.create_dataset_with_datagen(num_elements, perturbation_level, selected_distribution)
+                            or self.create_dataset_with_creator(num_elements, perturbation_level, selected_distribution))
             if not dataset_path:
                 self.update_status("Failed to create dataset", "red")
                 return
@@ -525,12 +820,25 @@ This will execute the benchmark scripts and may take some time.
                     self.update_status(f"Python script not found: {script_path}", "red")
                     return False
                 
+                # Python runs read the binary copy of the dataset, which needs no parsing
+                shared_path = self.publish_binary_dataset(algo_dir, dataset_path)
+                
+                # Prefer the persistent worker, which keeps the interpreter and dataset loaded
+                if self.use_python_worker:
+                    try:
+                        self.run_python_on_worker(algo_dir, shared_path or dataset_path, algorithms, runs)
+                        return True
+                    except Exception as e:
+                        self.use_python_worker = False
+                        self.update_status(f"Python worker unavailable ({e}), using subprocess", "orange")
+                
                 # Run Python algorithms with correct arguments
                 cmd = [
                     "python3", script_path,
-                    "--file", dataset_path,
+                    *(["--shm", shared_path] if shared_path else ["--file", dataset_path]),
                     "--algorithms", algorithms_str,
-                    "--runs", str(runs)
+                    "--runs", str(runs),
+                    "--quiet"
                 ]
                 
                 result = subprocess.run(cmd, capture_output=True, text=True, cwd=algo_dir)
@@ -638,6 +946,66 @@ This will execute the benchmark scripts and may take some time.
             self.update_status(f"Error running {language} algorithms: {str(e)}", "red")
             return False
     
+    def publish_binary_dataset(self, algo_dir, dataset_path):
+        """Write the dataset once in the binary format next to dataset.txt (None on failure)"""
+        binary_path = os.path.splitext(dataset_path)[0] + ".bin"
+        
+        try:
+            if (os.path.exists(binary_path) and
+                    os.path.getmtime(binary_path) >= os.path.getmtime(dataset_path)):
+                return binary_path
+            
+            if algo_dir not in sys.path:
+                sys.path.insert(0, algo_dir)
+            import dataset_io
+            
+            # Written under a temporary name so a runner never maps a partial file
+            partial_path = binary_path + ".tmp"
+            dataset_io.write_binary(partial_path, dataset_io.read_text(dataset_path))
+            os.replace(partial_path, binary_path)
+            return binary_path
+        except (OSError, ValueError) as e:
+            print(f"Could not publish binary dataset: {e}")
+            return None
+    
+    def run_python_on_worker(self, algo_dir, dataset_path, algorithms, runs):
+        """Run a Python job on the long-lived worker (started on first use)"""
+        if algo_dir not in sys.path:
+            sys.path.insert(0, algo_dir)
+        import worker
+        
+        def progress(record):
+            if record['type'] == 'algorithm':
+                self.update_status(f"PYTHON: {record['algorithm']} done", "orange")
+        
+        worker.submit({
+            'file': os.path.abspath(dataset_path),
+            'algorithms': algorithms,
+            'runs': runs,
+            'output': os.path.join(self.get_results_path(), "results_python.json")
+        }, on_record=progress)
+        
+    def create_dataset_with_datagen(self, num_elements, perturbation_level, distribution_type="uniform"):
+        """Generate the dataset in-process with NumPy (None when unavailable, then the creator is used)"""
+        algo_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "algorithms", "python")
+        creator_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "sets")
+        dataset_path = os.path.join(creator_dir, "dataset.txt")
+        
+        try:
+            if algo_dir not in sys.path:
+                sys.path.insert(0, algo_dir)
+            import datagen
+            
+            values = datagen.generate(num_elements, distribution_type, perturbation_level)
+            
+            # Text for the C++ and Java runners, then the binary copy the Python runs load
+            datagen.write_text(dataset_path, values)
+            datagen.write_binary(os.path.splitext(dataset_path)[0] + ".bin", values)
+            return dataset_path
+        except (ImportError, ValueError, OSError) as e:
+            print(f"In-process dataset generation unavailable: {e}")
+            return None
+    
     def create_dataset_with_creator(self, num_elements, perturbation_level, distribution_type="uniform"):
         """Create a dataset using the creator.cpp program"""
         import subprocess
@@ -705,13 +1073,14 @@ This will execute the benchmark scripts and may take some time.
         cleaned_files = []
         
         for lang in languages:
-            file_path = os.path.join(results_path, f"results_{lang}.json")
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                    cleaned_files.append(f"results_{lang}.json")
-                except Exception as e:
-                    print(f"Warning: Could not remove {file_path}: {e}")
+            for file_name in (f"results_{lang}.json", f"results_{lang}.jsonl"):
+                file_path = os.path.join(results_path, file_name)
+                if os.path.exists(file_path):
+                    try:
+                        os.remove(file_path)
+                        cleaned_files.append(file_name)
+                    except Exception as e:
+                        print(f"Warning: Could not remove {file_path}: {e}")
         
         if cleaned_files:
             self.update_status(f"Cleaned up old results: {', '.join(cleaned_files)}", "blue")
@@ -722,13 +1091,13 @@ This will execute the benchmark scripts and may take some time.
         """Select all algorithms"""
         for var in self.algorithm_vars.values():
             var.set(True)
-        self.update_plots()
+        self.schedule_plot_update()
         
     def deselect_all_algorithms(self):
         """Deselect all algorithms"""
         for var in self.algorithm_vars.values():
             var.set(False)
-        self.update_plots()
+        self.schedule_plot_update()
         
     def update_status(self, message, color="black"):
         """Update status label"""
@@ -743,20 +1112,40 @@ This will execute the benchmark scripts and may take some time.
         """Get list of selected algorithms"""
         return [algo for algo, var in self.algorithm_vars.items() if var.get()]
         
+    def schedule_plot_update(self):
+        """Coalesce bursts of selection changes into a single plot update"""
+        if self.pending_update is not None:
+            self.root.after_cancel(self.pending_update)
+        self.pending_update = self.root.after(PLOT_UPDATE_DELAY_MS, self.update_plots)
+        
+    def build_results_index(self):
+        """Index the loaded records by (language, algorithm)"""
+        self.results_index = {}
+        for lang, lang_data in self.results_data.items():
+            for item in lang_data:
+                if item.get('algorithm'):
+                    self.results_index[(lang, item['algorithm'])] = item
+        
     def update_plots(self):
         """Update the plots based on current selections"""
-        self.fig.clear()
+        if self.pending_update is not None:
+            self.root.after_cancel(self.pending_update)
+            self.pending_update = None
+        self.ensure_plot_canvas()
         
         selected_languages = self.get_selected_languages()
         selected_algorithms = self.get_selected_algorithms()
         plot_type = self.plot_type_var.get()
+        view = self.view_var.get()
         
-        # Create subplots first
-        ax1 = self.fig.add_subplot(2, 1, 1)
-        ax2 = self.fig.add_subplot(2, 1, 2)
+        if view != "comparison" or not selected_languages or not selected_algorithms:
+            self.fig.clear()
+            self.comparison_artists = None
         
         if not selected_languages or not selected_algorithms:
             # Clear plots and show message
+            ax1 = self.fig.add_subplot(2, 1, 1)
+            ax2 = self.fig.add_subplot(2, 1, 2)
             ax1.text(0.5, 0.5, 'Please select at least one language\nand one algorithm', 
                     horizontalalignment='center', verticalalignment='center',
                     transform=ax1.transAxes, fontsize=14, color='red')
@@ -764,175 +1153,385 @@ This will execute the benchmark scripts and may take some time.
                     horizontalalignment='center', verticalalignment='center',
                     transform=ax2.transAxes, fontsize=14, color='red')
             self.update_status("Please select at least one language and algorithm", "red")
-            self.canvas.draw()
+            self.canvas.draw_idle()
+            return
+        
+        if view == "sweep":
+            self.plot_scaling_sweep(selected_languages, selected_algorithms)
+            self.fig.tight_layout()
+            self.canvas.draw_idle()
+            self.update_status("Sweep plots updated successfully", "green")
+            return
+        
+        if view == "heatmap":
+            self.plot_heatmap(selected_languages, selected_algorithms)
+            self.canvas.draw_idle()
+            self.update_status("Heatmap updated successfully", "green")
             return
         
+        # Artists are created once per loaded data set and then updated in place
+        rebuilt = self.comparison_artists is None
+        if rebuilt:
+            self.fig.clear()
+            self.build_comparison_plots()
+        
         # Plot 1: Bar chart comparison
-        self.plot_bar_comparison(ax1, selected_languages, selected_algorithms, plot_type)
+        self.update_bar_comparison(selected_languages, selected_algorithms, plot_type)
         
-        # Plot 2: Detailed algorithm comparison
-        self.plot_algorithm_details(ax2, selected_languages, selected_algorithms, plot_type)
+        # Plot 2: Per-run distributions or detailed algorithm comparison
+        if self.show_run_distributions_var.get():
+            self.update_run_distributions(selected_languages, selected_algorithms)
+        else:
+            self.update_algorithm_details(selected_languages, selected_algorithms, plot_type)
         
-        self.fig.tight_layout()
-        self.canvas.draw()
+        # The layout only needs recomputing when the axes were recreated
+        if rebuilt:
+            self.fig.tight_layout()
+        self.canvas.draw_idle()
         self.update_status("Plots updated successfully", "green")
         
-    def plot_bar_comparison(self, ax, languages, algorithms, metric):
-        """Create bar chart comparison"""
-        # First, find which algorithms actually have data in at least one language
-        available_algorithms = []
-        data_to_plot = {}
+    def build_comparison_plots(self):
+        """Create one bar per (language, algorithm) record and one trend line per language"""
+        ax1 = self.fig.add_subplot(2, 1, 1)
+        ax2 = self.fig.add_subplot(2, 1, 2)
         
-        for lang in languages:
-            if lang not in self.results_data:
-                continue
-            data_to_plot[lang] = []
+        bars = {}
+        for (lang, algo) in self.results_index:
+            bars[(lang, algo)] = ax1.bar(0, 0, 0, label=lang.upper(),
+                                         color=LANGUAGE_COLORS.get(lang, '#9467bd'), alpha=0.8)[0]
+        
+        lines = {}
+        for lang in self.results_data:
+            lines[lang], = ax2.plot([], [], marker='o', linewidth=2, markersize=6, label=lang.upper(),
+                                    color=LANGUAGE_COLORS.get(lang, '#9467bd'), alpha=0.8)
+        
+        messages = []
+        for ax in (ax1, ax2):
+            messages.append(ax.text(0.5, 0.5, '', horizontalalignment='center', 
+                                    verticalalignment='center', transform=ax.transAxes,
+                                    fontsize=12, color='red', visible=False))
+            ax.grid(True, alpha=0.3)
         
-        # Check each algorithm to see if it has data in any language
-        for algo in algorithms:
-            has_data = False
-            for lang in languages:
-                if lang not in self.results_data:
-                    continue
-                    
-                # Find algorithm data
-                algo_data = None
-                for item in self.results_data[lang]:
-                    if item.get('algorithm') == algo:
-                        algo_data = item
-                        break
-                
-                if algo_data and metric in algo_data:
-                    has_data = True
-                    break
-            
-            if has_data:
-                available_algorithms.append(algo)
+        self.comparison_artists = {
+            'bar_axes': ax1,
+            'line_axes': ax2,
+            'bars': bars,
+            'lines': lines,
+            'bar_message': messages[0],
+            'line_message': messages[1],
+            'distribution': []
+        }
+        
+    def show_axes_message(self, ax, message_artist, message):
+        """Replace the content of an axes with a centered message"""
+        message_artist.set_text(message)
+        message_artist.set_visible(True)
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        ax.set_xticks([])
+        
+    def update_bar_comparison(self, languages, algorithms, metric):
+        """Reposition and resize the comparison bars for the current selection"""
+        artists = self.comparison_artists
+        ax = artists['bar_axes']
+        
+        # Only algorithms and languages that have data for this metric get a slot
+        shown_algorithms = [algo for algo in algorithms 
+                            if any(metric in self.results_index.get((lang, algo), {}) for lang in languages)]
+        shown_languages = [lang for lang in languages 
+                           if any(metric in self.results_index.get((lang, algo), {}) for algo in shown_algorithms)]
+        
+        width = 0.8 / len(shown_languages) if shown_languages else 0
+        positions = {algo: i for i, algo in enumerate(shown_algorithms)}
+        offsets = {lang: (i - len(shown_languages)/2 + 0.5) * width for i, lang in enumerate(shown_languages)}
+        handles = {}
+        
+        for (lang, algo), bar in artists['bars'].items():
+            record = self.results_index[(lang, algo)]
+            visible = lang in offsets and algo in positions and metric in record
+            bar.set_visible(visible)
+            if visible:
+                bar.set_x(positions[algo] + offsets[lang] - width / 2)
+                bar.set_width(width)
+                bar.set_height(record[metric])
+                handles.setdefault(lang, bar)
+        
+        if not shown_algorithms or not shown_languages:
+            self.show_axes_message(ax, artists['bar_message'], 
+                                   f'No data available for selected algorithms\nand metric: {metric}')
+            return
+        
+        artists['bar_message'].set_visible(False)
+        ax.set_xlabel('Algorithms')
+        ax.set_ylabel(f'{metric.replace("_", " ").title()} (seconds)')
+        ax.set_title(f'{metric.replace("_", " ").title()} Comparison by Algorithm')
+        ax.set_xticks(range(len(shown_algorithms)))
+        ax.set_xticklabels([algo.replace('_', ' ').title() for algo in shown_algorithms], 
+                           rotation=45, ha='right')
+        ax.set_xlim(-0.5, len(shown_algorithms) - 0.5)
+        ax.relim(visible_only=True)
+        ax.autoscale_view(scalex=False)
+        ax.legend([handles[lang] for lang in shown_languages], [lang.upper() for lang in shown_languages])
+        
+    def update_algorithm_details(self, languages, algorithms, metric):
+        """Update the per-language trend lines for the current selection"""
+        artists = self.comparison_artists
+        ax = artists['line_axes']
+        self.clear_run_distributions()
+        ax.set_yscale('linear')
+        
+        available_algorithms = [algo for algo in algorithms 
+                                if any(metric in self.results_index.get((lang, algo), {}) for lang in languages)]
+        shown = []
+        
+        for lang, line in artists['lines'].items():
+            points = [(i, self.results_index[(lang, algo)][metric]) 
+                      for i, algo in enumerate(available_algorithms)
+                      if metric in self.results_index.get((lang, algo), {})]
+            visible = lang in languages and bool(points)
+            line.set_visible(visible)
+            line.set_data([x for x, _ in points], [y for _, y in points])
+            if visible:
+                shown.append(line)
         
         if not available_algorithms:
-            ax.text(0.5, 0.5, f'No data available for selected algorithms\nand metric: {metric}', 
-                   horizontalalignment='center', verticalalignment='center',
-                   transform=ax.transAxes, fontsize=12, color='red')
+            self.show_axes_message(ax, artists['line_message'], 
+                                   'No data available for\nselected algorithms and metric')
             return
         
-        # Now collect the data for available algorithms
-        labels = []
-        for lang in languages:
-            if lang not in self.results_data:
-                continue
-            data_to_plot[lang] = []
-            
-        for algo in available_algorithms:
-            labels.append(algo.replace('_', ' ').title())
+        artists['line_message'].set_visible(False)
+        ax.set_xlabel('Algorithm Index')
+        ax.set_ylabel(f'{metric.replace("_", " ").title()} (seconds)')
+        ax.set_title(f'{metric.replace("_", " ").title()} Trends')
+        ax.set_xticks(range(len(available_algorithms)))
+        ax.set_xticklabels([algo.replace('_', ' ').title() for algo in available_algorithms], 
+                           rotation=45, ha='right')
+        ax.set_autoscale_on(True)
+        ax.relim(visible_only=True)
+        ax.autoscale_view()
+        ax.legend(handles=shown)
+        
+    def run_summary(self, lang, algo):
+        """Box statistics of the per-run times of one record, computed once per loaded record"""
+        key = (lang, algo)
+        if key not in self.run_summaries:
+            from matplotlib.cbook import boxplot_stats
             
-            for lang in languages:
-                if lang not in self.results_data:
-                    continue
-                    
-                # Find algorithm data
-                algo_data = None
-                for item in self.results_data[lang]:
-                    if item.get('algorithm') == algo:
-                        algo_data = item
-                        break
+            times = np.asarray(self.results_index[key].get('times') or [], dtype=float)
+            summary = None
+            if times.size:
+                summary = boxplot_stats(times)[0]
+                summary['label'] = ''
                 
-                if algo_data and metric in algo_data:
-                    data_to_plot[lang].append(algo_data[metric])
-                else:
-                    data_to_plot[lang].append(0)
-        
-        # Filter out languages with no data
-        data_to_plot = {lang: values for lang, values in data_to_plot.items() if any(values)}
-        
-        if not data_to_plot or not labels:
-            ax.text(0.5, 0.5, 'No valid data to display', 
-                   horizontalalignment='center', verticalalignment='center',
-                   transform=ax.transAxes, fontsize=12, color='red')
+                # Keep only the most extreme outliers so drawing cost stays bounded
+                fliers = np.sort(summary['fliers'])
+                if fliers.size > MAX_DRAWN_FLIERS:
+                    half = MAX_DRAWN_FLIERS // 2
+                    fliers = np.concatenate([fliers[:half], fliers[-half:]])
+                summary['fliers'] = fliers
+                
+                summary['points'] = times if times.size <= RAW_POINTS_THRESHOLD else None
+            self.run_summaries[key] = summary
+        return self.run_summaries[key]
+        
+    def clear_run_distributions(self):
+        """Remove the box and point artists of the previous distribution rendering"""
+        for artist in self.comparison_artists['distribution']:
+            artist.remove()
+        self.comparison_artists['distribution'] = []
+        
+    def update_run_distributions(self, languages, algorithms):
+        """Draw per-run time distributions from cached box statistics"""
+        from matplotlib.collections import LineCollection, PolyCollection
+        
+        artists = self.comparison_artists
+        ax = artists['line_axes']
+        self.clear_run_distributions()
+        for line in artists['lines'].values():
+            line.set_visible(False)
+        
+        summaries = {(lang, algo): self.run_summary(lang, algo) 
+                     for lang in languages for algo in algorithms if (lang, algo) in self.results_index}
+        shown_algorithms = [algo for algo in algorithms 
+                            if any(summaries.get((lang, algo)) is not None for lang in languages)]
+        shown_languages = [lang for lang in languages 
+                           if any(summaries.get((lang, algo)) is not None for algo in shown_algorithms)]
+        
+        if not shown_algorithms:
+            self.show_axes_message(ax, artists['line_message'], 
+                                   'No per-run times available for\nselected algorithms')
             return
         
-        # Create grouped bar chart
-        x = np.arange(len(labels))
-        width = 0.8 / len(data_to_plot)  # Adjust width based on number of languages
-        colors = ['#ff7f0e', '#1f77b4', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
+        artists['line_message'].set_visible(False)
+        width = 0.8 / len(shown_languages)
+        low, high = float('inf'), 0.0
+        handles = []
         
-        for i, (lang, values) in enumerate(data_to_plot.items()):
-            offset = (i - len(data_to_plot)/2 + 0.5) * width
-            ax.bar(x + offset, values, width, label=lang.upper(), 
-                  color=colors[i % len(colors)], alpha=0.8)
-        
-        ax.set_xlabel('Algorithms')
-        ax.set_ylabel(f'{metric.replace("_", " ").title()} (seconds)')
-        ax.set_title(f'{metric.replace("_", " ").title()} Comparison by Algorithm')
-        ax.set_xticks(x)
-        ax.set_xticklabels(labels, rotation=45, ha='right')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        
-    def plot_algorithm_details(self, ax, languages, algorithms, metric):
-        """Create detailed line plot for algorithms"""
-        # Find algorithms that have data
-        available_algorithms = []
-        for algo in algorithms:
-            for lang in languages:
-                if lang not in self.results_data:
+        # A handful of collections per language keeps drawing cost independent of the sample count
+        for lang_idx, lang in enumerate(shown_languages):
+            offset = (lang_idx - len(shown_languages)/2 + 0.5) * width
+            color = LANGUAGE_COLORS.get(lang, '#9467bd')
+            boxes, whiskers, medians, point_x, point_y = [], [], [], [], []
+            
+            for i, algo in enumerate(shown_algorithms):
+                summary = summaries.get((lang, algo))
+                if not summary:
                     continue
-                    
-                # Find algorithm data
-                algo_data = None
-                for item in self.results_data[lang]:
-                    if item.get('algorithm') == algo:
-                        algo_data = item
-                        break
+                x, half = i + offset, width * 0.4
+                
+                boxes.append([(x - half, summary['q1']), (x + half, summary['q1']),
+                              (x + half, summary['q3']), (x - half, summary['q3'])])
+                whiskers.extend([[(x, summary['whislo']), (x, summary['q1'])],
+                                 [(x, summary['q3']), (x, summary['whishi'])],
+                                 [(x - half / 2, summary['whislo']), (x + half / 2, summary['whislo'])],
+                                 [(x - half / 2, summary['whishi']), (x + half / 2, summary['whishi'])]])
+                medians.append([(x - half, summary['med']), (x + half, summary['med'])])
+                
+                if summary['points'] is not None:
+                    # Raw samples, spread horizontally over the box width
+                    point_x.append(x + np.linspace(-half, half, len(summary['points'])))
+                    point_y.append(summary['points'])
+                else:
+                    point_x.append(np.full(len(summary['fliers']), x))
+                    point_y.append(summary['fliers'])
                 
-                if algo_data and metric in algo_data:
-                    available_algorithms.append(algo)
-                    break
+                low, high = min(low, summary['whislo']), max(high, summary['whishi'])
+                if len(point_y[-1]):
+                    low, high = min(low, point_y[-1].min()), max(high, point_y[-1].max())
+            
+            box_collection = PolyCollection(boxes, facecolors=color, edgecolors='black', 
+                                            linewidths=0.8, alpha=0.6)
+            collections = [box_collection,
+                           LineCollection(whiskers, colors='black', linewidths=0.8),
+                           LineCollection(medians, colors='black', linewidths=1.5)]
+            for collection in collections:
+                ax.add_collection(collection, autolim=False)
+            
+            point_x, point_y = np.concatenate(point_x), np.concatenate(point_y)
+            if point_x.size:
+                collections.append(ax.scatter(point_x, point_y, s=6, color=color, alpha=0.4, zorder=3))
+            
+            artists['distribution'].extend(collections)
+            handles.append(box_collection)
         
-        if not available_algorithms:
-            ax.text(0.5, 0.5, f'No data available for\nselected algorithms and metric', 
+        ax.set_yscale('log')
+        ax.set_xlabel('Algorithms')
+        ax.set_ylabel('Time per Run (seconds)')
+        ax.set_title('Run Time Distribution')
+        ax.set_xticks(range(len(shown_algorithms)))
+        ax.set_xticklabels([algo.replace('_', ' ').title() for algo in shown_algorithms], 
+                           rotation=45, ha='right')
+        ax.set_xlim(-0.5, len(shown_algorithms) - 0.5)
+        if low > 0:
+            ax.set_ylim(low / 1.5, high * 1.5)
+        ax.legend(handles, [lang.upper() for lang in shown_languages], loc='upper left')
+        
+    def plot_scaling_sweep(self, languages, algorithms):
+        """Create log-log time-vs-size curves, one subplot per language"""
+        sweep_languages = [lang for lang in languages if lang in self.sweep_data]
+        
+        if not sweep_languages:
+            ax = self.fig.add_subplot(1, 1, 1)
+            ax.text(0.5, 0.5, 'No sweep results found\nRun algorithms/python/sweep.py first', 
                    horizontalalignment='center', verticalalignment='center',
                    transform=ax.transAxes, fontsize=12, color='red')
             return
         
-        colors = ['#ff7f0e', '#1f77b4', '#2ca02c', '#d62728', '#9467bd']
+        colors = ['#ff7f0e', '#1f77b4', '#2ca02c', '#d62728', '#9467bd', '#8c564b',
+                  '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
         
-        for lang_idx, lang in enumerate(languages):
-            if lang not in self.results_data:
-                continue
+        for lang_idx, lang in enumerate(sweep_languages):
+            ax = self.fig.add_subplot(len(sweep_languages), 1, lang_idx + 1)
+            sweep = self.sweep_data[lang]
+            fits = sweep.get('fits', {})
+            plotted = 0
+            
+            for algo_idx, algo in enumerate(algorithms):
+                series = sorted((point['size'], float(np.median(point['times'])))
+                                for point in sweep.get('points', [])
+                                if point.get('algorithm') == algo and point.get('times'))
+                if not series:
+                    continue
                 
-            x_values = []
-            y_values = []
-            
-            for i, algo in enumerate(available_algorithms):
-                # Find algorithm data
-                algo_data = None
-                for item in self.results_data[lang]:
-                    if item.get('algorithm') == algo:
-                        algo_data = item
-                        break
+                label = algo.replace('_', ' ').title()
+                if algo in fits:
+                    label += f" (n^{fits[algo]['exponent']:.2f})"
                 
-                if algo_data and metric in algo_data:
-                    x_values.append(i)
-                    y_values.append(algo_data[metric])
-            
-            if x_values and y_values:
-                ax.plot(x_values, y_values, marker='o', linewidth=2, 
-                       markersize=6, label=f'{lang.upper()}', 
-                       color=colors[lang_idx % len(colors)], alpha=0.8)
-        
-        if available_algorithms:
-            ax.set_xlabel('Algorithm Index')
-            ax.set_ylabel(f'{metric.replace("_", " ").title()} (seconds)')
-            ax.set_title(f'{metric.replace("_", " ").title()} Trends')
-            ax.set_xticks(range(len(available_algorithms)))
-            ax.set_xticklabels([algo.replace('_', ' ').title() for algo in available_algorithms], 
-                              rotation=45, ha='right')
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-        else:
-            ax.text(0.5, 0.5, 'No data to display', 
+                ax.loglog([n for n, _ in series], [t for _, t in series], marker='o',
+                         linewidth=2, markersize=4, label=label,
+                         color=colors[algo_idx % len(colors)], alpha=0.8)
+                plotted += 1
+            
+            ax.set_xlabel('Number of Elements (n)')
+            ax.set_ylabel('Median Time (seconds)')
+            ax.set_title(f"{lang.upper()} Scaling ({sweep.get('distribution', 'uniform')}, "
+                        f"perturbation {sweep.get('perturbation', 1.0):.2f})")
+            ax.grid(True, which='both', alpha=0.3)
+            
+            if plotted:
+                ax.legend(fontsize=8)
+            else:
+                ax.text(0.5, 0.5, 'No sweep data for selected algorithms', 
+                       horizontalalignment='center', verticalalignment='center',
+                       transform=ax.transAxes, fontsize=12, color='red')
+        
+    def plot_heatmap(self, languages, algorithms):
+        """Create one distribution x perturbation heatmap of relative time per algorithm"""
+        from matplotlib.colors import LogNorm
+        
+        matrix = self.matrix_data or {}
+        cells = [cell for cell in matrix.get('cells', []) if 'relative_time' in cell]
+        language = next((lang for lang in languages 
+                         if any(cell['language'] == lang for cell in cells)), None)
+        algos = [algo for algo in algorithms 
+                 if any(cell['algorithm'] == algo for cell in cells)]
+        
+        if language is None or not algos:
+            ax = self.fig.add_subplot(1, 1, 1)
+            ax.text(0.5, 0.5, 'No matrix results for the selection\nRun algorithms/python/matrix.py first', 
                    horizontalalignment='center', verticalalignment='center',
                    transform=ax.transAxes, fontsize=12, color='red')
+            return
+        
+        # Show the largest benchmarked size of the selected language
+        size = max(cell['size'] for cell in cells if cell['language'] == language)
+        distributions = matrix.get('distributions', [])
+        perturbations = matrix.get('perturbations', [])
+        lookup = {(cell['algorithm'], cell['distribution'], cell['perturbation']): cell['relative_time']
+                  for cell in cells if cell['language'] == language and cell['size'] == size}
+        
+        values = {algo: np.array([[lookup.get((algo, d, p), np.nan) for p in perturbations]
+                                  for d in distributions]) for algo in algos}
+        vmax = max([float(np.nanmax(v)) for v in values.values() if not np.all(np.isnan(v))] + [1.0])
+        norm = LogNorm(vmin=1.0, vmax=max(vmax, 1.0 + 1e-9))
+        
+        ncols = int(np.ceil(np.sqrt(len(algos))))
+        nrows = int(np.ceil(len(algos) / ncols))
+        image = None
+        
+        for index, algo in enumerate(algos):
+            ax = self.fig.add_subplot(nrows, ncols, index + 1)
+            image = ax.imshow(values[algo], cmap='RdYlGn_r', norm=norm, aspect='auto')
+            
+            for row in range(len(distributions)):
+                for col in range(len(perturbations)):
+                    value = values[algo][row, col]
+                    if not np.isnan(value):
+                        ax.text(col, row, f"{value:.1f}x", ha='center', va='center', fontsize=7)
+            
+            ax.set_title(algo.replace('_', ' ').title(), fontsize=10)
+            ax.set_xticks(range(len(perturbations)))
+            ax.set_xticklabels([f"{p:.2f}" for p in perturbations], fontsize=7)
+            ax.set_yticks(range(len(distributions)))
+            ax.set_yticklabels(distributions, fontsize=7)
+            ax.set_xlabel('Perturbation', fontsize=8)
+        
+        self.fig.suptitle(f"{language.upper()} time relative to fastest algorithm per cell (n={size:,})")
+        self.fig.tight_layout(rect=(0, 0, 0.9, 0.95))
+        if image is not None:
+            colorbar_ax = self.fig.add_axes([0.92, 0.15, 0.02, 0.7])
+            self.fig.colorbar(image, cax=colorbar_ax, label='Relative time (1.0 = fastest)')
         
     def export_plot(self):
         """Export current plot to file"""
@@ -943,6 +1542,9 @@ This will execute the benchmark scripts and may take some time.
         )
         
         if file_path:
+            if self.fig is None:
+                self.update_status("Nothing to export yet", "orange")
+                return
             try:
                 self.fig.savefig(file_path, dpi=300, bbox_inches='tight')
                 self.update_status(f"Plot exported to {file_path}", "green")
@@ -950,8 +1552,16 @@ This will execute the benchmark scripts and may take some time.
                 self.update_status(f"Error exporting plot: {str(e)}", "red")
                 messagebox.showerror("Export Error", f"Failed to export plot:\n{str(e)}")
 
+MODULE_READY = time.perf_counter()
+
+
 def main():
     """Main function to run the GUI"""
+    parser = argparse.ArgumentParser(description='Sorting algorithms performance comparison GUI')
+    parser.add_argument('--startup-profile', action='store_true',
+                        help='Print startup timing milestones to stderr')
+    args = parser.parse_args()
+    
     root = tk.Tk()
     
     # Configure styles
@@ -966,7 +1576,7 @@ def main():
         # If accent style fails, just use default
         pass
     
-    app = SortingComparisonGUI(root)
+    app = SortingComparisonGUI(root, startup_profile=args.startup_profile)
     
     # Center the window
     root.update_idletasks()